@@ -0,0 +1,233 @@
+import asyncio
+import hashlib
+import json
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+from aiohttp import web
+from utils.subscription_sync import subscription_checksum
+
+
+class FakeDataServer:
+    """utils/*_api.py가 사용하는 데이터 서버 엔드포인트를 흉내 내는 로컬 서버.
+
+    boards개의 게시판과 subscribers명의 구독자(DM 절반, 서버 채널 절반)를 만들고,
+    publish()를 호출할 때마다 게시판마다 새 공지를 추가합니다.
+    """
+
+    def __init__(
+        self,
+        boards: int,
+        subscribers: int,
+        boards_per_subscriber: int = 3,
+        latency: float = 0.0,
+        batch_supported: bool = True,
+        delta_supported: bool = True,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.batch_supported = batch_supported
+        self.delta_supported = delta_supported
+        self.request_counts = Counter()
+        self.response_bytes = Counter()
+        self.runner: web.AppRunner = None
+        self.port = None
+
+        rng = random.Random(seed)
+        self.board_names = [f"BOARD_{i:03d}" for i in range(boards)]
+        self.categories = [
+            {
+                "name": f"CATEGORY_{i}",
+                "korean_name": f"카테고리 {i}",
+                "scraper_type_names": self.board_names[i::5],
+            }
+            for i in range(min(5, boards))
+        ]
+        self.scraper_types = [
+            {
+                "korean_name": f"게시판 {name}",
+                "collection_name": name.lower(),
+                "type_name": name,
+            }
+            for name in self.board_names
+        ]
+
+        # 공지는 게시판별로 최신순으로 보관
+        self.started_at = datetime(2025, 3, 1, 9, 0, 0)
+        self.notices = {
+            scraper_type["collection_name"]: [] for scraper_type in self.scraper_types
+        }
+        self.publish(1)
+
+        self.direct_messages = []
+        self.server_channels = []
+        collection_names = list(self.notices)
+        for i in range(subscribers):
+            updated_at = (self.started_at + timedelta(seconds=i)).isoformat()
+            scrapers = rng.sample(
+                collection_names, min(boards_per_subscriber, len(collection_names))
+            )
+            if i % 2 == 0:
+                self.direct_messages.append(
+                    {
+                        "_id": str(10**17 + i),
+                        "user_name": f"user{i}",
+                        "scrapers": scrapers,
+                        "updated_at": updated_at,
+                    }
+                )
+            else:
+                self.server_channels.append(
+                    {
+                        "_id": str(2 * 10**17 + i),
+                        "guild_name": "bench-guild",
+                        "channel_name": f"channel{i}",
+                        "scrapers": scrapers,
+                        "updated_at": updated_at,
+                    }
+                )
+
+    def publish(self, count: int):
+        """모든 게시판에 새 공지를 count개씩 추가합니다."""
+        for collection_name, notices in self.notices.items():
+            for _ in range(count):
+                number = len(notices)
+                notices.insert(
+                    0,
+                    {
+                        "title": f"{collection_name} 공지 {number}",
+                        "link": f"https://example.com/{collection_name}/{number}",
+                        "published": (
+                            self.started_at + timedelta(hours=number)
+                        ).isoformat(),
+                    },
+                )
+
+    def _new_notices(self, collection_name: str, last_notice_link: str) -> list:
+        result = []
+        for notice in self.notices.get(collection_name, []):
+            if notice["link"] == last_notice_link:
+                break
+            result.append(notice)
+        return result
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        key = f"{request.method} {request.path}"
+        self.request_counts[key] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        response = await handler(request)
+        self.response_bytes[key] += len(getattr(response, "body", None) or b"")
+        return response
+
+    def _json(self, request: web.Request, data) -> web.Response:
+        """ETag를 붙여 응답하고, If-None-Match가 같으면 304를 반환합니다."""
+        body = json.dumps(data, ensure_ascii=False).encode()
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            body=body, content_type="application/json", headers={"ETag": etag}
+        )
+
+    def _subscriptions(self, request: web.Request, records: list) -> web.Response:
+        """updated_since가 있으면 그 이후 바뀐 레코드만 변경분 형식으로 응답합니다."""
+        since = request.query.get("updated_since")
+        if since is None or not self.delta_supported:
+            return web.json_response(records)
+        return web.json_response(
+            {
+                "changes": [record for record in records if record["updated_at"] >= since],
+                "deleted": [],
+                "watermark": max((record["updated_at"] for record in records), default=since),
+                "checksum": subscription_checksum(records),
+            }
+        )
+
+    def _find(self, records: list, record_id: str):
+        return next((record for record in records if record["_id"] == record_id), None)
+
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        routes = web.RouteTableDef()
+
+        @routes.get("/connect-check")
+        async def connect_check(request):
+            return web.json_response({"status": "ok"})
+
+        @routes.get("/scraper/categories")
+        async def categories(request):
+            return self._json(request, self.categories)
+
+        @routes.get("/scraper/types")
+        async def scraper_types(request):
+            return self._json(request, self.scraper_types)
+
+        @routes.get("/notices/all")
+        async def all_notices(request):
+            notices = self.notices.get(request.query.get("notice_type"), [])
+            return web.json_response(notices[: int(request.query.get("list_size", 10))])
+
+        @routes.get("/notices/new")
+        async def new_notices(request):
+            return web.json_response(
+                self._new_notices(
+                    request.query.get("notice_type"),
+                    request.query.get("last_notice_link"),
+                )
+            )
+
+        @routes.post("/notices/new/batch")
+        async def new_notices_batch(request):
+            if not self.batch_supported:
+                raise web.HTTPNotFound()
+            last_notice_links = (await request.json())["last_notice_links"]
+            return web.json_response(
+                {
+                    collection_name: self._new_notices(collection_name, link)
+                    for collection_name, link in last_notice_links.items()
+                }
+            )
+
+        @routes.get("/discord/direct-messages")
+        async def direct_messages(request):
+            return self._subscriptions(request, self.direct_messages)
+
+        @routes.get("/discord/server-channels")
+        async def server_channels(request):
+            return self._subscriptions(request, self.server_channels)
+
+        @routes.get("/discord/direct-message")
+        async def direct_message(request):
+            record = self._find(self.direct_messages, request.query.get("user_id"))
+            if record is None:
+                raise web.HTTPNotFound()
+            return web.json_response(record)
+
+        @routes.get("/discord/server-channel")
+        async def server_channel(request):
+            record = self._find(self.server_channels, request.query.get("channel_id"))
+            if record is None:
+                raise web.HTTPNotFound()
+            return web.json_response(record)
+
+        app.add_routes(routes)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버를 시작하고 DATA_SERVER_URL 형식의 주소(host:port)를 반환합니다."""
+        self.runner = web.AppRunner(self.build_app(), access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return f"{host}:{self.port}"
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+
+    def reset_counts(self):
+        self.request_counts.clear()
+        self.response_bytes.clear()
@@ -0,0 +1,130 @@
+import asyncio
+import discord
+from discord_bot.scraper_config import ScraperConfig
+from discord_bot.broadcaster import NoticeBroadcaster
+
+
+class _AllowAll:
+    send_messages = True
+    embed_links = True
+
+
+class FakeGuild:
+    def __init__(self, name: str):
+        self.id = 1
+        self.name = name
+        self.me = object()
+
+
+class FakeTextChannel:
+    """서버 채널 대역. 전송 시 지연 시간만큼 기다린 뒤 전송 횟수를 기록합니다."""
+
+    def __init__(self, bot: "FakeNoticeBot", channel_id: int, guild: FakeGuild):
+        self.bot = bot
+        self.id = channel_id
+        self.name = f"channel-{channel_id}"
+        self.guild = guild
+
+    def permissions_for(self, member):
+        self.bot.permission_checks += 1
+        return _AllowAll()
+
+    async def send(self, *args, **kwargs):
+        await self.bot.simulate_send(self.id, kwargs)
+
+
+class FakeDMChannel(discord.DMChannel):
+    """DM 채널 대역. 브로드캐스터의 isinstance(..., discord.DMChannel) 검사를 통과합니다."""
+
+    def __init__(self, bot: "FakeNoticeBot", user_id: int):
+        self.bot = bot
+        self.id = user_id
+
+    async def send(self, *args, **kwargs):
+        await self.bot.simulate_send(self.id, kwargs)
+
+
+class FakePartialMessageable:
+    """get_partial_messageable로 만든 채널 대역. 조회 없이 채널 ID만으로 전송합니다."""
+
+    def __init__(self, bot: "FakeNoticeBot", channel_id: int):
+        self.bot = bot
+        self.id = channel_id
+
+    async def send(self, *args, **kwargs):
+        await self.bot.simulate_send(self.id, kwargs)
+
+
+class FakeUser:
+    def __init__(self, bot: "FakeNoticeBot", user_id: int):
+        self.bot = bot
+        self.id = user_id
+        self.name = f"user-{user_id}"
+        self.discriminator = "0"
+        self.dm_channel = None
+
+    async def create_dm(self):
+        await asyncio.sleep(self.bot.api_latency)
+        self.bot.api_calls["create_dm"] += 1
+        self.dm_channel = FakeDMChannel(self.bot, self.id)
+        return self.dm_channel
+
+
+class FakeNoticeBot:
+    """NoticeBot의 채널 계층만 흉내 내는 대역.
+
+    게이트웨이에 연결하지 않고 get_channel / fetch_user / send 호출을
+    지정한 지연 시간으로 처리하며 호출 횟수를 집계합니다.
+    scraper_config와 broadcaster는 실제 구현을 그대로 사용합니다.
+    """
+
+    def __init__(self, server_channel_ids: list[str], api_latency: float = 0.02):
+        self.api_latency = api_latency
+        self.api_calls = {"fetch_user": 0, "create_dm": 0, "send": 0}
+        self.sent_messages = 0
+        self.sent_embeds = 0
+        self.permission_checks = 0
+        guild = FakeGuild("bench-guild")
+        self.channels = {
+            int(channel_id): FakeTextChannel(self, int(channel_id), guild)
+            for channel_id in server_channel_ids
+        }
+        self.users = {}
+        self.scraper_config = ScraperConfig()
+        self.broadcaster = NoticeBroadcaster(self)
+        self.delivery_worker = None
+
+    async def wait_until_ready(self):
+        return
+
+    def is_ready(self) -> bool:
+        return True
+
+    def get_channel(self, channel_id: int):
+        return self.channels.get(channel_id)
+
+    def get_partial_messageable(self, channel_id: int, *, type=None):
+        return FakePartialMessageable(self, channel_id)
+
+    async def fetch_user(self, user_id: int):
+        await asyncio.sleep(self.api_latency)
+        self.api_calls["fetch_user"] += 1
+        if user_id not in self.users:
+            self.users[user_id] = FakeUser(self, user_id)
+        return self.users[user_id]
+
+    async def simulate_send(self, channel_id: int, kwargs: dict):
+        await asyncio.sleep(self.api_latency)
+        self.api_calls["send"] += 1
+        # discord.py처럼 전송할 때마다 임베드를 직렬화
+        embeds = kwargs.get("embeds") or [kwargs.get("embed")]
+        [embed.to_dict() for embed in embeds]
+        self.sent_messages += 1
+        self.sent_embeds += len(embeds)
+
+    def reset_counts(self):
+        for name in self.api_calls:
+            self.api_calls[name] = 0
+        self.sent_messages = 0
+        self.sent_embeds = 0
+        self.permission_checks = 0
@@ -0,0 +1,199 @@
+"""공지 모델(template/notice_data.py)을 만드는 비용을 틱 단위로 측정합니다.
+
+데이터 서버의 배치 응답(게시판 N개 × 새 공지 K개)을 받아 공지 목록으로 바꾸고,
+틱이 하는 일(마지막 공지 cursor 갱신, outbox에 넣을 JSON 직렬화)까지 수행하는 동안
+새로 할당된 메모리(tracemalloc)와 시간을, 이전 방식(dataclass + 작성일 즉시 파싱 +
+collection_name 문자열)과 현재 방식(__slots__ + 작성일 지연 파싱 + 공유 ScraperType)으로 비교합니다.
+
+    uv run python -m benchmark.notice_model_benchmark --boards 60 --notices 10
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="공지 모델 틱당 할당 벤치마크")
+    parser.add_argument("--boards", type=int, default=60, help="게시판 수 (N)")
+    parser.add_argument("--notices", type=int, default=10, help="틱당 게시판별 공지 수 (K)")
+    parser.add_argument("--ticks", type=int, default=50, help="측정할 틱 수")
+    parser.add_argument(
+        "--held", type=int, default=100000, help="메모리에 유지하는 공지 수 (인스턴스 크기 비교용)"
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args()
+
+
+@dataclass
+class LegacyNoticeData:
+    """비교용: 이전 NoticeData (일반 dataclass)"""
+
+    title: str
+    link: str
+    published: datetime
+    scraper_type: object
+
+
+def legacy_notice_list(response: list, notice_type: str) -> list:
+    return [
+        LegacyNoticeData(
+            title=item["title"],
+            link=item["link"],
+            published=datetime.fromisoformat(item["published"]),
+            scraper_type=notice_type,
+        )
+        for item in response
+    ]
+
+
+def make_body(boards: int, notices: int) -> bytes:
+    """배치 엔드포인트 응답 본문 {collection_name: [공지...]}"""
+    started_at = datetime(2025, 3, 1, 9, 0, 0)
+    return json.dumps(
+        {
+            f"board_{board:03d}": [
+                {
+                    "title": f"board_{board:03d} 공지 {number}",
+                    "link": f"https://example.com/board_{board:03d}/{number}",
+                    "published": (started_at + timedelta(hours=number)).isoformat(),
+                }
+                for number in range(notices)
+            ]
+            for board in range(boards)
+        },
+        ensure_ascii=False,
+    ).encode()
+
+
+def tick(body: bytes, to_notice_list, published_text) -> list:
+    """틱 하나: 응답을 공지 목록으로 바꾸고 cursor와 outbox에 쓸 값을 만듭니다."""
+    response = json.loads(body)
+    cursors, payloads = {}, []
+    for collection_name, items in response.items():
+        notices = to_notice_list(items, collection_name)
+        cursors[collection_name] = (notices[0].link, published_text(notices[0]))
+        for notice in notices:
+            payloads.append(
+                json.dumps(
+                    {
+                        "title": notice.title,
+                        "link": notice.link,
+                        "published": published_text(notice),
+                    },
+                    ensure_ascii=False,
+                )
+            )
+    return [cursors, payloads]
+
+
+def measure_ticks(body: bytes, ticks: int, to_notice_list, published_text) -> dict:
+    """틱마다 (공지 목록으로 바꾸는 데 할당된 메모리, 틱 전체에서 새로 할당된 메모리 최댓값,
+    걸린 시간)을 측정합니다."""
+    response = json.loads(body)
+    converted, allocated, latencies = [], [], []
+    for _ in range(ticks):
+        gc.collect()
+        tracemalloc.start()
+        notices = [to_notice_list(items, name) for name, items in response.items()]
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        converted.append(memory)
+        del notices
+
+        gc.collect()
+        tracemalloc.start()
+        started_at = time.perf_counter()
+        tick(body, to_notice_list, published_text)
+        latencies.append((time.perf_counter() - started_at) * 1000)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        allocated.append(peak)
+    return {
+        "notices_kb": round(statistics.median(converted) / 1024, 1),
+        "peak_kb": round(statistics.median(allocated) / 1024, 1),
+        "p50_ms": round(statistics.median(latencies), 3),
+    }
+
+
+def measure_held(count: int, to_notice_list) -> float:
+    """공지 count개를 메모리에 유지할 때 공지 하나당 바이트 수"""
+    items = json.loads(make_body(1, count))["board_000"]
+    gc.collect()
+    tracemalloc.start()
+    notices = to_notice_list(items, "board_000")
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del notices
+    return round(memory / count, 1)
+
+
+def run(args) -> dict:
+    from template.scraper_type import ScraperType
+    from template.scraper_type_list import MetaData
+    from utils.scraper_data_api import _to_notice_list
+
+    MetaData.update(
+        [],
+        [
+            ScraperType(f"게시판 {board}", f"board_{board:03d}", f"BOARD_{board:03d}")
+            for board in range(args.boards)
+        ],
+    )
+    body = make_body(args.boards, args.notices)
+
+    results = {}
+    for label, to_notice_list, published_text in (
+        ("legacy", legacy_notice_list, lambda notice: notice.published.isoformat()),
+        ("slots", _to_notice_list, lambda notice: notice.published_text),
+    ):
+        measure_ticks(body, 3, to_notice_list, published_text)  # 워밍업
+        results[label] = measure_ticks(body, args.ticks, to_notice_list, published_text)
+        results[label]["held_bytes_per_notice"] = measure_held(args.held, to_notice_list)
+
+    return {
+        "params": {"boards": args.boards, "notices": args.notices, "ticks": args.ticks},
+        "results": results,
+    }
+
+
+def print_report(result: dict):
+    params = result["params"]
+    print(f"\n게시판 {params['boards']}개 × 틱당 공지 {params['notices']}개, {params['ticks']}틱")
+    print(
+        f"{'model':>8} {'notices(kB)':>12} {'tick peak(kB)':>14} {'tick p50(ms)':>13} "
+        f"{'held(B/notice)':>15}"
+    )
+    for label, item in result["results"].items():
+        print(
+            f"{label:>8} {item['notices_kb']:>12.1f} {item['peak_kb']:>14.1f} "
+            f"{item['p50_ms']:>13.3f} "
+            f"{item['held_bytes_per_notice']:>15.1f}"
+        )
+
+
+def main():
+    args = parse_args()
+    os.environ.setdefault("DISCORD_TOKEN", "benchmark")
+    os.environ.setdefault("DATA_SERVER_API_KEY", "benchmark")
+    os.environ.setdefault("DATA_SERVER_URL", "127.0.0.1:0")
+
+    result = run(args)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print_report(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""네트워크 없이 봇의 주요 경로(check_all_notice, send_notice, get_channels_for_scraper)를 측정합니다.
+
+로컬 가짜 데이터 서버와 가짜 디스코드 채널 계층을 띄우고,
+게시판 N개 × 구독자 M명 × 틱당 새 공지 K개의 부하로 틱을 반복 실행합니다.
+
+    uv run python -m benchmark.run_benchmark --boards 50 --subscribers 2000 --notices 2
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="kookmin-feed 디스코드 봇 오프라인 벤치마크")
+    parser.add_argument("--boards", type=int, default=20, help="게시판 수 (N)")
+    parser.add_argument("--subscribers", type=int, default=500, help="구독자 수 (M)")
+    parser.add_argument("--notices", type=int, default=2, help="틱당 게시판별 새 공지 수 (K)")
+    parser.add_argument("--boards-per-subscriber", type=int, default=3)
+    parser.add_argument("--ticks", type=int, default=3, help="측정할 틱 수")
+    parser.add_argument(
+        "--server-latency", type=float, default=0.005, help="데이터 서버 응답 지연(초)"
+    )
+    parser.add_argument(
+        "--discord-latency", type=float, default=0.02, help="디스코드 API 응답 지연(초)"
+    )
+    parser.add_argument(
+        "--discord-rate",
+        type=float,
+        default=10000,
+        help="디스코드 전역 초당 요청 제한 (운영 기본값은 45, 봇 자체 오버헤드만 보려면 크게)",
+    )
+    parser.add_argument(
+        "--no-batch", action="store_true", help="서버가 배치 엔드포인트를 지원하지 않는 경우"
+    )
+    parser.add_argument(
+        "--no-delta",
+        action="store_true",
+        help="서버가 구독 테이블 변경분(updated_since) 조회를 지원하지 않는 경우",
+    )
+    parser.add_argument(
+        "--no-outbox", action="store_true", help="outbox 없이 틱 안에서 바로 전송하는 경우"
+    )
+    parser.add_argument(
+        "--no-prewarm", action="store_true", help="측정 전에 DM 채널을 미리 찾아두지 않는 경우"
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def peak_rss_mb() -> float:
+    # 리눅스에서 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def run(args) -> dict:
+    # 봇 모듈은 import 시점에 ENV를 읽으므로, 환경 변수를 먼저 설정한 뒤 불러온다
+    import main
+    import discord_bot.discord_bot as discord_bot_module
+    from benchmark.fake_data_server import FakeDataServer
+    from benchmark.fake_discord import FakeNoticeBot
+    from utils.data_server_conect import data_server_client
+    from utils.delivery_outbox import DeliveryOutbox
+    from utils.dm_channel_store import DMChannelStore
+    from discord_bot.delivery_worker import DeliveryWorker
+    from config.env_loader import ENV
+
+    for name in list(logging.root.manager.loggerDict):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    server = FakeDataServer(
+        boards=args.boards,
+        subscribers=args.subscribers,
+        boards_per_subscriber=args.boards_per_subscriber,
+        latency=args.server_latency,
+        batch_supported=not args.no_batch,
+        delta_supported=not args.no_delta,
+    )
+    host, port = os.environ["DATA_SERVER_URL"].split(":")
+    await server.start(host, int(port))
+
+    bot = FakeNoticeBot(
+        [record["_id"] for record in server.server_channels],
+        api_latency=args.discord_latency,
+    )
+    # 실제 봇 대신 가짜 채널 계층을 사용하고, 작동 시간 제한은 끈다
+    discord_bot_module.client = bot
+    main.client = bot
+    main.is_working_hour = lambda: True
+    bot.broadcaster.open_dm_store(DMChannelStore(ENV["STATE_DIR"] / "state.db"))
+    if ENV["DELIVERY_OUTBOX"]:
+        bot.delivery_worker = DeliveryWorker(
+            bot, DeliveryOutbox(ENV["STATE_DIR"] / "state.db")
+        )
+        bot.delivery_worker.start()
+
+    await data_server_client.open()
+    try:
+        await main.refresh_metadata()
+
+        # 첫 틱은 게시판별 마지막 공지를 캐싱만 함 (전송 없음)
+        await main.check_all_notice()
+
+        prewarm_s = None
+        if not args.no_prewarm:
+            started_at = time.perf_counter()
+            await bot.broadcaster.prewarm_dm_channels(
+                [record["_id"] for record in server.direct_messages]
+            )
+            prewarm_s = round(time.perf_counter() - started_at, 4)
+
+        ticks = []
+        for tick in range(args.ticks):
+            server.publish(args.notices)
+            server.reset_counts()
+            bot.reset_counts()
+
+            started_at = time.perf_counter()
+            await main.check_all_notice()
+            # outbox를 쓰는 경우 틱 지연에는 큐에 쌓인 작업을 모두 보낼 때까지를 포함
+            if bot.delivery_worker:
+                await bot.delivery_worker.wait_until_drained()
+            elapsed = time.perf_counter() - started_at
+
+            ticks.append(
+                {
+                    "tick": tick + 1,
+                    "latency_s": round(elapsed, 4),
+                    "http_calls": sum(server.request_counts.values()),
+                    "http_calls_by_endpoint": dict(server.request_counts),
+                    "http_bytes": sum(server.response_bytes.values()),
+                    "discord_calls": dict(bot.api_calls),
+                    "messages_sent": bot.sent_messages,
+                    "embeds_sent": bot.sent_embeds,
+                    "permission_checks": bot.permission_checks,
+                    "sends_per_s": round(bot.sent_messages / elapsed, 1) if elapsed else 0,
+                }
+            )
+    finally:
+        if bot.delivery_worker:
+            await bot.delivery_worker.stop()
+            bot.delivery_worker.outbox.close()
+        bot.broadcaster.dm_store.close()
+        await data_server_client.close()
+        await server.stop()
+
+    return {
+        "params": {
+            "boards": args.boards,
+            "subscribers": args.subscribers,
+            "notices_per_tick": args.notices,
+            "boards_per_subscriber": args.boards_per_subscriber,
+            "server_latency_s": args.server_latency,
+            "discord_latency_s": args.discord_latency,
+            "discord_rate": args.discord_rate,
+            "batch_supported": not args.no_batch,
+            "delta_supported": not args.no_delta,
+            "outbox": not args.no_outbox,
+        },
+        "dm_prewarm_s": prewarm_s,
+        "ticks": ticks,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def print_report(result: dict):
+    params = result["params"]
+    print(
+        f"\n게시판 {params['boards']}개 × 구독자 {params['subscribers']}명 × "
+        f"틱당 새 공지 {params['notices_per_tick']}개"
+    )
+    print(
+        f"{'tick':>4} {'latency(s)':>11} {'http':>6} {'http kB':>8} "
+        f"{'discord':>8} {'sent':>6} {'sends/s':>9}"
+    )
+    for tick in result["ticks"]:
+        print(
+            f"{tick['tick']:>4} {tick['latency_s']:>11.3f} {tick['http_calls']:>6} "
+            f"{tick['http_bytes'] / 1024:>8.1f} "
+            f"{sum(tick['discord_calls'].values()):>8} {tick['messages_sent']:>6} "
+            f"{tick['sends_per_s']:>9.1f}"
+        )
+    if result["dm_prewarm_s"] is not None:
+        print(f"DM prewarm: {result['dm_prewarm_s']:.3f}s")
+    print(f"peak RSS: {result['peak_rss_mb']:.1f} MB")
+
+
+def main():
+    args = parse_args()
+
+    os.environ.setdefault("DISCORD_TOKEN", "benchmark")
+    os.environ.setdefault("DATA_SERVER_API_KEY", "benchmark")
+    os.environ["DATA_SERVER_URL"] = f"127.0.0.1:{free_port()}"
+    os.environ["DISCORD_GLOBAL_RATE"] = str(args.discord_rate)
+    os.environ["CURSOR_STORE"] = "memory"
+    os.environ["DELIVERY_OUTBOX"] = "false" if args.no_outbox else "true"
+    os.environ["OUTBOX_WORKERS"] = os.environ.get("OUTBOX_WORKERS", "50")
+    # outbox는 매번 빈 임시 디렉터리에 만든다
+    state_dir = tempfile.TemporaryDirectory()
+    os.environ["STATE_DIR"] = state_dir.name
+
+    with state_dir:
+        result = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print_report(result)
+
+
+if __name__ == "__main__":
+    main()
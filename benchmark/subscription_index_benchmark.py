@@ -0,0 +1,205 @@
+"""구독 색인(utils/subscription_index.py)의 메모리와 조회 지연을 측정합니다.
+
+데이터 서버가 주는 형태(JSON dict 목록)를 그대로 훑는 방식, 채널 ID 문자열 집합으로 만든
+역색인, 압축 색인(게시판 비트마스크 + array('Q'))을 같은 데이터로 비교합니다.
+
+    uv run python -m benchmark.subscription_index_benchmark --subscribers 100000 --boards 60
+"""
+
+import argparse
+import gc
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.subscription_index import SubscriptionIndex
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="구독 색인 메모리/지연 벤치마크")
+    parser.add_argument("--subscribers", type=int, default=100000, help="구독자 수")
+    parser.add_argument("--boards", type=int, default=60, help="게시판 수")
+    parser.add_argument("--boards-per-subscriber", type=int, default=3)
+    parser.add_argument("--lookups", type=int, default=10000, help="채널별 조회 횟수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args()
+
+
+def make_records(subscribers: int, boards: int, per_subscriber: int, seed: int = 0):
+    """데이터 서버 응답과 같은 형태의 DM/서버 채널 레코드를 만듭니다."""
+    rng = random.Random(seed)
+    names = [f"board_{i:03d}" for i in range(boards)]
+    dm_channels, server_channels = [], []
+    for i in range(subscribers):
+        # 실제와 비슷하게 json을 거쳐 서로 다른 문자열 객체로 만든다
+        record = json.loads(
+            json.dumps(
+                {
+                    "_id": str(10**17 + rng.randrange(10**17)),
+                    "scrapers": rng.sample(names, min(per_subscriber, boards)),
+                }
+            )
+        )
+        (dm_channels if i % 2 == 0 else server_channels).append(record)
+    return names, dm_channels, server_channels
+
+
+class SetIndex:
+    """비교용: 채널 ID 문자열 집합으로 만든 역색인 (압축 전 방식)"""
+
+    def __init__(self, dm_channels: list, server_channels: list):
+        self.channels_by_scraper = {}
+        self.scrapers_by_channel = {}
+        for record in dm_channels + server_channels:
+            scrapers = set(record["scrapers"])
+            self.scrapers_by_channel[record["_id"]] = scrapers
+            for name in scrapers:
+                self.channels_by_scraper.setdefault(name, set()).add(record["_id"])
+
+    def get_channels(self, name: str) -> list[str]:
+        return list(self.channels_by_scraper.get(name, ()))
+
+    def get_scrapers(self, channel_id: str) -> list[str]:
+        return list(self.scrapers_by_channel.get(channel_id, ()))
+
+
+class RecordScan:
+    """비교용: 레코드 목록을 매번 훑는 방식 (scraper in record["scrapers"])"""
+
+    def __init__(self, dm_channels: list, server_channels: list):
+        self.records = dm_channels + server_channels
+
+    def get_channels(self, name: str) -> list[str]:
+        return [record["_id"] for record in self.records if name in record["scrapers"]]
+
+    def get_scrapers(self, channel_id: str) -> list[str]:
+        for record in self.records:
+            if record["_id"] == channel_id:
+                return list(record["scrapers"])
+        return []
+
+
+def measure_build(build) -> tuple[object, float, float]:
+    """(만든 객체, 걸린 시간(초), 늘어난 메모리(MB))를 반환합니다."""
+    gc.collect()
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    value = build()
+    elapsed = time.perf_counter() - started_at
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, elapsed, memory / 1024 / 1024
+
+
+def timed(function, arguments: list) -> dict:
+    """인자마다 한 번씩 호출한 지연 시간(ms)의 중앙값과 p99를 반환합니다."""
+    latencies = []
+    for argument in arguments:
+        started_at = time.perf_counter()
+        function(argument)
+        latencies.append((time.perf_counter() - started_at) * 1000)
+    latencies.sort()
+    return {
+        "p50_ms": round(statistics.median(latencies), 4),
+        "p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 4),
+    }
+
+
+def run(args) -> dict:
+    names, dm_channels, server_channels = make_records(
+        args.subscribers, args.boards, args.boards_per_subscriber
+    )
+    channel_ids = [record["_id"] for record in dm_channels + server_channels]
+    rng = random.Random(1)
+    sampled_ids = [rng.choice(channel_ids) for _ in range(args.lookups)]
+    scan_ids = sampled_ids[: max(1, args.lookups // 100)]  # 레코드 훑기는 느리므로 일부만
+
+    def build_compact():
+        index = SubscriptionIndex()
+        index.rebuild(dm_channels, server_channels)
+        return index
+
+    results = {}
+    for label, build, lookup_ids in (
+        ("records", lambda: RecordScan(dm_channels, server_channels), scan_ids),
+        ("set", lambda: SetIndex(dm_channels, server_channels), sampled_ids),
+        ("compact", build_compact, sampled_ids),
+    ):
+        index, build_s, memory_mb = measure_build(build)
+        results[label] = {
+            "build_s": round(build_s, 3),
+            "memory_mb": round(memory_mb, 2),
+            # 첫 조회(압축 색인은 마스크를 훑음)와 같은 게시판을 다시 조회한 경우
+            "channels_of_board": timed(index.get_channels, names),
+            "channels_of_board_repeat": timed(index.get_channels, names),
+            "boards_of_channel": timed(index.get_scrapers, lookup_ids),
+        }
+        del index
+
+    # 압축 색인의 부분 갱신 (구독 추가/삭제 명령, 변경분 동기화)
+    index = build_compact()
+    new_ids = [str(10**18 + i) for i in range(1000)]
+    results["compact"]["add_new_channel"] = timed(
+        lambda channel_id: index.add(names[0], channel_id, "direct-messages"), new_ids
+    )
+    results["compact"]["discard"] = timed(
+        lambda channel_id: index.discard(names[0], channel_id), new_ids
+    )
+    results["compact"]["channels_with_types_of_board"] = timed(
+        index.get_channels_with_types, names
+    )
+
+    return {
+        "params": {
+            "subscribers": args.subscribers,
+            "boards": args.boards,
+            "boards_per_subscriber": args.boards_per_subscriber,
+        },
+        "results": results,
+    }
+
+
+def print_report(result: dict):
+    params = result["params"]
+    print(
+        f"\n구독자 {params['subscribers']}명 × 게시판 {params['boards']}개 "
+        f"(구독자당 {params['boards_per_subscriber']}개)"
+    )
+    print(
+        f"{'index':>8} {'build(s)':>9} {'memory(MB)':>11} {'board→ch p50/p99(ms)':>22} "
+        f"{'(repeat)':>22} {'ch→board p50/p99(ms)':>22}"
+    )
+    for label, item in result["results"].items():
+        board, repeat = item["channels_of_board"], item["channels_of_board_repeat"]
+        channel = item["boards_of_channel"]
+        print(
+            f"{label:>8} {item['build_s']:>9.3f} {item['memory_mb']:>11.2f} "
+            f"{board['p50_ms']:>10.3f}/{board['p99_ms']:<11.3f} "
+            f"{repeat['p50_ms']:>10.3f}/{repeat['p99_ms']:<11.3f} "
+            f"{channel['p50_ms']:>10.4f}/{channel['p99_ms']:<11.4f}"
+        )
+    compact = result["results"]["compact"]
+    print(
+        f"compact add p50 {compact['add_new_channel']['p50_ms']:.4f}ms, "
+        f"discard p50 {compact['discard']['p50_ms']:.4f}ms, "
+        f"board→(ch, type) p50 {compact['channels_with_types_of_board']['p50_ms']:.3f}ms"
+    )
+
+
+def main():
+    args = parse_args()
+    result = run(args)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print_report(result)
+
+
+if __name__ == "__main__":
+    main()
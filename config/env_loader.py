@@ -31,16 +31,109 @@ def load_env_file():
 
     if env_file.exists():
         load_dotenv(env_file)
-        return {
-            "IS_PROD": is_prod,
-            "DISCORD_TOKEN": os.getenv("DISCORD_TOKEN"),
-            "DATA_SERVER_URL": os.getenv("DATA_SERVER_URL"),
-            "DATA_SERVER_API_KEY": os.getenv("DATA_SERVER_API_KEY"),
-            # 필요한 다른 환경 변수들도 여기에 추가
-        }
-    else:
+    elif not os.getenv("DISCORD_TOKEN"):
+        # 파일 없이 프로세스 환경 변수만으로 실행하는 경우(벤치마크 등)는 허용
         raise FileNotFoundError("환경 변수 파일이 존재하지 않습니다!")
 
+    return {
+        "IS_PROD": is_prod,
+        "DISCORD_TOKEN": os.getenv("DISCORD_TOKEN"),
+        "DATA_SERVER_URL": os.getenv("DATA_SERVER_URL"),
+        "DATA_SERVER_API_KEY": os.getenv("DATA_SERVER_API_KEY"),
+        # 데이터 서버 커넥션 풀 설정
+        "DATA_SERVER_POOL_SIZE": int(os.getenv("DATA_SERVER_POOL_SIZE", "20")),
+        "DATA_SERVER_POOL_PER_HOST": int(
+            os.getenv("DATA_SERVER_POOL_PER_HOST", "10")
+        ),
+        "DATA_SERVER_DNS_TTL": int(os.getenv("DATA_SERVER_DNS_TTL", "300")),
+        "DATA_SERVER_KEEPALIVE": float(os.getenv("DATA_SERVER_KEEPALIVE", "30")),
+        "DATA_SERVER_TIMEOUT": float(os.getenv("DATA_SERVER_TIMEOUT", "10")),
+        # 데이터 서버 재시도(지수 백오프)와 서킷 브레이커 설정
+        "DATA_SERVER_RETRIES": int(os.getenv("DATA_SERVER_RETRIES", "3")),
+        "DATA_SERVER_RETRY_BASE_DELAY": float(
+            os.getenv("DATA_SERVER_RETRY_BASE_DELAY", "0.5")
+        ),
+        "DATA_SERVER_RETRY_MAX_DELAY": float(
+            os.getenv("DATA_SERVER_RETRY_MAX_DELAY", "5")
+        ),
+        "CIRCUIT_FAILURE_THRESHOLD": int(
+            os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")
+        ),
+        "CIRCUIT_RESET_TIMEOUT": float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30")),
+        # 동시에 확인할 게시판 수
+        "POLL_CONCURRENCY": int(os.getenv("POLL_CONCURRENCY", "5")),
+        # 공지 하나를 동시에 전송할 채널 수와 디스코드 전역 초당 요청 수 제한
+        "BROADCAST_CONCURRENCY": int(os.getenv("BROADCAST_CONCURRENCY", "10")),
+        "DISCORD_GLOBAL_RATE": float(os.getenv("DISCORD_GLOBAL_RATE", "45")),
+        # 채널별 구독 레코드 캐시 크기와 유지 시간(초)
+        "SUBSCRIPTION_CACHE_SIZE": int(
+            os.getenv("SUBSCRIPTION_CACHE_SIZE", "10000")
+        ),
+        "SUBSCRIPTION_CACHE_TTL": float(os.getenv("SUBSCRIPTION_CACHE_TTL", "300")),
+        # 구독 테이블 사본을 변경분(updated_since)이 아닌 전체 목록으로 다시 맞추는 간격(초)
+        "SUBSCRIPTION_FULL_SYNC_INTERVAL": float(
+            os.getenv("SUBSCRIPTION_FULL_SYNC_INTERVAL", "3600")
+        ),
+        # 게시판 확인 방식: fixed(모든 게시판을 같은 주기로) 또는 adaptive(게시 빈도에 따라)
+        "POLL_MODE": os.getenv("POLL_MODE", "fixed"),
+        # adaptive 모드의 게시판별 최소/최대 확인 간격(분)과 분당 확인 예산
+        "POLL_MIN_INTERVAL": float(os.getenv("POLL_MIN_INTERVAL", "5")),
+        "POLL_MAX_INTERVAL": float(os.getenv("POLL_MAX_INTERVAL", "360")),
+        "POLL_BUDGET_PER_MINUTE": float(os.getenv("POLL_BUDGET_PER_MINUTE", "30")),
+        # 데이터 서버가 새 공지를 알려주는 푸시(웹훅) 수신 설정
+        "PUSH_ENABLED": os.getenv("PUSH_ENABLED", "false").lower() == "true",
+        # 기본값은 같은 호스트에서만 받도록 127.0.0.1 (외부에서 받으려면 0.0.0.0 등으로 설정)
+        "PUSH_HOST": os.getenv("PUSH_HOST", "127.0.0.1"),
+        "PUSH_PORT": int(os.getenv("PUSH_PORT", "8081")),
+        "PUSH_SECRET": os.getenv("PUSH_SECRET") or os.getenv("DATA_SERVER_API_KEY"),
+        # 재시작 후에도 유지되는 상태(마지막 공지 등)를 저장할 위치
+        "STATE_DIR": Path(os.getenv("STATE_DIR", root_dir / "data")),
+        "CURSOR_STORE": os.getenv("CURSOR_STORE", "sqlite"),
+        # 전송 작업을 outbox(STATE_DIR/state.db)에 저장한 뒤 워커가 보내는 방식 사용 여부
+        "DELIVERY_OUTBOX": os.getenv("DELIVERY_OUTBOX", "true").lower() == "true",
+        "OUTBOX_WORKERS": int(os.getenv("OUTBOX_WORKERS", "10")),
+        "OUTBOX_MAX_ATTEMPTS": int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5")),
+        "OUTBOX_RETRY_BASE_DELAY": float(os.getenv("OUTBOX_RETRY_BASE_DELAY", "30")),
+        # 새 작업 알림 없이 outbox를 다시 확인하는 간격(초).
+        # 샤드 모드에서는 다른 프로세스가 넣은 작업을 알림 없이 찾아야 하므로 짧게 둠
+        "OUTBOX_POLL_INTERVAL": float(
+            os.getenv("OUTBOX_POLL_INTERVAL", "2" if os.getenv("SHARD_COUNT") else "30")
+        ),
+        # 한 채널에 보낼 여러 공지를 메시지 하나(최대 10개)로 묶어 보낼지 여부와,
+        # 묶지 않고 공지마다 따로 보낼 채널 ID 목록(쉼표로 구분)
+        "DIGEST_MODE": os.getenv("DIGEST_MODE", "true").lower() == "true",
+        "DIGEST_EXCLUDED_CHANNELS": {
+            channel_id.strip()
+            for channel_id in os.getenv("DIGEST_EXCLUDED_CHANNELS", "").split(",")
+            if channel_id.strip()
+        },
+        # Prometheus 형식 지표를 내보내는 로컬 HTTP 서버 (GET /metrics)
+        "METRICS_ENABLED": os.getenv("METRICS_ENABLED", "false").lower() == "true",
+        "METRICS_HOST": os.getenv("METRICS_HOST", "127.0.0.1"),
+        "METRICS_PORT": int(os.getenv("METRICS_PORT", "9100")),
+        # 로그 출력 방식: queue(별도 스레드에서 출력) 또는 sync(바로 출력),
+        # 로그 형식: text 또는 json(한 줄에 JSON 객체 하나, extra 필드 포함)
+        "LOG_MODE": os.getenv("LOG_MODE", "queue"),
+        "LOG_FORMAT": os.getenv("LOG_FORMAT", "text"),
+        # 샤드 모드: 전체 샤드 수와 이 프로세스가 맡을 샤드 ID 목록(쉼표로 구분).
+        # SHARD_COUNT가 없으면 샤드 없이 프로세스 하나로 동작
+        "SHARD_COUNT": int(os.getenv("SHARD_COUNT")) if os.getenv("SHARD_COUNT") else None,
+        "SHARD_IDS": [
+            int(shard_id)
+            for shard_id in os.getenv("SHARD_IDS", "").split(",")
+            if shard_id.strip()
+        ]
+        or None,
+        # 리더 선출: 여러 프로세스/레플리카 중 잠금을 잡은 하나(owner)만 공지 확인과 DM 전송을 맡음.
+        # 샤드 모드에서는 항상 사용. 잠금 백엔드는 file(같은 호스트) 또는 sqlite(TTL, 공유 볼륨)
+        "LEADER_ELECTION": os.getenv("LEADER_ELECTION", "false").lower() == "true",
+        "LEASE_BACKEND": os.getenv("LEASE_BACKEND", "file"),
+        "LEASE_TTL": float(os.getenv("LEASE_TTL", "15")),
+        # owner가 아닌 프로세스가 잠금을 다시 시도하는 간격(초)
+        "OWNER_RETRY_INTERVAL": float(os.getenv("OWNER_RETRY_INTERVAL", "2")),
+        # 필요한 다른 환경 변수들도 여기에 추가
+    }
+
 
 # 환경 설정을 전역 변수로 로드
 ENV = load_env_file()
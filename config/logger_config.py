@@ -1,33 +1,74 @@
+import atexit
+import copy
+import json
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from config.env_loader import ENV
 
 environment = "DEV" if not ENV["IS_PROD"] else "PROD"  # 기본값은 DEV
 
+# LogRecord가 기본으로 가지는 속성 (이 외의 속성은 extra로 넘긴 필드)
+_RECORD_ATTRIBUTES = set(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime"}
 
-def setup_logger(name: str) -> logging.Logger:
-    """로거를 설정하고 반환합니다."""
-    logger = logging.getLogger(name)
 
-    # 이미 핸들러가 설정되어 있다면 추가 설정하지 않음
-    if logger.handlers:
-        return logger
+class JsonFormatter(logging.Formatter):
+    """로그 한 줄을 JSON 객체 하나로 출력합니다.
+    extra={"collection_name": ..., "channel_id": ...}로 넘긴 필드도 함께 기록됩니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _LazyQueueHandler(QueueHandler):
+    """이벤트 루프 스레드에서는 메시지 인자만 합쳐 큐에 넣고,
+    시간/JSON 포맷팅과 출력은 리스너 스레드에서 처리합니다."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # 예외 객체는 스레드를 넘기지 않고 문자열로 바꿔서 전달
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
 
+def _build_formatter() -> logging.Formatter:
+    if ENV["LOG_FORMAT"] == "json":
+        return JsonFormatter()
     # 로그 포맷 설정
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    formatter = logging.Formatter(log_format)
+    return logging.Formatter(log_format)
+
+
+def _build_output_handlers() -> list[logging.Handler]:
+    """stdout(환경에 따라 DEBUG 또는 INFO 이상)과 stderr(ERROR 이상) 핸들러를 만듭니다."""
+    formatter = _build_formatter()
 
     # stdout 핸들러 (환경에 따라 DEBUG 또는 INFO 레벨)
     stdout_handler = logging.StreamHandler(sys.stdout)
     stdout_handler.setFormatter(formatter)
-
-    # 환경에 따라 로그 레벨 설정
-    # 로거 레벨과 핸들러 레벨이 있기 때문에, 두개다 설정해야함.
     if environment.lower() == "prod":
-        logger.setLevel(logging.INFO)
         stdout_handler.setLevel(logging.INFO)
     else:  # development
-        logger.setLevel(logging.DEBUG)
         stdout_handler.setLevel(logging.DEBUG)
 
     # stderr 핸들러 (ERROR 레벨)
@@ -35,9 +76,52 @@ def setup_logger(name: str) -> logging.Logger:
     stderr_handler.setLevel(logging.ERROR)
     stderr_handler.setFormatter(formatter)
 
+    return [stdout_handler, stderr_handler]
+
+
+class _LogQueue:
+    """queue 모드에서 모든 로거가 공유하는 큐와 출력 스레드(QueueListener)"""
+
+    handler: QueueHandler = None
+    listener: QueueListener = None
+
+    @classmethod
+    def get_handler(cls) -> QueueHandler:
+        if cls.handler is None:
+            log_queue = queue.SimpleQueue()
+            cls.handler = _LazyQueueHandler(log_queue)
+            cls.listener = QueueListener(
+                log_queue, *_build_output_handlers(), respect_handler_level=True
+            )
+            cls.listener.start()
+            # 종료 시 큐에 남은 로그를 모두 출력
+            atexit.register(cls.listener.stop)
+        return cls.handler
+
+
+def setup_logger(name: str) -> logging.Logger:
+    """로거를 설정하고 반환합니다.
+    LOG_MODE=queue(기본)이면 로그를 큐에 넣기만 하고 출력은 별도 스레드에서 하므로
+    이벤트 루프가 stdout/stderr 쓰기를 기다리지 않습니다."""
+    logger = logging.getLogger(name)
+
+    # 이미 핸들러가 설정되어 있다면 추가 설정하지 않음
+    if logger.handlers:
+        return logger
+
+    # 환경에 따라 로그 레벨 설정
+    # 로거 레벨과 핸들러 레벨이 있기 때문에, 두개다 설정해야함.
+    if environment.lower() == "prod":
+        logger.setLevel(logging.INFO)
+    else:  # development
+        logger.setLevel(logging.DEBUG)
+
     # 핸들러 추가
-    logger.addHandler(stdout_handler)
-    logger.addHandler(stderr_handler)
+    if ENV["LOG_MODE"] == "queue":
+        logger.addHandler(_LogQueue.get_handler())
+    else:
+        for handler in _build_output_handlers():
+            logger.addHandler(handler)
 
     # 로거가 상위 로거로 메시지를 전파하지 않도록 설정
     logger.propagate = False
@@ -0,0 +1,388 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import discord
+from template.scraper_type import ScraperType
+from template.notice_data import NoticeData
+from utils.dm_channel_store import DMChannelStore
+from utils.subscription_index import SERVER_CHANNELS
+from utils.metrics import CACHE_REQUESTS, DISCORD_SEND_DURATION
+from config.logger_config import setup_logger
+from config.env_loader import ENV
+
+logger = setup_logger(__name__)
+
+
+# 채널 하나에 대한 전송 결과
+SENT = "sent"
+FORBIDDEN = "forbidden"
+NOT_FOUND = "not_found"
+FAILED = "failed"
+
+
+@dataclass
+class DeliveryStats:
+    """공지 하나를 전송한 결과 통계"""
+
+    sent: int = 0
+    forbidden: int = 0
+    not_found: int = 0
+    failed: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    def record(self, outcome: str, latency: float = None):
+        """전송 결과 하나를 통계에 반영합니다."""
+        setattr(self, outcome, getattr(self, outcome) + 1)
+        if outcome == SENT and latency is not None:
+            self.latencies.append(latency)
+
+    @property
+    def total(self) -> int:
+        return self.sent + self.forbidden + self.not_found + self.failed
+
+    def percentile(self, percent: float) -> float:
+        """전송 지연 시간(초)의 백분위 값을 반환합니다."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * percent / 100))
+        return ordered[index]
+
+    def __str__(self):
+        return (
+            f"성공 {self.sent} / 권한 없음 {self.forbidden} / "
+            f"찾을 수 없음 {self.not_found} / 실패 {self.failed} | "
+            f"p50 {self.percentile(50) * 1000:.0f}ms, "
+            f"p95 {self.percentile(95) * 1000:.0f}ms, "
+            f"p99 {self.percentile(99) * 1000:.0f}ms"
+        )
+
+
+class GlobalRateLimiter:
+    """디스코드 전역 rate limit(초당 요청 수)을 넘지 않도록 요청 간격을 조절합니다.
+
+    라우트(채널)별 버킷과 429 응답 처리는 discord.py의 HTTPClient가 담당하고,
+    이 클래스는 동시 전송이 전역 버킷을 소진하지 않도록 미리 속도를 제한합니다.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.rate, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class PreparedEmbed(discord.Embed):
+    """직렬화 결과(to_dict)를 한 번만 만들어 모든 채널 전송에 재사용하는 임베드.
+    만든 뒤에는 수정하지 않는다고 가정합니다."""
+
+    __slots__ = ("_payload",)
+
+    def to_dict(self):
+        try:
+            return self._payload
+        except AttributeError:
+            self._payload = super().to_dict()
+            return self._payload
+
+
+class NoticeBroadcaster:
+    """공지를 구독 중인 모든 채널에 동시에 전송하는 클래스"""
+
+    MAX_EMBEDS_PER_MESSAGE = 10  # 디스코드 메시지 하나에 담을 수 있는 최대 임베드 수
+    EMBED_CACHE_SIZE = 256  # 최근에 만든 공지 임베드를 보관할 개수
+
+    def __init__(self, client: discord.Client):
+        self.client = client
+        self.concurrency = ENV["BROADCAST_CONCURRENCY"]
+        self.rate_limiter = GlobalRateLimiter(ENV["DISCORD_GLOBAL_RATE"])
+        self.digest_mode = ENV["DIGEST_MODE"]
+        self.digest_excluded_channels = ENV["DIGEST_EXCLUDED_CHANNELS"]
+        self.dm_channels: dict[str, int] = {}  # DM 사용자 ID → DM 채널 ID
+        self.dm_store: DMChannelStore = None
+        self._embeds: OrderedDict[tuple[str, str], PreparedEmbed] = OrderedDict()
+        # 서버 ID → {채널 ID: 전송 가능 여부}, 서버/역할/채널 변경 이벤트가 오면 무효화
+        self._permissions: dict[int, dict[int, bool]] = {}
+
+    def open_dm_store(self, store: DMChannelStore):
+        """저장된 DM 채널 매핑을 불러오고, 이후 새로 찾은 매핑을 저장할 저장소를 설정합니다."""
+        self.dm_store = store
+        self.dm_channels = store.load()
+
+    def is_digest_channel(self, channel_id: str) -> bool:
+        """채널에 여러 공지를 메시지 하나로 묶어 보낼지 여부"""
+        return self.digest_mode and str(channel_id) not in self.digest_excluded_channels
+
+    def group(self, items: list, channel_id: str) -> list[list]:
+        """채널에 보낼 항목들을 메시지 단위로 나눕니다. (묶음 전송이면 최대 10개씩, 아니면 1개씩)"""
+        size = self.MAX_EMBEDS_PER_MESSAGE if self.is_digest_channel(channel_id) else 1
+        return [items[index : index + size] for index in range(0, len(items), size)]
+
+    @staticmethod
+    def build_embed(notice: NoticeData, scraper_type: ScraperType) -> discord.Embed:
+        """공지사항 임베드를 만듭니다."""
+        embed = PreparedEmbed(
+            title=notice.title, url=notice.link, color=discord.Color.blue()
+        )
+
+        # 공지사항 종류 표시
+        embed.add_field(name="구분", value=scraper_type.korean_name, inline=True)
+
+        if notice.published.year > 1970:
+            embed.add_field(
+                name="작성일",
+                value=notice.published.strftime("%Y-%m-%d"),
+                inline=True,
+            )
+
+        return embed
+
+    def render(self, notice: NoticeData, scraper_type: ScraperType) -> discord.Embed:
+        """공지 임베드를 공지 하나당 한 번만 만들고, 모든 채널에 같은 직렬화 결과를 재사용합니다."""
+        key = (scraper_type.collection_name, notice.link)
+        embed = self._embeds.get(key)
+        if embed is None:
+            CACHE_REQUESTS.inc(("embed", "miss"))
+            embed = self.build_embed(notice, scraper_type)
+            self._embeds[key] = embed
+            if len(self._embeds) > self.EMBED_CACHE_SIZE:
+                self._embeds.popitem(last=False)
+        else:
+            CACHE_REQUESTS.inc(("embed", "hit"))
+            self._embeds.move_to_end(key)
+        return embed
+
+    def can_send(self, channel: discord.abc.GuildChannel) -> bool:
+        """서버 채널에 공지를 보낼 권한이 있는지 확인합니다. 결과는 무효화될 때까지 캐싱합니다."""
+        guild_permissions = self._permissions.setdefault(channel.guild.id, {})
+        allowed = guild_permissions.get(channel.id)
+        if allowed is None:
+            CACHE_REQUESTS.inc(("permission", "miss"))
+            permissions = channel.permissions_for(channel.guild.me)
+            allowed = permissions.send_messages and permissions.embed_links
+            guild_permissions[channel.id] = allowed
+        else:
+            CACHE_REQUESTS.inc(("permission", "hit"))
+        return allowed
+
+    def invalidate_permissions(self, guild_id: int, channel_id: int = None):
+        """서버 전체 또는 채널 하나의 권한 캐시를 지웁니다."""
+        if channel_id is None:
+            self._permissions.pop(guild_id, None)
+        else:
+            self._permissions.get(guild_id, {}).pop(channel_id, None)
+
+    async def broadcast(
+        self, notices: list[NoticeData], scraper_type: ScraperType
+    ) -> DeliveryStats:
+        """공지 목록(보낼 순서대로)을 구독 중인 모든 채널에 전송하고 전송 통계를 반환합니다.
+        묶음 전송 채널에는 여러 공지를 메시지 하나에 담아 보냅니다."""
+        stats = DeliveryStats()
+        channels = await self.client.scraper_config.get_channels_for_scraper(
+            scraper_type
+        )
+        if not channels or not notices:
+            return stats
+
+        # 임베드를 만들 수 없는 공지(작성일 형식 오류 등)만 건너뛰고 나머지는 보냄
+        rendered, embeds = [], []
+        for notice in notices:
+            try:
+                embeds.append(self.render(notice, scraper_type))
+            except Exception as e:
+                logger.error(
+                    "공지 %s를 만들 수 없어 건너뜁니다: %s",
+                    notice.link,
+                    e,
+                    extra={"collection_name": scraper_type.collection_name},
+                )
+                continue
+            rendered.append(notice)
+        if not rendered:
+            return stats
+        title = (
+            rendered[0].title
+            if len(rendered) == 1
+            else f"{scraper_type.korean_name} {len(rendered)}건"
+        )
+
+        queue = asyncio.Queue()
+        for channel_id in channels:
+            queue.put_nowait(channel_id)
+
+        async def worker():
+            while not queue.empty():
+                channel_id = queue.get_nowait()
+                for group in self.group(embeds, channel_id):
+                    started_at = time.monotonic()
+                    outcome = await self.deliver(channel_id, group, title)
+                    stats.record(outcome, time.monotonic() - started_at)
+                    if outcome in (FORBIDDEN, NOT_FOUND):
+                        break  # 채널 단위 실패이므로 남은 메시지도 보내지 않음
+
+        await asyncio.gather(
+            *(worker() for _ in range(min(self.concurrency, len(channels))))
+        )
+
+        logger.info(
+            '공지사항 "%s" 전송 결과: %s',
+            title,
+            stats,
+            extra={"collection_name": scraper_type.collection_name},
+        )
+        return stats
+
+    async def _resolve_channel(
+        self, channel_id: str, channel_type: str = None
+    ) -> tuple[discord.abc.Messageable, bool]:
+        """채널 ID로 전송할 채널과 권한 확인이 필요한지 여부를 찾습니다.
+        서버 채널 캐시에 없으면 DM 사용자로 간주합니다. 단, 서버 채널로 등록된 채널이면
+        (다른 샤드의 서버라서 캐시에 없는 경우) 권한 확인 없이 partial messageable로 보냅니다.
+        DM 채널 ID를 이미 알고 있으면 API 호출 없이 partial messageable로 바로 보냅니다."""
+        dm_channel_id = self.dm_channels.get(channel_id)
+        if dm_channel_id:
+            CACHE_REQUESTS.inc(("dm_channel", "hit"))
+            return (
+                self.client.get_partial_messageable(
+                    dm_channel_id, type=discord.ChannelType.private
+                ),
+                False,
+            )
+
+        channel = self.client.get_channel(int(channel_id))
+        if channel:
+            return channel, not isinstance(channel, discord.DMChannel)
+
+        if channel_type == SERVER_CHANNELS:
+            return self.client.get_partial_messageable(int(channel_id)), False
+
+        CACHE_REQUESTS.inc(("dm_channel", "miss"))
+        return await self.resolve_dm_channel(channel_id), False
+
+    async def resolve_dm_channel(self, user_id: str) -> discord.DMChannel:
+        """사용자의 DM 채널을 찾고(없으면 만들고) 매핑을 캐시에 저장합니다."""
+        await self.rate_limiter.acquire()
+        user = await self.client.fetch_user(int(user_id))
+        dm_channel = user.dm_channel
+        if not dm_channel:
+            await self.rate_limiter.acquire()
+            dm_channel = await user.create_dm()
+
+        self.dm_channels[user_id] = dm_channel.id
+        if self.dm_store:
+            await asyncio.to_thread(self.dm_store.save, user_id, dm_channel.id)
+        return dm_channel
+
+    async def _forget_dm_channel(self, user_id: str):
+        """더 이상 보낼 수 없는 DM 채널 매핑을 지웁니다."""
+        if self.dm_channels.pop(user_id, None) and self.dm_store:
+            await asyncio.to_thread(self.dm_store.delete, user_id)
+
+    async def prewarm_dm_channels(self, user_ids: list[str]) -> int:
+        """DM 채널을 모르는 구독자들의 DM 채널을 동시에 미리 찾아둡니다. 새로 찾은 수를 반환합니다.
+        동시 실행 수는 BROADCAST_CONCURRENCY, 요청 속도는 전역 rate limit으로 제한됩니다."""
+        missing = [user_id for user_id in map(str, user_ids) if user_id not in self.dm_channels]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def warm(user_id):
+            async with semaphore:
+                try:
+                    await self.resolve_dm_channel(user_id)
+                    return True
+                except discord.NotFound:
+                    logger.warning(
+                        "DM 사용자 ID %s를 찾을 수 없습니다.", user_id, extra={"channel_id": user_id}
+                    )
+                except Exception as e:
+                    logger.error(
+                        "DM 사용자 [%s]의 채널을 찾는 중 오류: %s",
+                        user_id,
+                        e,
+                        extra={"channel_id": user_id},
+                    )
+                return False
+
+        results = await asyncio.gather(*(warm(user_id) for user_id in missing))
+        return sum(results)
+
+    async def deliver(
+        self,
+        channel_id: str,
+        embeds: list[discord.Embed],
+        title: str,
+        channel_type: str = None,
+    ) -> str:
+        """채널 하나에 임베드들을 메시지 하나로 전송하고 전송 결과(SENT, FORBIDDEN, NOT_FOUND, FAILED)를 반환합니다."""
+        started_at = time.perf_counter()
+        outcome = await self._deliver(channel_id, embeds, title, channel_type)
+        DISCORD_SEND_DURATION.observe(time.perf_counter() - started_at, (outcome,))
+        return outcome
+
+    async def _deliver(
+        self,
+        channel_id: str,
+        embeds: list[discord.Embed],
+        title: str,
+        channel_type: str = None,
+    ) -> str:
+        channel = None
+        check_permissions = False
+        log_extra = {"channel_id": channel_id}
+        try:
+            try:
+                channel, check_permissions = await self._resolve_channel(
+                    channel_id, channel_type
+                )
+            except discord.NotFound:
+                logger.error("사용자 ID %s를 찾을 수 없습니다.", channel_id, extra=log_extra)
+                return NOT_FOUND
+
+            if check_permissions and not self.can_send(channel):
+                logger.error(
+                    "채널 [%s]에 메시지를 보낼 권한이 없습니다.", channel.name, extra=log_extra
+                )
+                return FORBIDDEN
+
+            await self.rate_limiter.acquire()
+            await channel.send(embeds=embeds)
+            logger.debug(
+                "채널 [%s]에 공지사항을 전송했습니다: %s",
+                getattr(channel, "name", "DM"),
+                title,
+                extra=log_extra,
+            )
+            return SENT
+
+        except discord.Forbidden:
+            # 캐시된 권한이 실제와 다를 수 있으므로 다음 전송 때 다시 확인
+            if check_permissions:
+                self.invalidate_permissions(channel.guild.id, channel.id)
+            logger.error(
+                "채널 [%s]에 메시지를 보낼 권한이 없습니다.",
+                getattr(channel, "name", "DM"),
+                extra=log_extra,
+            )
+            return FORBIDDEN
+        except discord.NotFound:
+            logger.error("채널 ID %s가 존재하지 않습니다.", channel_id, extra=log_extra)
+            await self._forget_dm_channel(channel_id)
+            return NOT_FOUND
+        except Exception as e:
+            logger.error(
+                "채널 [%s] 메시지 전송 중 오류: %s", channel_id, e, extra=log_extra
+            )
+            return FAILED
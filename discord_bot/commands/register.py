@@ -32,13 +32,11 @@ class RegisterView(discord.ui.View):
             self._namespace["category"] = selected_value
 
             # 선택된 카테고리의 한글명으로 placeholder 갱신
-            selected_category_kr = next(
-                (
-                    choice.korean_name
-                    for choice in MetaData.category_list
-                    if choice.name == selected_value
-                ),
-                "알 수 없는 카테고리",
+            selected_category = MetaData.name_to_category(selected_value)
+            selected_category_kr = (
+                selected_category.korean_name
+                if selected_category
+                else "알 수 없는 카테고리"
             )
             self.category_select.placeholder = selected_category_kr
 
@@ -79,9 +77,7 @@ class RegisterView(discord.ui.View):
             return
 
         # 선택된 카테고리의 게시판 목록 가져오기
-        category = next(
-            (cat for cat in MetaData.category_list if cat.name == self.category), None
-        )
+        category = MetaData.name_to_category(self.category)
 
         if category:
             choices = MetaData.get_scraper_type_in_category(category)
@@ -219,6 +215,7 @@ async def setup(bot):
                 return
 
             # 등록된 스크래퍼들의 카테고리 찾기
+            registered_scrapers = set(registered_scrapers)
             registered_categories = set()
             all_categories = MetaData.category_list
 
@@ -262,13 +259,9 @@ async def setup(bot):
                 try:
                     selected_category = category_select.values[0]
                     # 선택된 카테고리 이름 찾기
-                    selected_category_name = next(
-                        (
-                            category.korean_name
-                            for category in all_categories
-                            if category.name == selected_category
-                        ),
-                        "알 수 없는 카테고리",
+                    category = MetaData.name_to_category(selected_category)
+                    selected_category_name = (
+                        category.korean_name if category else "알 수 없는 카테고리"
                     )
 
                     # 카테고리 선택 메뉴의 placeholder 업데이트
@@ -0,0 +1,273 @@
+import asyncio
+import time
+import discord
+from discord_bot.broadcaster import (
+    SENT,
+    FORBIDDEN,
+    NOT_FOUND,
+    DeliveryStats,
+    NoticeBroadcaster,
+)
+from template.scraper_type_list import MetaData
+from utils.delivery_outbox import DeliveryJob, DeliveryOutbox
+from utils.metrics import REGISTRY, Gauge
+from utils.subscription_index import SERVER_CHANNELS
+from config.logger_config import setup_logger
+from config.env_loader import ENV
+
+logger = setup_logger(__name__)
+
+
+class DeliveryWorker:
+    """outbox에 쌓인 전송 작업을 꺼내 디스코드로 보내는 워커.
+
+    디스패처 하나가 보낼 때가 된 작업을 채널 단위로 가져와 큐에 넣고,
+    워커 여러 개가 채널별로 작업을 순서대로 보냅니다. (묶음 전송 채널은 최대 10개씩 한 메시지로)
+    일시적인 실패는 지수 백오프로 재시도하고, 권한이 없거나 채널이 사라진 경우와
+    재시도 횟수를 넘긴 경우는 dead letter로 남깁니다.
+
+    샤드 모드에서는 서버 채널 작업 중 이 프로세스의 샤드에 속한(캐시에 있는) 채널만 가져가고,
+    DM 작업과 어느 샤드도 가져가지 않은 서버 채널 작업은 owner 프로세스가 보냅니다.
+    샤드 없이 리더 선출을 사용하면 owner(리더)만 작업을 가져갑니다.
+    """
+
+    LEASE_SECONDS = 300  # 가져간 작업을 이 시간 안에 끝내지 못하면 다시 보낼 수 있게 됨
+    ORPHAN_AFTER = 120  # 이 시간이 지나도록 어느 샤드도 가져가지 않은 서버 채널 작업은 owner가 보냄
+    RETENTION = 7 * 24 * 3600  # 끝난 작업을 보관하는 기간(초)
+    PURGE_INTERVAL = 3600
+    DEPTH_INTERVAL = 5  # delivery_outbox_depth 지표를 다시 읽는 최소 간격(초)
+
+    def __init__(self, client: discord.Client, outbox: DeliveryOutbox):
+        self.client = client
+        self.outbox = outbox
+        self.workers = ENV["OUTBOX_WORKERS"]
+        self.max_attempts = ENV["OUTBOX_MAX_ATTEMPTS"]
+        self.retry_base_delay = ENV["OUTBOX_RETRY_BASE_DELAY"]
+        self.idle_wait = ENV["OUTBOX_POLL_INTERVAL"]
+        self.sharded = ENV["SHARD_COUNT"] is not None
+        # DM 작업을 보내는 프로세스인지 여부 (리더 선출을 쓰면 잠금을 얻은 뒤에 설정)
+        self.owner = not (self.sharded or ENV["LEADER_ELECTION"])
+        self.stats = DeliveryStats()
+        self._wakeup = asyncio.Event()
+        self._queue: asyncio.Queue = None
+        self._busy = 0
+        self._purged_at = 0
+        self._tasks: list[asyncio.Task] = []
+        # 지표 조회 때 이벤트 루프에서 outbox 잠금을 기다리지 않도록 디스패처가 읽어둔 값을 내보냄
+        self.depth_gauge = REGISTRY.register(
+            Gauge("delivery_outbox_depth", "outbox에서 아직 보내지 않은 전송 작업 수")
+        )
+        self._depth_read_at = 0
+
+    @property
+    def broadcaster(self) -> NoticeBroadcaster:
+        return self.client.broadcaster
+
+    async def enqueue(
+        self, collection_name: str, notices: list, channels: list[tuple[str, str]]
+    ) -> int:
+        """공지 목록(보낼 순서대로)을 (채널 ID, 채널 종류)별 전송 작업으로 저장하고 워커를 깨웁니다."""
+        if not notices or not channels:
+            return 0
+        inserted = await asyncio.to_thread(
+            self.outbox.enqueue, collection_name, notices, channels
+        )
+        if inserted:
+            self._wakeup.set()
+        return inserted
+
+    def take_ownership(self):
+        """이 프로세스가 DM 작업과 주인 없는 서버 채널 작업도 보내도록 합니다."""
+        self.owner = True
+        self._wakeup.set()
+
+    def release_ownership(self):
+        """잠금을 잃으면 새 작업을 더 가져가지 않습니다. (이미 가져간 작업은 마저 보냄)"""
+        self.owner = False
+
+    def accepts(self, channel_id: str, channel_type: str, created_at: float) -> bool:
+        """이 프로세스가 보낼 채널인지 확인합니다. (outbox.claim에서 호출)"""
+        if not self.sharded or channel_type != SERVER_CHANNELS:
+            return self.owner  # DM (또는 종류를 모르는 이전 버전 작업)
+        if self.client.get_channel(int(channel_id)):
+            return True
+        # 샤드 캐시에 없는 서버 채널 (봇이 나간 서버 등)
+        return self.owner and time.time() - created_at >= self.ORPHAN_AFTER
+
+    def start(self):
+        self._queue = asyncio.Queue(maxsize=self.workers)
+        self._tasks = [asyncio.create_task(self._dispatch())]
+        self._tasks += [
+            asyncio.create_task(self._work()) for _ in range(self.workers)
+        ]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def wait_until_drained(self, poll_interval: float = 0.05):
+        """outbox에 보낼 작업이 남지 않을 때까지 기다립니다."""
+        while await asyncio.to_thread(self.outbox.depth):
+            await asyncio.sleep(poll_interval)
+
+    async def _dispatch(self):
+        await self.client.wait_until_ready()
+        while True:
+            self._wakeup.clear()
+            try:
+                batches = await asyncio.to_thread(
+                    self.outbox.claim,
+                    self.workers,
+                    self.LEASE_SECONDS,
+                    None if self.owner and not self.sharded else self.accepts,
+                )
+            except Exception as e:
+                logger.error("전송 작업을 가져오는 중 오류: %s", e)
+                batches = []
+                await asyncio.sleep(1)
+
+            await self._refresh_depth()
+            for jobs in batches:
+                await self._queue.put(jobs)
+            if batches:
+                continue
+
+            if self._queue.empty() and self._busy == 0:
+                await self._on_idle()
+
+            delay = await asyncio.to_thread(self.outbox.next_attempt_in)
+            timeout = self.idle_wait if not delay else min(delay, self.idle_wait)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _refresh_depth(self):
+        if time.monotonic() - self._depth_read_at < self.DEPTH_INTERVAL:
+            return
+        self._depth_read_at = time.monotonic()
+        try:
+            self.depth_gauge.set(await asyncio.to_thread(self.outbox.depth))
+        except Exception as e:
+            logger.error("outbox 대기 작업 수를 읽는 중 오류: %s", e)
+
+    async def _on_idle(self):
+        if self.stats.total:
+            logger.info("전송 대기열을 모두 처리했습니다: %s", self.stats)
+            self.stats = DeliveryStats()
+
+        if time.monotonic() - self._purged_at >= self.PURGE_INTERVAL:
+            self._purged_at = time.monotonic()
+            try:
+                await asyncio.to_thread(self.outbox.purge, self.RETENTION)
+            except Exception as e:
+                logger.error("끝난 전송 작업 정리 중 오류: %s", e)
+
+    async def _work(self):
+        while True:
+            jobs = await self._queue.get()
+            self._busy += 1
+            try:
+                await self._deliver_channel(jobs)
+            except Exception as e:
+                logger.error(
+                    "채널 [%s] 전송 작업 처리 중 오류: %s",
+                    jobs[0].channel_id,
+                    e,
+                    extra={"channel_id": jobs[0].channel_id},
+                )
+            finally:
+                self._busy -= 1
+                self._queue.task_done()
+                # 이 채널에 그사이 새로 쌓인 작업을 가져갈 수 있도록 디스패처를 깨움
+                self._wakeup.set()
+
+    async def _deliver_channel(self, jobs: list[DeliveryJob]):
+        """한 채널의 작업을 순서대로 보냅니다. 묶음 전송 채널이면 여러 공지를 메시지 하나로 묶고,
+        실패하면 남은 작업은 순서를 지키기 위해 함께 미룹니다."""
+        deliverable = []
+        for job in jobs:
+            scraper_type = MetaData.collection_name_to_scraper_type(job.collection_name)
+            if scraper_type is None:
+                await asyncio.to_thread(
+                    self.outbox.mark_dead, [job.id], "알 수 없는 게시판", []
+                )
+                continue
+            try:
+                embed = self.broadcaster.render(job.notice, scraper_type)
+            except Exception as e:
+                # 작성일 형식이 잘못된 경우 등: 다시 시도해도 같으므로 바로 포기해
+                # 이 채널의 뒤 작업을 막지 않게 함
+                logger.error(
+                    "채널 [%s] 공지 %s를 만들 수 없어 포기합니다: %s",
+                    job.channel_id,
+                    job.notice.link,
+                    e,
+                    extra={"channel_id": job.channel_id},
+                )
+                await asyncio.to_thread(
+                    self.outbox.mark_dead, [job.id], f"렌더링 실패: {e}", []
+                )
+                continue
+            deliverable.append((job, embed))
+
+        sent = []
+        groups = self.broadcaster.group(deliverable, jobs[0].channel_id)
+        for index, group in enumerate(groups):
+            group_jobs = [job for job, _ in group]
+            title = (
+                group_jobs[0].notice.title
+                if len(group_jobs) == 1
+                else f"공지 {len(group_jobs)}건"
+            )
+            started_at = time.monotonic()
+            outcome = await self.broadcaster.deliver(
+                group_jobs[0].channel_id,
+                [embed for _, embed in group],
+                title,
+                group_jobs[0].channel_type,
+            )
+            self.stats.record(outcome, time.monotonic() - started_at)
+
+            if outcome == SENT:
+                sent += [job.id for job in group_jobs]
+                continue
+
+            # 시도 횟수는 실제로 보낸 묶음만 늘리고, 뒤에 밀린 작업은 그대로 둠
+            remaining = [job for group in groups[index:] for job, _ in group]
+            attempted = [job.id for job in group_jobs]
+            if outcome in (FORBIDDEN, NOT_FOUND):
+                # 채널 단위 실패이므로 남은 작업도 보내지 않음
+                await asyncio.to_thread(
+                    self.outbox.mark_dead, [job.id for job in remaining], outcome, attempted
+                )
+            else:
+                await self._retry_later(remaining, outcome, attempted)
+            break
+
+        if sent:
+            await asyncio.to_thread(self.outbox.mark_sent, sent)
+
+    async def _retry_later(
+        self, jobs: list[DeliveryJob], error: str, attempted: list[int]
+    ):
+        attempts = jobs[0].attempts + 1
+        if attempts >= self.max_attempts:
+            logger.error(
+                "채널 [%s] 전송이 %d번 실패하여 작업 %d개를 포기합니다.",
+                jobs[0].channel_id,
+                attempts,
+                len(jobs),
+                extra={"channel_id": jobs[0].channel_id},
+            )
+            await asyncio.to_thread(
+                self.outbox.mark_dead, [job.id for job in jobs], error, attempted
+            )
+            return
+
+        delay = self.retry_base_delay * 2 ** (attempts - 1)
+        await asyncio.to_thread(
+            self.outbox.mark_retry, [job.id for job in jobs], error, delay, attempted
+        )
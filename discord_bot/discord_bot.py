@@ -1,6 +1,10 @@
+import asyncio
+import importlib
 import discord
 from discord import app_commands
 from discord_bot.scraper_config import ScraperConfig
+from discord_bot.broadcaster import DeliveryStats, NoticeBroadcaster
+from discord_bot.delivery_worker import DeliveryWorker
 from template.scraper_type import ScraperType
 from template.notice_data import NoticeData
 from config.logger_config import setup_logger
@@ -17,27 +21,48 @@ intents.guilds = True  # 서버 목록 확인용
 intents.dm_messages = True  # DM 메시지 허용
 
 
-class NoticeBot(discord.Client):  # discord.Client 클래스를 상속받음
+# SHARD_COUNT가 설정되면 샤드 모드: 이 프로세스는 SHARD_IDS의 샤드만 게이트웨이에 연결
+BaseClient = discord.AutoShardedClient if ENV["SHARD_COUNT"] else discord.Client
+
+
+class NoticeBot(BaseClient):  # discord.Client (샤드 모드에서는 AutoShardedClient)를 상속받음
     def __init__(self):
         # intents 봇이 어떤 이벤트를 받을 수 있는지 지정
-        super().__init__(intents=intents)
+        options = {}
+        if ENV["SHARD_COUNT"]:
+            options = {"shard_count": ENV["SHARD_COUNT"], "shard_ids": ENV["SHARD_IDS"]}
+        super().__init__(intents=intents, **options)
         self.tree = app_commands.CommandTree(self)
         self.scraper_config = ScraperConfig()
+        self.broadcaster = NoticeBroadcaster(self)
+        self.delivery_worker: DeliveryWorker = None  # DELIVERY_OUTBOX 사용 시 main에서 설정
+        # 게이트웨이 로그인과 메타데이터 로딩을 동시에 진행하므로,
+        # 메타데이터가 필요한 명령어 등록은 main에서 이 이벤트를 설정할 때까지 기다림
+        self.metadata_ready = asyncio.Event()
 
     async def setup_hook(self):
         """봇 시작시 실행되는 설정"""
         # commands 폴더의 모든 명령어 로드
+        await self.metadata_ready.wait()
         await self.load_commands()
 
-    async def load_commands(self):
-        """commands 폴더의 모든 명령어를 로드합니다."""
-        from discord_bot.commands import register, test
-
-        # 각 명령어 모듈 등록
-        await register.setup(self)
+    @property
+    def syncs_commands(self) -> bool:
+        """전역 슬래시 커맨드 등록을 맡는 프로세스인지 여부 (샤드 모드에서는 0번 샤드 프로세스만)"""
+        return not ENV["SHARD_IDS"] or 0 in ENV["SHARD_IDS"]
 
+    def command_modules(self) -> list[str]:
+        """등록할 명령어 모듈 목록 (테스트 명령어는 개발 환경에서만)"""
+        modules = ["register"]
         if not ENV["IS_PROD"]:  # IS_PROD 대신 ENV["IS_PROD"] 사용
-            await test.setup(self)
+            modules.append("test")
+        return modules
+
+    async def load_commands(self):
+        """commands 폴더의 명령어를 등록합니다. 모듈은 등록할 때 처음 import합니다."""
+        for name in self.command_modules():
+            module = importlib.import_module(f"discord_bot.commands.{name}")
+            await module.setup(self)
 
 
 client = NoticeBot()  # main.py에서 사용
@@ -46,14 +71,16 @@ client = NoticeBot()  # main.py에서 사용
 @client.event
 async def on_ready():
     """봇이 시작될 때 실행되는 이벤트"""
-    logger.debug(f"봇이 시작되었습니다: {client.user.name}")
+    logger.debug("봇이 시작되었습니다: %s", client.user.name)
+    if not client.syncs_commands:
+        return
 
     try:
         logger.debug("슬래시 커맨드를 전역으로 등록합니다...")
         await client.tree.sync()
         logger.debug("슬래시 커맨드 등록이 완료되었습니다.")
     except Exception as e:
-        logger.error(f"슬래시 커맨드 등록 중 오류 발생: {e}")
+        logger.error("슬래시 커맨드 등록 중 오류 발생: %s", e)
 
     logger.debug("봇이 준비되었습니다!")
 
@@ -61,69 +88,94 @@ async def on_ready():
 @client.event
 async def on_guild_join(guild):
     """봇이 새로운 서버에 참여했을 때 실행됩니다."""
-    logger.info(f"새로운 서버 [{guild.name}]에 참여했습니다.")
+    logger.info("새로운 서버 [%s]에 참여했습니다.", guild.name)
     try:
         await client.tree.sync(guild=guild)
-        logger.info(f"서버 [{guild.name}]에 슬래시 커맨드를 등록했습니다.")
+        logger.info("서버 [%s]에 슬래시 커맨드를 등록했습니다.", guild.name)
     except Exception as e:
-        logger.error(f"서버 [{guild.name}]에 슬래시 커맨드 등록 실패: {e}")
+        logger.error("서버 [%s]에 슬래시 커맨드 등록 실패: %s", guild.name, e)
+
 
+# 공지 전송 권한 캐시 무효화: 서버, 역할, 채널, 봇 자신의 역할이 바뀌면 다시 확인
+@client.event
+async def on_guild_update(before, after):
+    client.broadcaster.invalidate_permissions(after.id)
 
-async def send_notice(notice: NoticeData, scraper_type: ScraperType):
+
+@client.event
+async def on_guild_remove(guild):
+    client.broadcaster.invalidate_permissions(guild.id)
+
+
+@client.event
+async def on_guild_role_create(role):
+    client.broadcaster.invalidate_permissions(role.guild.id)
+
+
+@client.event
+async def on_guild_role_update(before, after):
+    client.broadcaster.invalidate_permissions(after.guild.id)
+
+
+@client.event
+async def on_guild_role_delete(role):
+    client.broadcaster.invalidate_permissions(role.guild.id)
+
+
+@client.event
+async def on_guild_channel_update(before, after):
+    # 카테고리 권한이 바뀌면 하위 채널도 영향을 받으므로 서버 단위로 무효화
+    client.broadcaster.invalidate_permissions(after.guild.id)
+
+
+@client.event
+async def on_guild_channel_delete(channel):
+    client.broadcaster.invalidate_permissions(channel.guild.id, channel.id)
+
+
+@client.event
+async def on_member_update(before, after):
+    if client.user and after.id == client.user.id:
+        client.broadcaster.invalidate_permissions(after.guild.id)
+
+
+async def send_notice(notice: NoticeData, scraper_type: ScraperType) -> DeliveryStats:
     """특정 스크래퍼의 공지사항을 해당하는 모든 채널에 전송합니다."""
+    return await send_notices([notice], scraper_type)
+
+
+async def send_notices(
+    notices: list[NoticeData], scraper_type: ScraperType
+) -> DeliveryStats:
+    """특정 스크래퍼의 공지 목록(보낼 순서대로)을 해당하는 모든 채널에 전송합니다."""
     try:
         await client.wait_until_ready()
+        return await client.broadcaster.broadcast(notices, scraper_type)
+    except Exception as e:
+        logger.error("디스코드 메시지 전송 중 오류 발생: %s", e)
+        return DeliveryStats()
 
-        channels = await client.scraper_config.get_channels_for_scraper(scraper_type)
-        for channel_id in channels:
-            try:
-                channel = client.get_channel(int(channel_id))
-                if not channel:
-                    try:
-                        user = await client.fetch_user(int(channel_id))
-                        channel = user.dm_channel
-                        if not channel:
-                            channel = await user.create_dm()
-                    except:
-                        logger.error(f"사용자 ID {channel_id}를 찾을 수 없습니다.")
-                        continue
-
-                if not isinstance(channel, discord.DMChannel):
-                    permissions = channel.permissions_for(channel.guild.me)
-                    if not permissions.send_messages or not permissions.embed_links:
-                        logger.error(
-                            f"채널 [{channel.name}]에 메시지를 보낼 권한이 없습니다."
-                        )
-                        continue
-
-                embed = discord.Embed(
-                    title=notice.title, url=notice.link, color=discord.Color.blue()
-                )
-
-                # 공지사항 종류 표시
-                embed.add_field(
-                    name="구분", value=scraper_type.korean_name, inline=True
-                )
-
-                if notice.published.year > 1970:
-                    embed.add_field(
-                        name="작성일",
-                        value=notice.published.strftime("%Y-%m-%d"),
-                        inline=True,
-                    )
-
-                await channel.send(embed=embed)
-                logger.info(
-                    f'채널 [{getattr(channel, "name", "DM")}]에 공지사항을 전송했습니다: {notice.title}'
-                )
-
-            except discord.Forbidden:
-                logger.error(
-                    f'채널 [{getattr(channel, "name", "DM")}]에 메시지를 보낼 권한이 없습니다.'
-                )
-            except discord.NotFound:
-                logger.error(f"채널 ID {channel_id}가 존재하지 않습니다.")
-            except Exception as e:
-                logger.error(f"채널 [{channel_id}] 메시지 전송 중 오류: {str(e)}")
+
+async def enqueue_notices(notices: list[NoticeData], scraper_type: ScraperType) -> int:
+    """공지 목록(최신순)을 구독 중인 채널별 전송 작업으로 outbox에 저장합니다.
+    실제 전송은 DeliveryWorker가 하며, 저장에 실패하면 예외를 그대로 전달합니다."""
+    channels = await client.scraper_config.get_channels_with_type_for_scraper(
+        scraper_type
+    )
+    return await client.delivery_worker.enqueue(
+        scraper_type.collection_name, list(reversed(notices)), channels
+    )
+
+
+async def prewarm_dm_channels():
+    """봇 시작 후 모든 DM 구독자의 DM 채널을 미리 찾아둡니다.
+    이후 DM 전송은 fetch_user / create_dm 없이 바로 이루어집니다."""
+    await client.wait_until_ready()
+    try:
+        user_ids = await client.scraper_config.get_direct_message_ids()
+        resolved = await client.broadcaster.prewarm_dm_channels(user_ids)
+        logger.info(
+            "DM 구독자 %d명 중 %d명의 DM 채널을 새로 찾았습니다.", len(user_ids), resolved
+        )
     except Exception as e:
-        logger.error(f"디스코드 메시지 전송 중 오류 발생: {e}")
+        logger.error("DM 채널 미리 찾기 중 오류: %s", e)
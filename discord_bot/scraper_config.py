@@ -1,7 +1,12 @@
+import asyncio
 from typing import List
 from config.logger_config import setup_logger
 from template.scraper_type import ScraperType
 from utils.discord_data_api import *
+from utils.subscription_index import DIRECT_MESSAGES, SERVER_CHANNELS, SubscriptionIndex
+from utils.subscription_sync import SubscriptionReplica
+from utils.subscription_cache import SubscriptionCache
+from config.env_loader import ENV
 
 logger = setup_logger(__name__)
 
@@ -10,25 +15,141 @@ class ScraperConfig:
     """스크래퍼 설정을 관리하는 클래스"""
 
     def __init__(self):
-        pass
+        self.index = SubscriptionIndex()
+        self._index_stale = True
+        self._index_lock = asyncio.Lock()
+        # 구독 테이블의 로컬 사본 (틱마다 바뀐 레코드만 받아 색인에 반영)
+        self.replicas = {
+            channel_type: SubscriptionReplica(
+                f"discord/{channel_type}", ENV["SUBSCRIPTION_FULL_SYNC_INTERVAL"]
+            )
+            for channel_type in (DIRECT_MESSAGES, SERVER_CHANNELS)
+        }
+        self.records = SubscriptionCache(
+            max_size=ENV["SUBSCRIPTION_CACHE_SIZE"],
+            ttl=ENV["SUBSCRIPTION_CACHE_TTL"],
+        )
 
-    async def get_channels_for_scraper(self, scraper_type: ScraperType) -> list:
-        """특정 스크래퍼에 등록된 채널 목록을 반환합니다."""
-        channels = []
+    def invalidate_index(self):
+        """다음 조회 시 구독 색인을 다시 만들도록 표시합니다. (틱마다 한 번 호출)"""
+        self._index_stale = True
 
-        # DM 채널 검색
-        dm_channels = await get_all_direct_messages()
-        for dm in dm_channels:
-            if scraper_type.collection_name in dm["scrapers"]:
-                channels.append(dm["_id"])
+    async def refresh_index(self):
+        """구독 색인을 지금 다시 만듭니다. (대기 중인 프로세스가 캐시를 미리 채워둘 때 사용)"""
+        self.invalidate_index()
+        await self._ensure_index()
+
+    async def _ensure_index(self):
+        """색인이 오래되었으면 구독 테이블 사본을 서버와 맞추고 바뀐 내용만 색인에 반영합니다.
+        전체 목록으로 맞춘 경우(처음, 주기적 재확인, 불일치 발견)에는 색인을 새로 만듭니다."""
+        if not self._index_stale:
+            return
+
+        async with self._index_lock:
+            # 락을 기다리는 동안 다른 작업이 이미 갱신했을 수 있음
+            if not self._index_stale:
+                return
+            try:
+                # 한 사본의 실패가 다른 사본의 변경분까지 버리지 않도록 결과를 따로 받음
+                results = dict(
+                    zip(
+                        self.replicas,
+                        await asyncio.gather(
+                            *(replica.sync() for replica in self.replicas.values()),
+                            return_exceptions=True,
+                        ),
+                    )
+                )
+                failures = {
+                    channel_type: result
+                    for channel_type, result in results.items()
+                    if isinstance(result, BaseException)
+                }
+                if failures and not self.index.is_built:
+                    raise next(iter(failures.values()))
+
+                # 실패한 사본도 변경분 일부를 이미 반영했을 수 있으므로(워터마크도 이동)
+                # 실패가 있으면 사본 전체로 색인을 다시 만들어 사본과 색인을 맞춤
+                if (
+                    failures
+                    or not self.index.is_built
+                    or any(result.full and result for result in results.values())
+                ):
+                    dm_channels = list(self.replicas[DIRECT_MESSAGES].records.values())
+                    server_channels = list(self.replicas[SERVER_CHANNELS].records.values())
+                    self.index.rebuild(dm_channels, server_channels)
+                    self._warm_records(dm_channels, server_channels)
+                    logger.debug("구독 색인을 다시 만들었습니다.")
+                else:
+                    for channel_type, result in results.items():
+                        self._apply_changes(channel_type, result)
+
+                if failures:
+                    # 다음 조회 때 실패한 사본을 다시 동기화
+                    for channel_type, error in failures.items():
+                        logger.error("%s 구독 테이블 동기화 실패: %s", channel_type, error)
+                else:
+                    self._index_stale = False
+            except Exception as e:
+                # 이전 색인이 있다면 그대로 사용하고 다음 조회 때 다시 시도
+                if not self.index.is_built:
+                    raise
+                logger.error("구독 색인 갱신 실패, 이전 색인을 사용합니다: %s", e)
+
+    def _apply_changes(self, channel_type: str, result):
+        """변경분을 색인과 레코드 캐시에 반영합니다."""
+        for record in result.changed:
+            self.index.update(record["_id"], channel_type, record.get("scrapers", []))
+            self.records.put(channel_type, record["_id"], record)
+        for record_id in result.deleted:
+            self.index.remove(record_id)
+            self.records.put(channel_type, record_id, None)
+        if result:
+            logger.debug(
+                "%s 구독 변경 %d건, 삭제 %d건을 반영했습니다.",
+                channel_type,
+                len(result.changed),
+                len(result.deleted),
+            )
 
-        # 서버 채널 검색
-        server_channels = await get_all_server_channels()
+    async def get_direct_message_ids(self) -> list[str]:
+        """DM 구독자 ID 목록을 반환합니다. (구독 테이블 사본 기준)"""
+        await self._ensure_index()
+        return list(self.replicas[DIRECT_MESSAGES].records)
+
+    def _warm_records(self, dm_channels: list, server_channels: list):
+        """전체 목록으로 레코드 캐시를 새 세대로 다시 채웁니다.
+        목록에 없는(외부에서 삭제된) 채널의 이전 항목은 세대가 바뀌어 무효화됩니다."""
+        self.records.invalidate_all()
+        for dm in dm_channels:
+            self.records.put("direct-messages", dm["_id"], dm)
         for server in server_channels:
-            if scraper_type.collection_name in server["scrapers"]:
-                channels.append(server["_id"])
+            self.records.put("server-channels", server["_id"], server)
+
+    async def _get_record(self, channel_id: str, channel_type: str) -> dict:
+        """채널의 구독 레코드를 캐시에서 찾고, 없으면 데이터 서버에서 가져와 캐싱합니다."""
+        hit, record = self.records.get(channel_type, channel_id)
+        if hit:
+            return record
+
+        if channel_type == "direct-messages":
+            record = await get_direct_message(user_id=channel_id)
+        else:
+            record = await get_server_channel(channel_id=channel_id)
+        self.records.put(channel_type, channel_id, record)
+        return record
+
+    async def get_channels_for_scraper(self, scraper_type: ScraperType) -> list:
+        """특정 스크래퍼에 등록된 채널 목록을 반환합니다."""
+        await self._ensure_index()
+        return self.index.get_channels(scraper_type.collection_name)
 
-        return channels
+    async def get_channels_with_type_for_scraper(
+        self, scraper_type: ScraperType
+    ) -> list[tuple[str, str]]:
+        """특정 스크래퍼에 등록된 (채널 ID, 채널 종류) 목록을 반환합니다."""
+        await self._ensure_index()
+        return self.index.get_channels_with_types(scraper_type.collection_name)
 
     async def add_scraper(
         self,
@@ -41,35 +162,71 @@ class ScraperConfig:
         """채널에 스크래퍼를 등록합니다."""
         scraper_name = scraper_type.collection_name
 
+        try:
+            result = await self._add_scraper(
+                channel_id, channel_name, channel_type, scraper_name, guild_name
+            )
+        except Exception:
+            # 서버 반영 여부를 알 수 없으므로 다음 조회 때 다시 가져오도록 함
+            self.records.invalidate(channel_type, channel_id)
+            raise
+
+        if result:
+            self.index.add(scraper_name, channel_id, channel_type)
+        return result
+
+    async def _add_scraper(
+        self,
+        channel_id: str,
+        channel_name: str,
+        channel_type: str,
+        scraper_name: str,
+        guild_name: str = None,
+    ):
+        existing = await self._get_record(channel_id, channel_type)
+        if existing and scraper_name in existing["scrapers"]:
+            return False  # 이미 존재하는 스크래퍼이므로 False 반환
+
         if channel_type == "direct-messages":
-            existing_dm = await get_direct_message(user_id=channel_id)
-            if existing_dm:
-                if scraper_name in existing_dm["scrapers"]:
-                    return False # 이미 존재하는 스크래퍼이므로 False 반환
-                return await update_direct_message(
-                    user_id=channel_id,
-                    scrapers=existing_dm["scrapers"] + [scraper_name],
+            if existing:
+                scrapers = existing["scrapers"] + [scraper_name]
+                result = await update_direct_message(
+                    user_id=channel_id, scrapers=scrapers
                 )
+                record = {**existing, "scrapers": scrapers}
             else:
-                return await create_direct_message( # DM 사용자가 존재하지 않으면 생성
+                result = await create_direct_message( # DM 사용자가 존재하지 않으면 생성
                     user_id=channel_id, user_name=channel_name, scrapers=[scraper_name]
                 )
+                record = {
+                    "_id": channel_id,
+                    "user_name": channel_name,
+                    "scrapers": [scraper_name],
+                }
         else:
-            existing_server = await get_server_channel(channel_id=channel_id)
-            if existing_server:
-                if scraper_name in existing_server["scrapers"]:
-                    return False  # 이미 존재하는 스크래퍼이므로 False 반환
-                return await update_server_channel(
-                    channel_id=channel_id,
-                    scrapers=existing_server["scrapers"] + [scraper_name],
+            if existing:
+                scrapers = existing["scrapers"] + [scraper_name]
+                result = await update_server_channel(
+                    channel_id=channel_id, scrapers=scrapers
                 )
+                record = {**existing, "scrapers": scrapers}
             else:
-                return await create_server_channel( # 서버 채널이 존재하지 않으면 생성
+                result = await create_server_channel( # 서버 채널이 존재하지 않으면 생성
                     guild_name=guild_name,
                     channel_name=channel_name,
                     channel_id=channel_id,
                     scrapers=[scraper_name],
                 )
+                record = {
+                    "_id": channel_id,
+                    "guild_name": guild_name,
+                    "channel_name": channel_name,
+                    "scrapers": [scraper_name],
+                }
+
+        # write-through: 서버에 반영된 내용을 캐시에도 바로 반영
+        self.records.put(channel_type, channel_id, record)
+        return result
 
     async def remove_scraper(
         self, channel_id: str, channel_type: str, scraper_type: ScraperType
@@ -77,39 +234,42 @@ class ScraperConfig:
         """채널에서 스크래퍼를 제거합니다."""
         scraper_name = scraper_type.collection_name
 
+        try:
+            result = await self._remove_scraper(channel_id, channel_type, scraper_name)
+        except Exception:
+            self.records.invalidate(channel_type, channel_id)
+            raise
+
+        if result:
+            self.index.discard(scraper_name, channel_id)
+        return result
+
+    async def _remove_scraper(
+        self, channel_id: str, channel_type: str, scraper_name: str
+    ):
+        existing = await self._get_record(channel_id, channel_type)
+        if not existing:
+            return False
+
+        updated_scrapers = [s for s in existing["scrapers"] if s != scraper_name]
         if channel_type == "direct-messages":
-            existing_dm = await get_direct_message(user_id=channel_id)
-            if existing_dm:
-                updated_scrapers = [
-                    s for s in existing_dm["scrapers"] if s != scraper_name
-                ]
-                return await update_direct_message(
-                    user_id=channel_id, scrapers=updated_scrapers
-                )
+            result = await update_direct_message(
+                user_id=channel_id, scrapers=updated_scrapers
+            )
         else:
-            existing_server = await get_server_channel(channel_id=channel_id)
-            if existing_server:
-                updated_scrapers = [
-                    s for s in existing_server["scrapers"] if s != scraper_name
-                ]
-                return await update_server_channel(
-                    channel_id=channel_id, scrapers=updated_scrapers
-                )
+            result = await update_server_channel(
+                channel_id=channel_id, scrapers=updated_scrapers
+            )
 
-        return False
+        self.records.put(channel_type, channel_id, {**existing, "scrapers": updated_scrapers})
+        return result
 
     async def get_channel_scrapers(
         self, channel_id: str, channel_type: str
     ) -> list[str]:
         """채널에 등록된 스크래퍼 목록을 반환합니다."""
-        if channel_type == "direct-messages":
-            existing_dm = await get_direct_message(user_id=channel_id)
-            if existing_dm:
-                return existing_dm["scrapers"]
-
-        else:
-            existing_server = await get_server_channel(channel_id=channel_id)
-            if existing_server:
-                return existing_server["scrapers"]
+        existing = await self._get_record(channel_id, channel_type)
+        if existing:
+            return existing["scrapers"]
 
         return []
@@ -1,28 +1,75 @@
+import time
+
+# 시작 단계별 소요 시간 측정 기준 (아래 모듈 import 시간 포함)
+STARTED_AT = time.perf_counter()
+
 import asyncio
+import functools
+import signal
 import sys
+from collections import defaultdict
 from datetime import datetime
 import pytz
-from discord_bot.discord_bot import client, send_notice
+from discord_bot.discord_bot import (
+    client,
+    send_notices,
+    enqueue_notices,
+    prewarm_dm_channels,
+)
+from discord_bot.delivery_worker import DeliveryWorker
 from discord.ext import tasks
 from config.logger_config import setup_logger
 from config.env_loader import ENV
-from utils.data_server_conect import get_data_from_server
+from utils.data_server_conect import data_server_client, get_data_from_server
 from utils.enum_data_api import *
 from utils.scraper_data_api import *
 from template.scraper_type_list import MetaData
-from utils.notice_cache import LastNoticeData
+from utils.notice_cache import LastNoticeData, create_cursor_store
+from utils.delivery_outbox import DeliveryOutbox
+from utils.dm_channel_store import DMChannelStore
+from utils.lease import Lease, create_lease
+from utils.startup_timer import StartupTimer
+from utils.push_receiver import PushReceiver
+from utils.poll_scheduler import PollScheduler
+from utils.metrics import (
+    BOARD_FETCH_DURATION,
+    TICK_DURATION,
+    MetricsServer,
+    watch_discord_rate_limits,
+)
 from template.notice_data import NoticeData
+from template.scraper_type import ScraperType
 
+logger = setup_logger(__name__)
 
 if ENV["IS_PROD"]:
     INTERVAL = 60
+    METADATA_INTERVAL = 360
 else:
     INTERVAL = 2
+    METADATA_INTERVAL = 10
+
+# 리더가 아닌 동안 구독 색인과 마지막 공지를 다시 읽어두는 간격(초)
+STANDBY_WARM_INTERVAL = 60
 
 
 print(f"INTERVAL: {INTERVAL}")
 
 
+def cursor_store_path():
+    """cursor 저장소 백엔드에 맞는 파일 경로를 반환합니다."""
+    if ENV["CURSOR_STORE"] == "file":
+        return ENV["STATE_DIR"] / "notice_cursors.jsonl"
+    return ENV["STATE_DIR"] / "state.db"
+
+
+def lease_path():
+    """잠금 백엔드에 맞는 파일 경로를 반환합니다."""
+    if ENV["LEASE_BACKEND"] == "file":
+        return ENV["STATE_DIR"] / "owner.lock"
+    return ENV["STATE_DIR"] / "state.db"
+
+
 def is_working_hour():
     """현재 시간이 작동 시간(월~토 8시~20시)인지 확인합니다."""
     if not ENV["IS_PROD"]:
@@ -41,11 +88,155 @@ def is_working_hour():
     return True
 
 
+# 게시판별 처리 락 (폴링과 푸시가 같은 게시판을 동시에 처리해 중복 전송하지 않도록)
+notice_locks = defaultdict(asyncio.Lock)
+
+
+async def check_notice(
+    scraper_type: ScraperType, new_notice_list: list = None, fetched_from: str = None
+):
+    """한 게시판의 새로운 공지를 확인하고 전송한 뒤, 전송한 공지 목록을 반환합니다. (실패 시 None)
+    게시판별로 오류를 격리하며, 캐시된 마지막 공지는 전송이 끝난 뒤에 갱신합니다.
+    new_notice_list가 주어지면 (배치로 미리 가져온 경우) 그 기준 링크(fetched_from)가
+    현재 캐시와 같을 때만 다시 요청하지 않고 사용합니다."""
+    type_name = scraper_type.collection_name
+    log_extra = {"collection_name": type_name}
+
+    async with notice_locks[type_name]:
+        try:
+            # 최초 실행 또는 새로운 타입일 경우 메시지를 보내지 않고 최근 공지 캐싱
+            if LastNoticeData.links.get(type_name) == None:
+                logger.debug(
+                    '"%s"의 캐시가 없습니다. 마지막 정보를 캐싱합니다.',
+                    scraper_type.name,
+                    extra=log_extra,
+                )
+
+                last_notice = await get_all_notices(type_name, 1)
+                if len(last_notice) == 0:
+                    logger.warning(
+                        '"%s"의 공지가 데이터베이스에 없습니다.',
+                        scraper_type.name,
+                        extra=log_extra,
+                    )
+                    return []
+                last_notice = last_notice[0]
+                LastNoticeData.set(type_name, last_notice.link, last_notice.published_text)
+
+                logger.debug(
+                    '"%s"의 마지막 게시물 "%s"를 캐싱했습니다.',
+                    scraper_type.name,
+                    last_notice.title,
+                    extra=log_extra,
+                )
+                return []
+
+            # 캐싱한 마지막 공지 기준으로 새로운 공지 발견시 메시지 보내기
+            else:
+                # 락을 기다리는 동안 다른 작업(푸시 등)이 먼저 처리했다면 미리 가져온 목록은 버림
+                if fetched_from != LastNoticeData.links[type_name]:
+                    new_notice_list = None
+
+                if new_notice_list is None:
+                    logger.debug(
+                        '"%s"의 새 게시물을 가져옵니다...', scraper_type.name, extra=log_extra
+                    )
+                    with BOARD_FETCH_DURATION.time((type_name,)):
+                        new_notice_list = await get_new_notices(
+                            type_name, LastNoticeData.links[type_name]
+                        )
+
+                logger.debug(
+                    '"%s"의 새 게시물은 %d개 입니다.',
+                    scraper_type.name,
+                    len(new_notice_list),
+                    extra=log_extra,
+                )
+
+                if client.delivery_worker:
+                    # 전송 작업을 먼저 저장한 뒤 마지막 공지를 갱신 (전송은 워커가 따로 진행)
+                    await enqueue_notices(new_notice_list, scraper_type)
+                else:
+                    await send_notices(list(reversed(new_notice_list)), scraper_type)
+
+                if len(new_notice_list) != 0:
+                    LastNoticeData.set(
+                        type_name, new_notice_list[0].link, new_notice_list[0].published_text
+                    )
+                    logger.info(
+                        '"%s"의 마지막 게시물 "%s"를 캐싱했습니다.',
+                        scraper_type.name,
+                        new_notice_list[0].title,
+                        extra=log_extra,
+                    )
+                return new_notice_list
+
+        except Exception as e:
+            logger.error(
+                '"%s" 처리 중 오류 발생: %s', scraper_type.name, e, extra=log_extra
+            )
+            return None
+
+
+async def check_notices(
+    scraper_types: list[ScraperType], trigger: str = "poll"
+) -> dict[str, list]:
+    """주어진 게시판들의 새 공지를 확인하고 전송합니다. (폴링과 푸시에서 공용으로 사용)
+    {collection_name: 새 공지 목록}을 반환하며, 실패한 게시판은 None입니다."""
+    with TICK_DURATION.time((trigger,)):
+        return await _check_notices(scraper_types)
+
+
+async def _check_notices(scraper_types: list[ScraperType]) -> dict[str, list]:
+    # 캐시가 있는 게시판들의 새 공지를 한 번의 요청으로 가져오기
+    # (실패하거나 결과에 없는 게시판은 check_notice에서 개별로 다시 요청)
+    last_links = {
+        scraper_type.collection_name: LastNoticeData.links[scraper_type.collection_name]
+        for scraper_type in scraper_types
+        if LastNoticeData.links.get(scraper_type.collection_name)
+    }
+    try:
+        prefetched = await get_new_notices_batch(
+            last_links, concurrency=ENV["POLL_CONCURRENCY"]
+        )
+    except Exception as e:
+        logger.error("새 게시물 일괄 조회 중 오류: %s", e)
+        prefetched = {}
+
+    # 게시판별 확인 작업을 동시에 실행 (동시 실행 수는 POLL_CONCURRENCY로 제한,
+    # 1이면 기존처럼 하나씩 순서대로 확인)
+    semaphore = asyncio.Semaphore(ENV["POLL_CONCURRENCY"])
+
+    async def check_with_limit(scraper_type):
+        async with semaphore:
+            return await check_notice(
+                scraper_type,
+                prefetched.get(scraper_type.collection_name),
+                last_links.get(scraper_type.collection_name),
+            )
+
+    results = await asyncio.gather(
+        *(check_with_limit(scraper_type) for scraper_type in scraper_types),
+        return_exceptions=True,
+    )
+
+    # 이번에 바뀐 마지막 공지를 한 번에 저장
+    await LastNoticeData.commit()
+
+    return {
+        scraper_type.collection_name: (
+            None if isinstance(result, BaseException) else result
+        )
+        for scraper_type, result in zip(scraper_types, results)
+    }
+
+
 # 개발 배포 테스트 문구
 @tasks.loop(minutes=INTERVAL)
 async def check_all_notice():
     """새로운 ENUM이 있는지 확인합니다.
-    새로운 공지가 있다면 메세지를 보냅니다."""
+    새로운 공지가 있다면 메세지를 보냅니다.
+    푸시 모드에서는 놓친 알림이 없는지 확인하는 느린 점검 주기로 동작합니다."""
 
     try:
         # 작동 시간이 아니면 스킵
@@ -53,63 +244,142 @@ async def check_all_notice():
             current_time = datetime.now(pytz.timezone("Asia/Seoul")).strftime(
                 "%Y-%m-%d %H:%M:%S"
             )
-            logger.info(f"작동 시간이 아닙니다. (현재 시각: {current_time})")
+            logger.info("작동 시간이 아닙니다. (현재 시각: %s)", current_time)
             return
 
-        logger.debug("새로운 카테고리의 유무를 확인합니다...")
-        MetaData.category_list = await get_all_categories()
-        logger.debug("새로운 스크래퍼 타입의 유무를 확인합니다...")
-        MetaData.scraper_type_list = await get_all_scraper_types()
+        # 구독 색인은 이번 틱에서 처음 필요할 때 한 번만 다시 만든다
+        client.scraper_config.invalidate_index()
 
-        for scraper_type in MetaData.scraper_type_list:
-            type_name = scraper_type.collection_name
+        await check_notices(MetaData.scraper_type_list)
 
-            try:
-                # 최초 실행 또는 새로운 타입일 경우 메시지를 보내지 않고 최근 공지 캐싱
-                if LastNoticeData.links.get(type_name) == None:
-                    logger.debug(
-                        f'"{scraper_type.name}"의 캐시가 없습니다. 마지막 정보를 캐싱합니다.'
-                    )
+    except Exception as e:
+        logger.error("새로운 공지사항 확인 중 오류: %s", e)
 
-                    last_notice = await get_all_notices(type_name, 1)
-                    if len(last_notice) == 0:
-                        logger.warning(
-                            f'"{scraper_type.name}"의 공지가 데이터베이스에 없습니다.'
-                        )
-                        continue
-                    last_notice = last_notice[0]
-                    LastNoticeData.links[type_name] = last_notice.link
 
-                    logger.debug(
-                        f'"{scraper_type.name}"의 마지막 게시물 "{last_notice.title}"를 캐싱했습니다.'
-                    )
+async def seed_poll_stats(scheduler: PollScheduler, collection_names: list[str]):
+    """새로 추가된 게시판들의 최근 게시물로 게시 빈도 통계를 초기화합니다."""
+    semaphore = asyncio.Semaphore(ENV["POLL_CONCURRENCY"])
 
-                # 캐싱한 마지막 공지 기준으로 새로운 공지 발견시 메시지 보내기
-                else:
-                    logger.debug(f'"{scraper_type.name}"의 새 게시물을 가져옵니다...')
-                    new_notice_list = await get_new_notices(
-                        type_name, LastNoticeData.links[type_name]
-                    )
+    async def seed(collection_name):
+        async with semaphore:
+            try:
+                scheduler.seed(collection_name, await get_all_notices(collection_name, 10))
+            except Exception as e:
+                logger.error(f'"{collection_name}"의 게시 빈도 통계 초기화 실패: {e}')
 
-                    logger.debug(
-                        f'"{scraper_type.name}"의 새 게시물은 {len(new_notice_list)}개 입니다.'
-                    )
+    await asyncio.gather(*(seed(name) for name in collection_names))
 
-                    for new_notice in reversed(new_notice_list):
-                        await send_notice(new_notice, scraper_type)
 
-                    if len(new_notice_list) != 0:
-                        LastNoticeData.links[type_name] = new_notice_list[0].link
-                        logger.info(
-                            f'"{scraper_type.name}"의 마지막 게시물 "{new_notice_list[0].title}"를 캐싱했습니다.'
-                        )
+async def adaptive_poll_loop():
+    """POLL_MODE=adaptive일 때 check_all_notice 대신 실행되는 확인 루프.
+    게시판별 게시 빈도에 따라 다음 확인 시각을 정하고, 때가 된 게시판만 확인합니다."""
+    await client.wait_until_ready()
 
-            except Exception as e:
-                logger.error(f'"{scraper_type.name}" 처리 중 오류 발생: {e}')
-                continue
+    scheduler = PollScheduler(
+        ENV["POLL_MIN_INTERVAL"] * 60,
+        ENV["POLL_MAX_INTERVAL"] * 60,
+        ENV["POLL_BUDGET_PER_MINUTE"],
+    )
+    index_refreshed_at = 0
 
+    while True:
+        if not is_working_hour():
+            await asyncio.sleep(60)
+            continue
+
+        due = []
+        results = {}
+        try:
+            added = scheduler.sync(
+                [scraper_type.collection_name for scraper_type in MetaData.scraper_type_list]
+            )
+            if added:
+                await seed_poll_stats(scheduler, added)
+
+            due = scheduler.pop_due()
+            if due:
+                # 구독 색인은 최소 확인 간격마다 한 번만 다시 만든다
+                if time.monotonic() - index_refreshed_at >= scheduler.min_interval:
+                    client.scraper_config.invalidate_index()
+                    index_refreshed_at = time.monotonic()
+
+                logger.debug("게시판 %d개를 확인합니다: %s", len(due), due)
+                scraper_types = map(MetaData.collection_name_to_scraper_type, due)
+                results = await check_notices(
+                    [scraper_type for scraper_type in scraper_types if scraper_type]
+                )
+        except Exception as e:
+            logger.error("새로운 공지사항 확인 중 오류: %s", e)
+        finally:
+            for name in due:
+                # 한 게시판의 기록 실패가 루프 전체를 멈추지 않도록 게시판별로 처리
+                try:
+                    scheduler.record(name, results.get(name))
+                except Exception as e:
+                    logger.error("게시판 [%s] 확인 결과 기록 중 오류: %s", name, e)
+
+        await asyncio.sleep(min(max(scheduler.next_due_in(), 1), 60))
+
+
+async def on_notice_push(collection_names: list[str]):
+    """데이터 서버가 새 공지를 알려오면 해당 게시판만 바로 확인합니다."""
+    if not is_working_hour():
+        logger.debug("작동 시간이 아니므로 푸시 알림을 무시합니다: %s", collection_names)
+        return
+
+    scraper_types = [
+        scraper_type
+        for scraper_type in map(MetaData.collection_name_to_scraper_type, collection_names)
+        if scraper_type is not None
+    ]
+    if not scraper_types:
+        logger.warning("알 수 없는 게시판의 푸시 알림입니다: %s", collection_names)
+        return
+
+    logger.debug("푸시 알림으로 게시판 %d개를 확인합니다.", len(scraper_types))
+    await client.wait_until_ready()
+    await check_notices(scraper_types, trigger="push")
+
+
+async def refresh_metadata():
+    """카테고리/스크래퍼 타입 메타데이터를 조건부 요청으로 확인하고, 바뀐 경우에만 갱신합니다.
+    한쪽 요청이 실패해도 바뀐 다른 쪽은 반영한 뒤 오류를 다시 던집니다.
+    (캐시는 받은 즉시 새 ETag를 기억하므로, 여기서 반영하지 않으면 다음 확인 때 바뀐 것으로 보지 않음)"""
+    changed = {}
+    error = None
+    for name, label, cache in (
+        ("category_list", "카테고리", categories_cache),
+        ("scraper_type_list", "스크래퍼 타입", scraper_types_cache),
+    ):
+        logger.debug("새로운 %s의 유무를 확인합니다...", label)
+        try:
+            value, is_changed = await cache.fetch()
+        except Exception as e:
+            error = error or e
+            continue
+        if is_changed:
+            changed[name] = value
+
+    if changed:
+        # 색인이 포함된 새 스냅샷으로 한 번에 교체 (바뀌지 않은 목록은 기존 값 유지)
+        snapshot = MetaData.update(**changed)
+        logger.info(
+            "meta data를 갱신했습니다. (v%d, 카테고리 %d개, 스크래퍼 타입 %d개)",
+            snapshot.version,
+            len(snapshot.category_list),
+            len(snapshot.scraper_type_list),
+        )
+    if error:
+        raise error
+
+
+@tasks.loop(minutes=METADATA_INTERVAL)
+async def refresh_metadata_loop():
+    """메타데이터는 공지 확인보다 긴 주기로 따로 갱신합니다."""
+    try:
+        await refresh_metadata()
     except Exception as e:
-        logger.error(f"새로운 공지사항 확인 중 오류: {e}")
+        logger.error("meta data 갱신 중 오류: %s", e)
 
 
 @check_all_notice.before_loop
@@ -118,8 +388,142 @@ async def before_check():
     await client.wait_until_ready()
 
 
+async def warm_standby():
+    """리더가 아닌 동안 구독 색인과 마지막 공지를 미리 읽어두어, 이어받자마자 바로 확인할 수 있게 합니다.
+    (메타데이터는 refresh_metadata_loop가 모든 프로세스에서 갱신)"""
+    await client.scraper_config.refresh_index()
+    await asyncio.to_thread(LastNoticeData.reload)
+
+
+async def wait_for_ownership(lease: Lease):
+    """owner 잠금을 잡을 때까지 기다립니다. 기다리는 동안 캐시를 주기적으로 채워둡니다."""
+    warmed_at = 0
+    while not await asyncio.to_thread(lease.try_acquire):
+        if time.monotonic() - warmed_at >= STANDBY_WARM_INTERVAL:
+            warmed_at = time.monotonic()
+            try:
+                await warm_standby()
+            except Exception as e:
+                logger.error("대기 중 캐시 갱신 실패: %s", e)
+        await asyncio.sleep(ENV["OWNER_RETRY_INTERVAL"])
+
+    logger.info("owner 잠금을 얻었습니다. 공지 확인과 DM 전송을 맡습니다.")
+    # 이전 owner가 저장한 마지막 공지부터 이어서 확인
+    await asyncio.to_thread(LastNoticeData.reload)
+
+
+async def run_leadership(lease: Lease):
+    """리더 선출: 잠금을 얻으면 owner 작업을 시작하고, 잠금을 연장하지 못하면 멈춘 뒤 다시 기다립니다.
+    샤드 프로세스들이나 여러 레플리카 중 하나만 공지 확인과 DM 전송을 맡게 됩니다."""
+    renew_interval = ENV["LEASE_TTL"] / 3
+    while True:
+        await wait_for_ownership(lease)
+        duties = asyncio.create_task(run_owner_duties())
+        failed = False
+        try:
+            while True:
+                await asyncio.wait({duties}, timeout=renew_interval)
+                if duties.done():
+                    # owner 작업이 멈춘 채 잠금만 연장하면 다른 레플리카가 이어받지 못하므로 내려놓음
+                    error = None if duties.cancelled() else duties.exception()
+                    logger.error("owner 작업이 중단되어 owner 잠금을 내려놓습니다: %s", error)
+                    await asyncio.to_thread(lease.release)
+                    failed = True
+                    break
+                try:
+                    held = await asyncio.to_thread(lease.try_acquire)
+                except Exception as e:
+                    logger.error("owner 잠금 연장 중 오류: %s", e)
+                    held = False
+                if not held:
+                    # 다른 레플리카가 이어받았을 수 있으므로 중복 전송을 막기 위해 바로 멈춤
+                    logger.warning("owner 잠금을 잃었습니다. 공지 확인과 DM 전송을 멈춥니다.")
+                    break
+        finally:
+            duties.cancel()
+            await asyncio.gather(duties, return_exceptions=True)
+            if client.delivery_worker:
+                client.delivery_worker.release_ownership()
+        if failed:
+            # 다른 레플리카가 먼저 잠금을 가져갈 수 있도록 잠시 물러남
+            await asyncio.sleep(ENV["LEASE_TTL"])
+
+
+async def run_owner_duties():
+    """공지 확인(폴링/푸시)과 DM 전송은 owner 프로세스 하나만 맡습니다."""
+    poll_task = None
+    push_receiver = None
+    try:
+        logger.debug("kookmin-feed API 호출 테스크를 시작합니다...")
+        if ENV["POLL_MODE"] == "adaptive":
+            poll_task = asyncio.create_task(adaptive_poll_loop())
+        else:
+            check_all_notice.start()
+
+        # 푸시 모드: 새 공지 알림을 받으면 바로 확인 (폴링은 놓친 알림 점검용으로 유지)
+        if ENV["PUSH_ENABLED"]:
+            push_receiver = PushReceiver(
+                on_notice_push, ENV["PUSH_HOST"], ENV["PUSH_PORT"], ENV["PUSH_SECRET"]
+            )
+            await push_receiver.start()
+        logger.debug("kookmin-feed API 호출 테스크가 정상적으로 시작되었습니다.")
+
+        if client.delivery_worker:
+            client.delivery_worker.take_ownership()
+
+        # 봇이 준비되면 DM 구독자의 DM 채널을 미리 찾아둠
+        await prewarm_dm_channels()
+        # 확인 루프가 오류로 끝나면 owner 작업도 실패로 끝내 리더 교체나 종료가 일어나게 함
+        await (poll_task or check_all_notice.get_task())
+        raise RuntimeError("공지 확인 루프가 종료되었습니다.")
+    finally:
+        loop_task = check_all_notice.get_task()
+        check_all_notice.cancel()
+        if poll_task:
+            poll_task.cancel()
+        # 잠금을 다시 얻었을 때 루프를 다시 시작할 수 있도록 끝날 때까지 기다림
+        await asyncio.gather(
+            *(task for task in (loop_task, poll_task) if task), return_exceptions=True
+        )
+        if push_receiver:
+            await push_receiver.stop()
+
+
+def stop_on_owner_failure(main_task: asyncio.Task, owner_task: asyncio.Task):
+    """owner 작업(공지 확인 시작 등)이 오류로 끝나면 기록하고 봇을 종료합니다.
+    그대로 두면 공지 확인 없이 디스코드 연결만 유지됩니다."""
+    if owner_task.cancelled() or owner_task.exception() is None:
+        return
+    logger.error("owner 작업이 오류로 중단되어 봇을 종료합니다: %s", owner_task.exception())
+    main_task.cancel()
+
+
+async def login(token: str, startup: StartupTimer):
+    """디스코드 로그인. 명령어 등록(setup_hook)은 메타데이터가 준비될 때까지 기다립니다."""
+    with startup.phase("login"):
+        await client.login(token)
+
+
+async def report_startup(startup: StartupTimer):
+    """게이트웨이 연결이 끝나면 시작 단계별 소요 시간을 기록합니다."""
+    await client.wait_until_ready()
+    startup.mark("gateway")
+    logger.info("시작 완료: %s", startup.report())
+
+
 async def main():
+    startup = StartupTimer(STARTED_AT)
+    startup.mark("import")
     logger.info("국민대학교 공지사항 알리미 봇을 시작합니다...")
+    owner_task = None
+    lease = None
+    metrics_server = None
+    login_task = None
+    startup_task = None
+
+    # supervisord 등이 보내는 SIGTERM에도 아래 정리(잠금 반납 등)를 거쳐 종료
+    main_task = asyncio.current_task()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
 
     try:
         # 환경 변수 검증
@@ -128,43 +532,108 @@ async def main():
             raise ValueError(
                 "DISCORD_TOKEN이 설정되지 않았습니다. .env 파일을 확인해주세요."
             )
+        if ENV["SHARD_COUNT"] and not ENV["DELIVERY_OUTBOX"]:
+            # 샤드 프로세스들은 outbox로 전송 작업을 나눠 가짐
+            raise ValueError("샤드 모드(SHARD_COUNT)에서는 DELIVERY_OUTBOX를 꺼둘 수 없습니다.")
+        if ENV["PUSH_ENABLED"] and not ENV["PUSH_SECRET"]:
+            raise ValueError(
+                "PUSH_ENABLED를 사용하려면 PUSH_SECRET 또는 DATA_SERVER_API_KEY를 설정해야 합니다."
+            )
+
+        # 지표 수집 서버는 시작 과정부터 기록하도록 먼저 띄움
+        if ENV["METRICS_ENABLED"]:
+            watch_discord_rate_limits()
+            # 샤드 프로세스마다 포트가 겹치지 않도록 첫 샤드 ID만큼 더함
+            metrics_port = ENV["METRICS_PORT"] + (ENV["SHARD_IDS"] or [0])[0]
+            metrics_server = MetricsServer(ENV["METRICS_HOST"], metrics_port)
+            await metrics_server.start()
+
+        # 디스코드 로그인은 아래 데이터 서버 확인, 상태 복원, 메타데이터 로딩과 동시에 진행
+        login_task = asyncio.create_task(login(discord_token, startup))
+
+        # data server 공용 세션 생성 및 connection 테스트
+        with startup.phase("connect-check"):
+            await data_server_client.open()
+            logger.debug("Data Server 연결 상태를 검사합니다...")
+            await get_data_from_server(endpoint="connect-check")
+
+        with startup.phase("state"):
+            # 저장된 게시판별 마지막 공지를 불러와 중단된 지점부터 이어서 확인
+            LastNoticeData.open(
+                create_cursor_store(ENV["CURSOR_STORE"], cursor_store_path())
+            )
+            logger.debug("저장된 마지막 공지 %d개를 불러왔습니다.", len(LastNoticeData.links))
 
-        # data server connection 테스트
-        logger.debug("Data Server 연결 상태를 검사합니다...")
-        await get_data_from_server(endpoint="connect-check")
+            # 저장된 DM 채널 매핑을 불러옴 (나머지 DM 구독자는 owner가 미리 찾아둠)
+            client.broadcaster.open_dm_store(
+                DMChannelStore(ENV["STATE_DIR"] / "state.db")
+            )
 
-        logger.debug("meta data를 초기화합니다.")
+            # 전송 작업 outbox: 재시작 전에 보내지 못한 작업도 이어서 전송
+            if ENV["DELIVERY_OUTBOX"]:
+                client.delivery_worker = DeliveryWorker(
+                    client, DeliveryOutbox(ENV["STATE_DIR"] / "state.db")
+                )
+                client.delivery_worker.start()
 
-        MetaData.category_list = await get_all_categories()
-        logger.debug("카테고리 meta data 초기화 완료.")
+        logger.debug("meta data를 초기화합니다.")
+        with startup.phase("metadata"):
+            await refresh_metadata()
+        client.metadata_ready.set()
+        logger.debug("meta data 초기화 완료.")
 
-        MetaData.scraper_type_list = await get_all_scraper_types()
-        logger.debug("스크래퍼 타입 meta data를 초기화 완료.")
+        refresh_metadata_loop.start()
 
-        logger.debug("kookmin-feed API 호출 테스크를 시작합니다...")
-        check_all_notice.start()
-        logger.debug("kookmin-feed API 호출 테스크가 정상적으로 시작되었습니다.")
+        # 샤드 모드나 리더 선출을 쓰면 잠금을 잡은 프로세스 하나만 공지 확인과 DM 전송을 맡음
+        if ENV["SHARD_COUNT"] or ENV["LEADER_ELECTION"]:
+            lease = create_lease(ENV["LEASE_BACKEND"], lease_path(), ENV["LEASE_TTL"])
+            owner_task = asyncio.create_task(run_leadership(lease))
+        else:
+            owner_task = asyncio.create_task(run_owner_duties())
+        owner_task.add_done_callback(functools.partial(stop_on_owner_failure, main_task))
 
         logger.debug("디스코드 봇을 시작합니다...")
-        await client.start(discord_token)
+        await login_task
+        startup_task = asyncio.create_task(report_startup(startup))
+        await client.connect()
 
     except ValueError as e:
         logger.error(str(e))
         sys.exit(1)
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("\n프로그램을 종료합니다...")
     except Exception as e:
-        logger.error(f"오류 발생: {e}")
+        logger.error("오류 발생: %s", e)
     finally:
-        check_all_notice.cancel()
+        for task in (login_task, startup_task):
+            if task:
+                task.cancel()
+        if owner_task:
+            owner_task.cancel()
+            await asyncio.gather(owner_task, return_exceptions=True)
+        refresh_metadata_loop.cancel()
+        if metrics_server:
+            await metrics_server.stop()
+        if client.delivery_worker:
+            await client.delivery_worker.stop()
         await client.close()
+        await data_server_client.close()
+        try:
+            await LastNoticeData.commit()
+        except Exception as e:
+            logger.error("마지막 공지 저장 중 오류: %s", e)
+        LastNoticeData.close()
+        if client.delivery_worker:
+            client.delivery_worker.outbox.close()
+        if client.broadcaster.dm_store:
+            client.broadcaster.dm_store.close()
+        if lease:
+            lease.release()
+            lease.close()
         await asyncio.get_event_loop().shutdown_asyncgens()
 
 
 if __name__ == "__main__":
-
-    logger = setup_logger(__name__)
-
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -1,15 +1,76 @@
-from dataclasses import dataclass
 from datetime import datetime
 from template.scraper_type import ScraperType
 
-@dataclass
+
 class NoticeData:
-    """bs4,rss로 가져온 데이터를 표현하는 클래스"""
+    """bs4,rss로 가져온 데이터를 표현하는 클래스
+
+    한 번 만들면 바꿀 수 없으며, 인스턴스마다 __dict__를 두지 않습니다.
+    published는 서버가 준 ISO 형식 문자열로 받아 두었다가 처음 읽을 때 datetime으로 바꿉니다.
+    (링크만 쓰고 버려지는 공지는 날짜를 파싱하지 않음)
+    """
+
+    __slots__ = ("title", "link", "scraper_type", "_published", "_published_text")
+
+    def __init__(
+        self,
+        title: str,
+        link: str,
+        published: datetime | str,
+        scraper_type: ScraperType,
+    ):
+        initialize = object.__setattr__
+        initialize(self, "title", title)
+        initialize(self, "link", link)
+        initialize(self, "scraper_type", scraper_type)
+        if isinstance(published, str):
+            initialize(self, "_published", None)
+            initialize(self, "_published_text", published)
+        else:
+            initialize(self, "_published", published)
+            initialize(self, "_published_text", None)
+
+    @property
+    def published(self) -> datetime:
+        if self._published is None:
+            object.__setattr__(self, "_published", datetime.fromisoformat(self._published_text))
+        return self._published
+
+    @property
+    def published_text(self) -> str:
+        """작성일의 ISO 형식 문자열. 문자열로 받은 경우 파싱하지 않고 그대로 반환합니다."""
+        if self._published_text is None:
+            return self._published.isoformat()
+        return self._published_text
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"NoticeData는 변경할 수 없습니다: {name}")
 
-    title: str
-    link: str
-    published: datetime
-    scraper_type: ScraperType
+    def __delattr__(self, name):
+        raise AttributeError(f"NoticeData는 변경할 수 없습니다: {name}")
+
+    def __reduce__(self):
+        published = self._published_text if self._published is None else self._published
+        return NoticeData, (self.title, self.link, published, self.scraper_type)
+
+    def __eq__(self, other):
+        if other.__class__ is not NoticeData:
+            return NotImplemented
+        return (self.title, self.link, self.published, self.scraper_type) == (
+            other.title,
+            other.link,
+            other.published,
+            other.scraper_type,
+        )
+
+    def __hash__(self):
+        return hash((self.title, self.link))
+
+    def __repr__(self):
+        return (
+            f"NoticeData(title={self.title!r}, link={self.link!r}, "
+            f"published={self.published_text!r}, scraper_type={self.scraper_type!r})"
+        )
 
     def __str__(self):
         return (
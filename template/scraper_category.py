@@ -1,6 +1,8 @@
 
 class ScraperCategory:
 
+    __slots__ = ("name", "korean_name", "scraper_collection_names")
+
     def __init__(self, name: str, korean_name: str, scraper_collection_names: list):
         self.name = name
         self.korean_name = korean_name
@@ -2,6 +2,8 @@ from discord import app_commands
 
 class ScraperType:
 
+    __slots__ = ("korean_name", "collection_name", "name")
+
     scraper_type_list = []
 
     def __init__(self, korean_name: str = None,
@@ -10,6 +12,9 @@ class ScraperType:
         self.collection_name = scraper_colloction_name
         self.name = scraper_type_name
 
+    def __repr__(self):
+        return f"ScraperType({self.collection_name!r})"
+
     def json_to_scraper_type(self, json):
         di = dict(json)
 
@@ -1,41 +1,125 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from template.scraper_type import *
 from template.scraper_category import *
 
+
+@dataclass(frozen=True)
+class MetaDataSnapshot:
+    """특정 시점의 카테고리/스크래퍼 타입 목록과 미리 계산한 조회용 색인.
+
+    한 번 만들어지면 바뀌지 않으며, 메타데이터가 갱신되면 새 스냅샷으로 통째로 교체됩니다.
+    """
+
+    version: int = 0
+    category_list: tuple = ()
+    scraper_type_list: tuple = ()
+    type_by_name: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+    type_by_collection_name: MappingProxyType = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    category_by_name: MappingProxyType = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    types_by_category_name: MappingProxyType = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    @staticmethod
+    def build(
+        version: int,
+        category_list: list[ScraperCategory],
+        scraper_type_list: list[ScraperType],
+    ) -> "MetaDataSnapshot":
+        type_by_name = {}
+        type_by_collection_name = {}
+        for scraper_type in scraper_type_list:
+            # 이름이 중복되면 기존 선형 탐색처럼 먼저 나온 타입을 사용
+            type_by_name.setdefault(scraper_type.name, scraper_type)
+            type_by_collection_name.setdefault(
+                scraper_type.collection_name, scraper_type
+            )
+
+        category_by_name = {}
+        types_by_category_name = {}
+        for category in category_list:
+            category_by_name.setdefault(category.name, category)
+            names = set(category.scraper_collection_names)
+            types_by_category_name.setdefault(
+                category.name,
+                tuple(
+                    scraper_type
+                    for scraper_type in scraper_type_list
+                    if scraper_type.name in names
+                ),
+            )
+
+        return MetaDataSnapshot(
+            version=version,
+            category_list=tuple(category_list),
+            scraper_type_list=tuple(scraper_type_list),
+            type_by_name=MappingProxyType(type_by_name),
+            type_by_collection_name=MappingProxyType(type_by_collection_name),
+            category_by_name=MappingProxyType(category_by_name),
+            types_by_category_name=MappingProxyType(types_by_category_name),
+        )
+
+
 class MetaData:
-    category_list: list[ScraperCategory] = []
-    scraper_type_list: list[ScraperType] = []
+    snapshot: MetaDataSnapshot = MetaDataSnapshot()
+    category_list: tuple[ScraperCategory, ...] = ()
+    scraper_type_list: tuple[ScraperType, ...] = ()
+    _unknown_types: dict[str, ScraperType] = {}
 
     @staticmethod
-    def get_scraper_type_in_category(category: ScraperCategory) -> list[ScraperType]:
-        ret = []
+    def update(
+        category_list: list[ScraperCategory] = None,
+        scraper_type_list: list[ScraperType] = None,
+    ) -> MetaDataSnapshot:
+        """새 스냅샷을 만들어 한 번에 교체합니다. 주어지지 않은 목록은 기존 값을 유지합니다."""
+        current = MetaData.snapshot
+        snapshot = MetaDataSnapshot.build(
+            current.version + 1,
+            current.category_list if category_list is None else category_list,
+            current.scraper_type_list if scraper_type_list is None else scraper_type_list,
+        )
 
-        for scraper_type in MetaData.scraper_type_list:
-            if scraper_type.name in category.scraper_collection_names:
-                ret.append(scraper_type)
+        # await 없이 연달아 대입하므로 다른 코루틴이 중간 상태를 볼 수 없음
+        MetaData.snapshot = snapshot
+        MetaData.category_list = snapshot.category_list
+        MetaData.scraper_type_list = snapshot.scraper_type_list
+        return snapshot
 
-        return ret
+    @staticmethod
+    def get_scraper_type_in_category(category: ScraperCategory) -> list[ScraperType]:
+        return list(MetaData.snapshot.types_by_category_name.get(category.name, ()))
 
     @staticmethod
     def get_scraper_type_in_category_name(category_name: str) -> list[ScraperType]:
-        category = None
-        for cate in MetaData.category_list:
-            if cate.name == category_name:
-                category = cate
-                break
-        
-        if category == None:
-            return []
-
-        ret = []
-
-        for scraper_type in MetaData.scraper_type_list:
-            if scraper_type.name in category.scraper_collection_names:
-                ret.append(scraper_type)
-        return ret
-    
+        return list(MetaData.snapshot.types_by_category_name.get(category_name, ()))
+
+    @staticmethod
+    def name_to_category(category_name: str) -> ScraperCategory:
+        return MetaData.snapshot.category_by_name.get(category_name)
+
     @staticmethod
     def name_to_scraper_type(scraper_name: str) -> ScraperType:
-        for type_ in MetaData.scraper_type_list:
-            if type_.name == scraper_name:
-                return type_
-        return None
\ No newline at end of file
+        return MetaData.snapshot.type_by_name.get(scraper_name)
+
+    @staticmethod
+    def collection_name_to_scraper_type(collection_name: str) -> ScraperType:
+        return MetaData.snapshot.type_by_collection_name.get(collection_name)
+
+    @staticmethod
+    def intern_scraper_type(collection_name: str) -> ScraperType:
+        """collection_name에 해당하는 공유 ScraperType을 반환합니다.
+        메타데이터에 아직 없는 게시판이면 collection_name만 채운 타입을 한 번 만들어 재사용합니다."""
+        scraper_type = MetaData.snapshot.type_by_collection_name.get(collection_name)
+        if scraper_type is not None:
+            return scraper_type
+        scraper_type = MetaData._unknown_types.get(collection_name)
+        if scraper_type is None:
+            scraper_type = MetaData._unknown_types[collection_name] = ScraperType(
+                collection_name, collection_name, collection_name
+            )
+        return scraper_type
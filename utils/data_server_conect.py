@@ -1,29 +1,253 @@
+import asyncio
+import random
+import time
 import aiohttp
 from config.env_loader import ENV
+from config.logger_config import setup_logger
+from utils.metrics import DATA_SERVER_REQUEST_DURATION
+
+logger = setup_logger(__name__)
+
+# 여러 번 보내도 결과가 같아 재시도해도 안전한 메서드
+IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+
+
+class DataServerError(Exception):
+    """데이터 서버 요청 실패의 기본 예외"""
+
+
+class DataServerTransientError(DataServerError):
+    """잠시 후 다시 시도하면 성공할 수 있는 실패 (연결 오류, 타임아웃, 5xx, 429)"""
+
+
+class DataServerUnavailableError(DataServerTransientError):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않고 바로 실패한 경우"""
+
+
+class DataServerResponseError(DataServerError):
+    """데이터 서버가 200이 아닌 응답을 반환했을 때 발생하는 예외"""
+
+    def __init__(self, status: int, text: str):
+        super().__init__(f"API 호출 실패: {status} - {text}")
+        self.status = status
+
+
+class DataServerNotFoundError(DataServerResponseError):
+    """요청한 데이터가 없음 (404)"""
+
+
+class DataServerAuthError(DataServerResponseError):
+    """API 키가 없거나 권한이 없음 (401, 403)"""
+
+
+class DataServerServerError(DataServerResponseError, DataServerTransientError):
+    """서버 내부 오류 또는 요청 제한 (5xx, 429)"""
+
+
+def response_error(status: int, text: str) -> DataServerResponseError:
+    """응답 코드에 맞는 예외 객체를 만듭니다."""
+    if status == 404:
+        return DataServerNotFoundError(status, text)
+    if status in (401, 403):
+        return DataServerAuthError(status, text)
+    if status >= 500 or status == 429:
+        return DataServerServerError(status, text)
+    return DataServerResponseError(status, text)
+
+
+class CircuitBreaker:
+    """연속으로 실패하면 일정 시간 동안 요청을 막아, 서버 장애 중에는 바로 실패하도록 합니다.
+
+    reset_timeout이 지나면 다음 요청을 시험 삼아 보내고(half-open),
+    성공하면 다시 닫히고 실패하면 다시 열립니다.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def is_open(self) -> bool:
+        return (
+            self.opened_at is not None
+            and time.monotonic() - self.opened_at < self.reset_timeout
+        )
+
+    def allow(self) -> bool:
+        return not self.is_open
+
+    def record_success(self):
+        if self.opened_at is not None:
+            logger.info("데이터 서버가 복구되어 서킷 브레이커를 닫습니다.")
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if not self.is_open:
+                logger.error(
+                    "데이터 서버 요청이 %d번 연속 실패하여 %.0f초 동안 요청을 차단합니다.",
+                    self.failures,
+                    self.reset_timeout,
+                )
+            self.opened_at = time.monotonic()
+
+
+class DataServerClient:
+    """데이터 서버와의 HTTP 통신에 사용하는 공용 세션을 관리하는 클래스.
+
+    커넥션 풀(keep-alive, DNS 캐시, 호스트별 연결 수 제한)을 가진 하나의
+    aiohttp.ClientSession을 프로그램 전체에서 재사용합니다.
+    main.main()에서 open()으로 열고 종료 시 close()로 닫습니다.
+    """
+
+    def __init__(self):
+        self.session: aiohttp.ClientSession = None
+        self.breaker = CircuitBreaker(
+            ENV["CIRCUIT_FAILURE_THRESHOLD"], ENV["CIRCUIT_RESET_TIMEOUT"]
+        )
+
+    @property
+    def is_open(self) -> bool:
+        return self.session is not None and not self.session.closed
+
+    async def open(self):
+        """커넥션 풀과 세션을 생성합니다. 이미 열려 있다면 아무것도 하지 않습니다."""
+        if self.is_open:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=ENV["DATA_SERVER_POOL_SIZE"],
+            limit_per_host=ENV["DATA_SERVER_POOL_PER_HOST"],
+            ttl_dns_cache=ENV["DATA_SERVER_DNS_TTL"],
+            keepalive_timeout=ENV["DATA_SERVER_KEEPALIVE"],
+        )
+        self.session = aiohttp.ClientSession(
+            headers={"Authorization": f"Bearer {ENV['DATA_SERVER_API_KEY']}"},
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=ENV["DATA_SERVER_TIMEOUT"]),
+        )
+
+    async def close(self):
+        """세션과 커넥션 풀을 닫습니다."""
+        if self.is_open:
+            await self.session.close()
+        self.session = None
+
+    async def request(
+        self, method: str, endpoint: str, params: dict = None, data: dict = None
+    ):
+        """공용 세션으로 요청을 보내고 JSON 응답을 반환합니다."""
+
+        async def send(url: str):
+            async with self.session.request(
+                method, url, params=params, json=data
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                raise response_error(response.status, await response.text())
+
+        return await self._call(method, endpoint, send)
+
+    async def request_raw(
+        self, method: str, endpoint: str, params: dict = None, headers: dict = None
+    ) -> tuple[int, dict, bytes]:
+        """응답 코드와 헤더, 본문을 그대로 반환합니다. (조건부 요청 등 200 외 응답 처리용)
+        재시도가 필요한 응답(5xx, 429)은 예외로 처리합니다."""
+
+        async def send(url: str):
+            async with self.session.request(
+                method, url, params=params, headers=headers
+            ) as response:
+                if response.status >= 500 or response.status == 429:
+                    raise response_error(response.status, await response.text())
+                return response.status, dict(response.headers), await response.read()
+
+        return await self._call(method, endpoint, send)
+
+    async def _call(self, method: str, endpoint: str, send):
+        """서킷 브레이커를 확인하고, 멱등 메서드는 일시적인 실패 시 지터를 둔 지수 백오프로 재시도합니다."""
+        # open() 전에 호출되는 경우(테스트 명령어 등)를 위해 지연 생성
+        if not self.is_open:
+            await self.open()
+
+        url = f"http://{ENV['DATA_SERVER_URL']}/{endpoint}"
+        retries = ENV["DATA_SERVER_RETRIES"] if method in IDEMPOTENT_METHODS else 0
+
+        for attempt in range(retries + 1):
+            if not self.breaker.allow():
+                raise DataServerUnavailableError(
+                    f"{method} 요청 차단: {url} - 데이터 서버 장애로 요청을 잠시 차단 중입니다."
+                )
+
+            started_at = time.perf_counter()
+            status = "error"
+            try:
+                try:
+                    result = await send(url)
+                    status = result[0] if isinstance(result, tuple) else 200
+                except DataServerResponseError as e:
+                    status = e.status
+                    raise
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    # 네트워크 연결 오류, 타임아웃
+                    raise DataServerTransientError(
+                        f"{method} 연결 실패: {url} - {str(e) or type(e).__name__}"
+                    ) from e
+                finally:
+                    DATA_SERVER_REQUEST_DURATION.observe(
+                        time.perf_counter() - started_at, (method, endpoint, str(status))
+                    )
+            except DataServerTransientError as e:
+                self.breaker.record_failure()
+                if attempt >= retries:
+                    raise
+                delay = random.uniform(
+                    0,
+                    min(
+                        ENV["DATA_SERVER_RETRY_MAX_DELAY"],
+                        ENV["DATA_SERVER_RETRY_BASE_DELAY"] * 2**attempt,
+                    ),
+                )
+                logger.warning(
+                    "%s %s 요청 실패, %.2f초 후 다시 시도합니다. (%d/%d): %s",
+                    method,
+                    endpoint,
+                    delay,
+                    attempt + 1,
+                    retries,
+                    e,
+                    extra={"endpoint": endpoint},
+                )
+                await asyncio.sleep(delay)
+                continue
+            except DataServerError:
+                # 404, 401 등은 서버가 정상적으로 응답한 것
+                self.breaker.record_success()
+                raise
+
+            self.breaker.record_success()
+            return result
+
+
+# 프로그램 전체에서 공유하는 데이터 서버 클라이언트
+data_server_client = DataServerClient()
+
 
 async def request_to_server(method: str, endpoint: str, params: dict = None, data: dict = None):
     """HTTP 요청을 처리하는 공통 함수."""
-    base_url = ENV["DATA_SERVER_URL"]
-    apikey = ENV["DATA_SERVER_API_KEY"]
-    url = f"http://{base_url}/{endpoint}"
-    headers = {"Authorization": f"Bearer {apikey}"}
+    url = f"http://{ENV['DATA_SERVER_URL']}/{endpoint}"
 
     try:
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.request(method, url, params=params, json=data) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    raise Exception(f"API 호출 실패: {response.status} - {await response.text()}")
-    except aiohttp.ClientError as e:
-        # 네트워크 연결 오류만 여기서 처리
-        raise Exception(f"{method} 연결 실패: {url} - {str(e)}")
+        return await data_server_client.request(method, endpoint, params=params, data=data)
+    except DataServerError:
+        raise
     except Exception as e:
-        if "API 호출 실패" in str(e):
-            raise
-        else:
-            # 예상치 못한 다른 예외
-            raise Exception(f"{method} 요청 중 오류: {url} - {str(e)}")
+        # 예상치 못한 다른 예외
+        raise DataServerError(f"{method} 요청 중 오류: {url} - {str(e)}") from e
 
 async def get_data_from_server(endpoint: str, params: dict = None):
     """데이터 서버에 데이터를 GET 요청으로 전송합니다."""
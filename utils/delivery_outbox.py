@@ -0,0 +1,289 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from template.notice_data import NoticeData
+from template.scraper_type_list import MetaData
+
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+DEAD = "dead"
+
+
+@dataclass
+class DeliveryJob:
+    """공지 하나를 채널 하나에 보내는 작업"""
+
+    id: int
+    collection_name: str
+    channel_id: str
+    notice: NoticeData
+    attempts: int
+    channel_type: str = None  # direct-messages / server-channels (이전 버전 작업은 None)
+
+
+class DeliveryOutbox:
+    """보낼 공지를 (공지, 채널) 단위 작업으로 저장하는 SQLite 기반 outbox.
+
+    폴링 루프는 작업을 넣기만 하고, 전송 워커가 꺼내어 보냅니다.
+    같은 (게시판, 링크, 채널) 작업은 한 번만 저장되므로 재시작 후 다시 넣어도 중복 전송되지 않습니다.
+    한 채널의 작업은 한 번에 한 워커만 가져가므로 채널별 전송 순서가 유지됩니다.
+    SQLite 파일을 같은 호스트의 여러 프로세스(샤드)가 함께 쓸 수 있으며,
+    각 프로세스는 claim()의 accept로 자기가 보낼 채널만 가져갑니다.
+    """
+
+    def __init__(self, path: Path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS delivery_job (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                dedup_key TEXT NOT NULL UNIQUE,
+                collection_name TEXT NOT NULL,
+                channel_id TEXT NOT NULL,
+                channel_type TEXT,
+                notice TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                claimed_until REAL,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS delivery_job_ready
+                ON delivery_job (status, next_attempt_at);
+            CREATE INDEX IF NOT EXISTS delivery_job_channel
+                ON delivery_job (channel_id, status);
+            """
+        )
+        self._migrate()
+        # 여러 스레드(asyncio.to_thread)에서 같은 연결을 쓰므로 한 번에 하나씩 실행
+        self._lock = threading.Lock()
+
+    def _migrate(self):
+        """channel_type 열이 없던 이전 버전의 파일에 열을 추가합니다."""
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(delivery_job)")]
+        if "channel_type" in columns:
+            return
+        try:
+            self.conn.execute("ALTER TABLE delivery_job ADD COLUMN channel_type TEXT")
+        except sqlite3.OperationalError:
+            pass  # 다른 프로세스가 먼저 추가함
+
+    def enqueue(
+        self,
+        collection_name: str,
+        notices: list[NoticeData],
+        channels: list[tuple[str, str]],
+    ) -> int:
+        """공지 목록(보낼 순서대로)을 (채널 ID, 채널 종류) 목록에 보내는 작업을 한 트랜잭션으로 저장합니다.
+        이미 저장된 작업은 건너뛰며, 새로 저장된 작업 수를 반환합니다."""
+        now = time.time()
+        rows = [
+            (
+                f"{collection_name}|{notice.link}|{channel_id}",
+                collection_name,
+                channel_id,
+                channel_type,
+                _dump_notice(notice),
+                PENDING,
+                now,
+                now,
+                now,
+            )
+            for notice in notices
+            for channel_id, channel_type in channels
+        ]
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                before = self.conn.total_changes
+                self.conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO delivery_job (
+                        dedup_key, collection_name, channel_id, channel_type, notice,
+                        status, next_attempt_at, created_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                inserted = self.conn.total_changes - before
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return inserted
+
+    def claim(
+        self, max_channels: int, lease_seconds: float, accept=None
+    ) -> list[list[DeliveryJob]]:
+        """보낼 때가 된 작업을 채널 단위로 가져옵니다.
+
+        다른 워커가 보내는 중인 채널은 건너뛰고, 채널마다 작업을 오래된 순서로 묶어 반환합니다.
+        lease_seconds 안에 완료 처리되지 않은 작업은 (프로세스 종료 등) 다시 가져갈 수 있게 됩니다.
+        accept(channel_id, channel_type, created_at)가 주어지면 True를 반환한 채널만 가져갑니다.
+        """
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                # 보내는 도중 중단된 작업을 되돌림
+                self.conn.execute(
+                    "UPDATE delivery_job SET status = ? WHERE status = ? AND claimed_until <= ?",
+                    (PENDING, SENDING, now),
+                )
+                candidates = self.conn.execute(
+                    """
+                    SELECT channel_id, MAX(channel_type), MIN(created_at) FROM delivery_job
+                    WHERE status = ? AND next_attempt_at <= ?
+                      AND channel_id NOT IN (
+                          SELECT channel_id FROM delivery_job WHERE status = ?
+                      )
+                    GROUP BY channel_id
+                    ORDER BY MIN(id)
+                    """,
+                    (PENDING, now, SENDING),
+                )
+                channel_ids = []
+                for channel_id, channel_type, created_at in candidates:
+                    if accept is None or accept(channel_id, channel_type, created_at):
+                        channel_ids.append(channel_id)
+                        if len(channel_ids) >= max_channels:
+                            break
+                if not channel_ids:
+                    self.conn.execute("COMMIT")
+                    return []
+
+                placeholders = ",".join("?" * len(channel_ids))
+                rows = self.conn.execute(
+                    f"""
+                    SELECT id, collection_name, channel_id, notice, attempts, channel_type
+                    FROM delivery_job
+                    WHERE status = ? AND next_attempt_at <= ? AND channel_id IN ({placeholders})
+                    ORDER BY id
+                    """,
+                    [PENDING, now, *channel_ids],
+                ).fetchall()
+                self.conn.executemany(
+                    "UPDATE delivery_job SET status = ?, claimed_until = ?, updated_at = ? WHERE id = ?",
+                    [(SENDING, now + lease_seconds, now, row[0]) for row in rows],
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+        batches = {}
+        for job_id, collection_name, channel_id, notice, attempts, channel_type in rows:
+            batches.setdefault(channel_id, []).append(
+                DeliveryJob(
+                    job_id,
+                    collection_name,
+                    channel_id,
+                    _load_notice(notice, collection_name),
+                    attempts,
+                    channel_type,
+                )
+            )
+        return list(batches.values())
+
+    def mark_sent(self, job_ids: list[int]):
+        self._update(job_ids, SENT, None, None)
+
+    def mark_retry(
+        self, job_ids: list[int], error: str, delay: float, attempted: list[int] = None
+    ):
+        """잠시 후 다시 보내도록 되돌립니다.
+        attempted는 실제로 보내려다 실패한 작업으로, 이 작업만 시도 횟수를 늘립니다. (None이면 전체)"""
+        self._update(job_ids, PENDING, error, time.time() + delay, attempted)
+
+    def mark_dead(self, job_ids: list[int], error: str, attempted: list[int] = None):
+        """더 이상 재시도하지 않는 작업(dead letter)으로 표시합니다. attempted는 mark_retry와 같습니다."""
+        self._update(job_ids, DEAD, error, None, attempted)
+
+    def _update(
+        self,
+        job_ids: list[int],
+        status: str,
+        error: str,
+        next_attempt_at: float,
+        attempted: list[int] = None,
+    ):
+        now = time.time()
+        attempted = set(job_ids if attempted is None else attempted)
+        with self._lock:
+            self.conn.executemany(
+                """
+                UPDATE delivery_job SET
+                    status = ?,
+                    attempts = attempts + ?,
+                    last_error = ?,
+                    next_attempt_at = COALESCE(?, next_attempt_at),
+                    claimed_until = NULL,
+                    updated_at = ?
+                WHERE id = ?
+                """,
+                [
+                    (status, int(job_id in attempted), error, next_attempt_at, now, job_id)
+                    for job_id in job_ids
+                ],
+            )
+
+    def depth(self) -> int:
+        """아직 보내지 않은 작업 수를 반환합니다."""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM delivery_job WHERE status IN (?, ?)",
+                (PENDING, SENDING),
+            ).fetchone()[0]
+
+    def next_attempt_in(self) -> float:
+        """가장 빨리 보낼 수 있는 작업까지 남은 시간(초)을 반환합니다. 작업이 없으면 None."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT MIN(next_attempt_at) FROM delivery_job WHERE status = ?",
+                (PENDING,),
+            ).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def purge(self, older_than: float):
+        """완료되었거나 dead letter가 된 지 older_than초가 지난 작업을 지웁니다."""
+        with self._lock:
+            self.conn.execute(
+                "DELETE FROM delivery_job WHERE status IN (?, ?) AND updated_at < ?",
+                (SENT, DEAD, time.time() - older_than),
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+def _dump_notice(notice: NoticeData) -> str:
+    return json.dumps(
+        {
+            "title": notice.title,
+            "link": notice.link,
+            "published": notice.published_text,
+        },
+        ensure_ascii=False,
+    )
+
+
+def _load_notice(data: str, collection_name: str) -> NoticeData:
+    item = json.loads(data)
+    return NoticeData(
+        title=item["title"],
+        link=item["link"],
+        published=item["published"],
+        scraper_type=MetaData.intern_scraper_type(collection_name),
+    )
@@ -1,4 +1,4 @@
-from utils.data_server_conect import request_to_server
+from utils.data_server_conect import DataServerNotFoundError, request_to_server
 
 # Direct Messages
 async def get_all_direct_messages():
@@ -13,9 +13,9 @@ async def create_direct_message(user_id: str, user_name: str, scrapers: list):
 async def get_direct_message(user_id: str):
     """특정 유저의 Direct Message(DM)를 조회합니다."""
     params = {"user_id": user_id}
-    try: 
+    try:
         return await request_to_server("GET", "discord/direct-message", params=params)
-    except:
+    except DataServerNotFoundError:
         return None
     
 
@@ -49,7 +49,7 @@ async def get_server_channel(channel_id: str):
     params = {"channel_id": channel_id}
     try:
         return await request_to_server("GET", "discord/server-channel", params=params)
-    except:
+    except DataServerNotFoundError:
         return None
 
 async def update_server_channel(channel_id: str, scrapers: list):
@@ -0,0 +1,53 @@
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+
+class DMChannelStore:
+    """DM 사용자 ID → DM 채널 ID 매핑을 로컬 SQLite 파일에 저장하는 저장소.
+
+    봇과 사용자 사이의 DM 채널 ID는 바뀌지 않으므로, 한 번 찾은 채널은
+    재시작 후에도 fetch_user / create_dm 없이 바로 사용할 수 있습니다.
+    """
+
+    def __init__(self, path: Path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS dm_channel (
+                user_id TEXT PRIMARY KEY,
+                channel_id INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[str, int]:
+        """저장된 모든 매핑을 {user_id: channel_id} 형태로 한 번에 읽습니다."""
+        rows = self.conn.execute("SELECT user_id, channel_id FROM dm_channel").fetchall()
+        return {user_id: channel_id for user_id, channel_id in rows}
+
+    def save(self, user_id: str, channel_id: int):
+        with self._lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO dm_channel (user_id, channel_id, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(user_id) DO UPDATE SET
+                    channel_id = excluded.channel_id,
+                    updated_at = excluded.updated_at
+                """,
+                (user_id, channel_id, datetime.now().isoformat()),
+            )
+
+    def delete(self, user_id: str):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM dm_channel WHERE user_id = ?", (user_id,))
+
+    def close(self):
+        self.conn.close()
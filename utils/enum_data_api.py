@@ -1,13 +1,81 @@
-from utils.data_server_conect import request_to_server
+import hashlib
+import json
+from utils.data_server_conect import (
+    data_server_client,
+    request_to_server,
+    response_error,
+)
+from utils.metrics import CACHE_REQUESTS
 from template.scraper_category import ScraperCategory
 from template.scraper_type import ScraperType
 
+
+def _to_category_list(response: list) -> list[ScraperCategory]:
+    return [ScraperCategory(category["name"], category["korean_name"], category["scraper_type_names"]) for category in response]
+
+def _to_scraper_type_list(response: list) -> list[ScraperType]:
+    return [ScraperType(scraper_type["korean_name"], scraper_type["collection_name"], scraper_type["type_name"]) for scraper_type in response]
+
 async def get_all_categories():
     """모든 카테고리 리스트를 가져옵니다."""
     response = await request_to_server("GET", "scraper/categories")
-    return [ScraperCategory(category["name"], category["korean_name"], category["scraper_type_names"]) for category in response]
+    return _to_category_list(response)
 
 async def get_all_scraper_types():
     """모든 공지사항 타입을 가져옵니다."""
     response = await request_to_server("GET", "scraper/types")
-    return [ScraperType(scraper_type["korean_name"], scraper_type["collection_name"], scraper_type["type_name"]) for scraper_type in response]
+    return _to_scraper_type_list(response)
+
+
+class ConditionalCache:
+    """거의 바뀌지 않는 메타데이터를 조건부 요청으로 가져오는 캐시.
+
+    ETag / Last-Modified를 If-None-Match / If-Modified-Since로 다시 보내고,
+    304 응답이거나 본문 해시가 이전과 같으면 다시 파싱하지 않습니다.
+    """
+
+    def __init__(self, endpoint: str, parse):
+        self.endpoint = endpoint
+        self.parse = parse
+        self.etag = None
+        self.last_modified = None
+        self.digest = None
+        self.value = None
+
+    async def fetch(self) -> tuple[list, bool]:
+        """(현재 값, 이전과 달라졌는지 여부)를 반환합니다."""
+        headers = {}
+        if self.value is not None:
+            if self.etag:
+                headers["If-None-Match"] = self.etag
+            if self.last_modified:
+                headers["If-Modified-Since"] = self.last_modified
+
+        status, response_headers, body = await data_server_client.request_raw(
+            "GET", self.endpoint, headers=headers
+        )
+
+        if status == 304 and self.value is not None:
+            CACHE_REQUESTS.inc(("metadata", "hit"))
+            return self.value, False
+        if status != 200:
+            raise response_error(status, body.decode(errors="replace"))
+
+        self.etag = response_headers.get("ETag")
+        self.last_modified = response_headers.get("Last-Modified")
+
+        # 서버가 캐시 헤더를 주지 않아도 본문이 같으면 파싱을 건너뜀
+        digest = hashlib.sha256(body).hexdigest()
+        if digest == self.digest and self.value is not None:
+            CACHE_REQUESTS.inc(("metadata", "hit"))
+            return self.value, False
+
+        CACHE_REQUESTS.inc(("metadata", "miss"))
+
+        self.value = self.parse(json.loads(body))
+        self.digest = digest
+        return self.value, True
+
+
+categories_cache = ConditionalCache("scraper/categories", _to_category_list)
+scraper_types_cache = ConditionalCache("scraper/types", _to_scraper_type_list)
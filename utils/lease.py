@@ -0,0 +1,150 @@
+import fcntl
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+class Lease(ABC):
+    """여러 프로세스/레플리카 중 하나만 가질 수 있는 잠금(lease)의 기본 클래스.
+
+    try_acquire()는 잠금을 얻거나, 이미 가지고 있으면 연장합니다.
+    가지고 있던 잠금을 잃으면(만료 후 다른 곳이 가져감) False를 반환합니다.
+    """
+
+    @abstractmethod
+    def try_acquire(self) -> bool: ...
+
+    @abstractmethod
+    def release(self): ...
+
+    @property
+    @abstractmethod
+    def held(self) -> bool: ...
+
+    def close(self):
+        pass
+
+
+class FileLease(Lease):
+    """같은 호스트의 여러 프로세스 중 하나만 잡을 수 있는 파일 잠금.
+
+    잠금은 파일 디스크립터에 걸리므로, 잡고 있던 프로세스가 비정상 종료되어도
+    운영체제가 바로 풀어주고 다른 프로세스가 이어받을 수 있습니다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd: int = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """기다리지 않고 잠금을 시도합니다. 이미 잡고 있거나 잡으면 True."""
+        if self._fd is not None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        # 누가 잡고 있는지 확인할 수 있도록 PID를 기록
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+class SQLiteLease(Lease):
+    """SQLite 파일의 한 행으로 관리하는 만료 시간(TTL)이 있는 잠금.
+
+    가진 쪽은 ttl보다 짧은 간격으로 try_acquire()를 불러 연장해야 하며,
+    연장이 끊기면(프로세스 종료, 이벤트 루프 멈춤 등) ttl 후에 다른 레플리카가 가져갑니다.
+    여러 컨테이너가 같은 파일을 볼 수 있는 볼륨에 두면 레플리카 간 리더 선출에 쓸 수 있습니다.
+    """
+
+    def __init__(self, path: Path, ttl: float, name: str = "owner"):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS lease (
+                name TEXT PRIMARY KEY,
+                holder TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self.ttl = ttl
+        self.name = name
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._held = False
+        self._lock = threading.Lock()
+
+    @property
+    def held(self) -> bool:
+        return self._held
+
+    def try_acquire(self) -> bool:
+        """비어 있거나 만료된 잠금을 가져오고, 이미 가지고 있으면 만료 시간을 연장합니다."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.execute(
+                    """
+                    INSERT INTO lease (name, holder, expires_at) VALUES (?, ?, ?)
+                    ON CONFLICT(name) DO UPDATE SET
+                        holder = excluded.holder,
+                        expires_at = excluded.expires_at
+                    WHERE lease.holder = excluded.holder OR lease.expires_at <= ?
+                    """,
+                    (self.name, self.holder, now + self.ttl, now),
+                )
+                row = self.conn.execute(
+                    "SELECT holder FROM lease WHERE name = ?", (self.name,)
+                ).fetchone()
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        self._held = row is not None and row[0] == self.holder
+        return self._held
+
+    def release(self):
+        """가지고 있던 잠금을 바로 내려놓아, 다음 레플리카가 만료를 기다리지 않게 합니다."""
+        with self._lock:
+            self.conn.execute(
+                "DELETE FROM lease WHERE name = ? AND holder = ?", (self.name, self.holder)
+            )
+        self._held = False
+
+    def close(self):
+        self.conn.close()
+
+
+def create_lease(backend: str, path: Path, ttl: float) -> Lease:
+    """설정된 백엔드 이름으로 잠금을 생성합니다.
+    다른 공유 저장소(데이터베이스 등)를 쓰려면 Lease를 상속해 여기에 추가합니다."""
+    if backend == "file":
+        return FileLease(path)
+    if backend == "sqlite":
+        return SQLiteLease(path, ttl)
+    raise ValueError(f"지원하지 않는 잠금 백엔드입니다: {backend}")
@@ -0,0 +1,247 @@
+import bisect
+import logging
+import time
+from aiohttp import web
+from config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class Metric:
+    """라벨 값 조합별로 값을 모으는 지표의 기본 클래스.
+
+    기록은 딕셔너리 갱신뿐이고, 문자열 변환은 /metrics를 조회할 때만 합니다.
+    """
+
+    type = None
+
+    def __init__(self, name: str, documentation: str, label_names: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.values: dict[tuple, object] = {}
+
+    def samples(self):
+        """(이름 접미사, 라벨 값, 값) 목록을 반환합니다."""
+        return [("", labels, value) for labels, value in self.values.items()]
+
+    def _format_labels(self, labels: tuple, extra: dict = None) -> str:
+        pairs = list(zip(self.label_names, labels))
+        if extra:
+            pairs += extra.items()
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for suffix, labels, value, *extra in self.samples():
+            label_text = self._format_labels(labels, extra[0] if extra else None)
+            lines.append(f"{self.name}{suffix}{label_text} {value}")
+        return lines
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter(Metric):
+    """증가만 하는 누적 값 (요청 수, 429 응답 수 등)"""
+
+    type = "counter"
+
+    def inc(self, labels: tuple = (), amount: float = 1):
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    """현재 값. callback을 주면 조회할 때마다 callback()으로 값을 읽습니다.
+    (callback은 값 하나 또는 {라벨 값 튜플: 값} 딕셔너리를 반환)"""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple = (), callback=None):
+        super().__init__(name, documentation, label_names)
+        self.callback = callback
+
+    def set(self, value: float, labels: tuple = ()):
+        self.values[labels] = value
+
+    def samples(self):
+        if self.callback is None:
+            return super().samples()
+        try:
+            value = self.callback()
+        except Exception as e:
+            logger.error("지표 %s 값을 읽는 중 오류: %s", self.name, e)
+            return []
+        if isinstance(value, dict):
+            return [("", labels, item) for labels, item in value.items()]
+        return [("", (), value)]
+
+
+class Histogram(Metric):
+    """값의 분포를 구간(bucket)별 누적 개수로 모읍니다. (지연 시간 등, 단위는 초)"""
+
+    type = "histogram"
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, name: str, documentation: str, label_names: tuple = (), buckets=None):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(buckets or self.DEFAULT_BUCKETS)
+
+    def observe(self, value: float, labels: tuple = ()):
+        state = self.values.get(labels)
+        if state is None:
+            # [구간별 개수..., +Inf 개수, 합계]
+            state = self.values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect.bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def time(self, labels: tuple = ()):
+        """with 블록의 실행 시간을 기록합니다."""
+        return _Timer(self, labels)
+
+    def samples(self):
+        samples = []
+        for labels, state in self.values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), state):
+                cumulative += count
+                samples.append(("_bucket", labels, cumulative, {"le": bound}))
+            samples.append(("_sum", labels, state[-1]))
+            samples.append(("_count", labels, cumulative))
+        return samples
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: tuple):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.started_at, self.labels)
+
+
+class Registry:
+    """등록된 지표들을 Prometheus 텍스트 형식으로 내보냅니다."""
+
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics.values():
+            lines += metric.render()
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# 폴링
+TICK_DURATION = REGISTRY.register(
+    Histogram(
+        "notice_tick_duration_seconds",
+        "게시판 확인 한 번(틱)에 걸린 시간 (trigger: poll 또는 push)",
+        ("trigger",),
+    )
+)
+BOARD_FETCH_DURATION = REGISTRY.register(
+    Histogram(
+        "notice_board_fetch_duration_seconds",
+        "게시판 하나의 새 공지를 가져오는 데 걸린 시간",
+        ("collection_name",),
+    )
+)
+
+# 데이터 서버
+DATA_SERVER_REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "data_server_request_duration_seconds",
+        "데이터 서버 요청 한 번(재시도는 각각)에 걸린 시간",
+        ("method", "endpoint", "status"),
+    )
+)
+
+# 디스코드 전송
+DISCORD_SEND_DURATION = REGISTRY.register(
+    Histogram(
+        "discord_send_duration_seconds",
+        "디스코드 채널 하나에 메시지를 보내는 데 걸린 시간",
+        ("outcome",),
+    )
+)
+DISCORD_RATE_LIMITED = REGISTRY.register(
+    Counter("discord_rate_limited_total", "디스코드 API가 429로 응답한 횟수", ("scope",))
+)
+
+# 캐시
+CACHE_REQUESTS = REGISTRY.register(
+    Counter("cache_requests_total", "캐시 조회 수", ("cache", "result"))
+)
+
+
+class DiscordRateLimitCounter(logging.Filter):
+    """discord.py는 429 응답을 내부에서 기다렸다가 다시 보내므로 예외로 알 수 없습니다.
+    대신 discord.http 로거의 rate limit 경고를 세어 지표로 남깁니다.
+    핸들러가 아닌 필터로 세므로 기록은 그대로 원래 출력(핸들러가 없으면 stderr)으로 나갑니다."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = str(record.msg)
+        if message.startswith("We are being rate limited"):
+            DISCORD_RATE_LIMITED.inc(("route",))
+        elif message.startswith("Global rate limit"):
+            DISCORD_RATE_LIMITED.inc(("global",))
+        return True
+
+
+def watch_discord_rate_limits():
+    http_logger = logging.getLogger("discord.http")
+    if not any(isinstance(item, DiscordRateLimitCounter) for item in http_logger.filters):
+        http_logger.addFilter(DiscordRateLimitCounter())
+        if http_logger.getEffectiveLevel() > logging.WARNING:
+            http_logger.setLevel(logging.WARNING)
+
+
+class MetricsServer:
+    """GET /metrics 로 지표를 내보내는 작은 HTTP 서버 (Prometheus 수집용)"""
+
+    def __init__(self, host: str, port: int, registry: Registry = REGISTRY):
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self.runner: web.AppRunner = None
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle_metrics)
+        return app
+
+    async def start(self):
+        self.runner = web.AppRunner(self.build_app(), access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, self.host, self.port).start()
+        logger.info("지표 수집 서버를 시작했습니다. (%s:%s)", self.host, self.port)
+
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+        self.runner = None
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            text=self.registry.render(),
+            content_type="text/plain",
+            charset="utf-8",
+        )
@@ -1,2 +1,208 @@
+import asyncio
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+
+
+class CursorStore(ABC):
+    """게시판별 마지막 공지(cursor)를 저장하는 저장소의 기본 클래스"""
+
+    @abstractmethod
+    def load(self) -> dict[str, tuple[str, str]]:
+        """저장된 모든 cursor를 {collection_name: (link, published)} 형태로 한 번에 읽습니다."""
+
+    @abstractmethod
+    def save_many(self, cursors: dict[str, tuple[str, str]]):
+        """여러 cursor를 하나의 원자적인 쓰기로 저장합니다."""
+
+    def close(self):
+        pass
+
+
+class MemoryCursorStore(CursorStore):
+    """재시작 시 사라지는 메모리 저장소 (기존 동작)"""
+
+    def __init__(self):
+        self.cursors = {}
+
+    def load(self):
+        return dict(self.cursors)
+
+    def save_many(self, cursors):
+        self.cursors.update(cursors)
+
+
+class SQLiteCursorStore(CursorStore):
+    """로컬 SQLite 파일에 cursor를 저장하는 저장소"""
+
+    def __init__(self, path: Path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS notice_cursor (
+                collection_name TEXT PRIMARY KEY,
+                link TEXT NOT NULL,
+                published TEXT,
+                updated_at TEXT NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    def load(self):
+        rows = self.conn.execute(
+            "SELECT collection_name, link, published FROM notice_cursor"
+        ).fetchall()
+        return {name: (link, published) for name, link, published in rows}
+
+    def save_many(self, cursors):
+        now = datetime.now().isoformat()
+        # with 블록 하나가 하나의 트랜잭션 (전부 저장되거나 전부 취소됨)
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO notice_cursor (collection_name, link, published, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(collection_name) DO UPDATE SET
+                    link = excluded.link,
+                    published = excluded.published,
+                    updated_at = excluded.updated_at
+                """,
+                [
+                    (name, link, published, now)
+                    for name, (link, published) in cursors.items()
+                ],
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+class AppendOnlyFileCursorStore(CursorStore):
+    """cursor 묶음을 JSON 한 줄씩 덧붙여 저장하는 저장소.
+
+    한 번의 저장은 한 줄로 기록되므로, 쓰는 도중 종료되어 잘린 마지막 줄은
+    읽을 때 무시됩니다. 파일이 커지면 최신 상태만 남기도록 다시 씁니다.
+    """
+
+    COMPACT_LINES = 1000
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.line_count = 0
+
+    def load(self):
+        cursors = {}
+        self.line_count = 0
+        if not self.path.exists():
+            return cursors
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    batch = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 비정상 종료로 잘린 줄
+                cursors.update({name: tuple(value) for name, value in batch.items()})
+                self.line_count += 1
+        return cursors
+
+    def save_many(self, cursors):
+        if self.line_count >= self.COMPACT_LINES:
+            self._compact(cursors)
+            return
+
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(cursors, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.line_count += 1
+
+    def _compact(self, cursors):
+        """현재 상태 전체를 임시 파일에 쓰고 원자적으로 교체합니다."""
+        merged = self.load()
+        merged.update(cursors)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(merged, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.line_count = 1
+
+
+def create_cursor_store(backend: str, path: Path) -> CursorStore:
+    """설정된 백엔드 이름으로 cursor 저장소를 생성합니다."""
+    if backend == "sqlite":
+        return SQLiteCursorStore(path)
+    if backend == "file":
+        return AppendOnlyFileCursorStore(path)
+    if backend == "memory":
+        return MemoryCursorStore()
+    raise ValueError(f"지원하지 않는 cursor 저장소입니다: {backend}")
+
+
 class LastNoticeData:
-    links = {}
\ No newline at end of file
+    """게시판별로 마지막으로 처리한 공지를 관리합니다.
+
+    links는 메모리의 현재 값이고, set()으로 바뀐 값은 틱이 끝날 때
+    commit()으로 한 번에 저장소에 기록됩니다.
+    """
+
+    links = {}
+    published = {}
+    store: CursorStore = MemoryCursorStore()
+    _pending = {}
+    _commit_lock = asyncio.Lock()
+
+    @classmethod
+    def open(cls, store: CursorStore):
+        """저장소를 연결하고 저장된 cursor를 한 번에 읽어옵니다."""
+        cls.store = store
+        for name, (link, published) in store.load().items():
+            cls.links[name] = link
+            cls.published[name] = published
+
+    @classmethod
+    def reload(cls):
+        """다른 프로세스가 그동안 저장한 cursor로 메모리의 값을 교체합니다.
+        (샤드 프로세스가 공지 확인을 이어받을 때 사용)"""
+        cursors = cls.store.load()
+        cls.links = {name: link for name, (link, _) in cursors.items()}
+        cls.published = {name: published for name, (_, published) in cursors.items()}
+        cls._pending = {}
+
+    @classmethod
+    def set(cls, collection_name: str, link: str, published: datetime | str = None):
+        """게시판의 마지막 공지를 갱신하고 다음 commit() 때 저장되도록 표시합니다.
+        published는 datetime 또는 ISO 형식 문자열입니다."""
+        if isinstance(published, datetime):
+            published = published.isoformat()
+        cls.links[collection_name] = link
+        cls.published[collection_name] = published
+        cls._pending[collection_name] = (link, published)
+
+    @classmethod
+    async def commit(cls):
+        """이번 틱에서 바뀐 cursor를 한 번의 쓰기로 저장합니다."""
+        async with cls._commit_lock:
+            if not cls._pending:
+                return
+            pending, cls._pending = cls._pending, {}
+            try:
+                await asyncio.to_thread(cls.store.save_many, pending)
+            except Exception:
+                # 다음 commit 때 다시 시도 (그 사이 더 새로운 값이 있으면 그 값을 우선)
+                cls._pending = {**pending, **cls._pending}
+                raise
+
+    @classmethod
+    def close(cls):
+        cls.store.close()
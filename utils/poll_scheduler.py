@@ -0,0 +1,147 @@
+import heapq
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from template.notice_data import NoticeData
+from config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class BoardStats:
+    """게시판 하나의 게시 빈도 통계"""
+
+    last_published: datetime = None
+    mean_gap: float = None  # 게시물 사이 간격의 지수 이동 평균 (초)
+    empty_polls: int = 0  # 새 게시물 없이 연속으로 확인한 횟수
+
+
+class PollScheduler:
+    """게시판별 다음 확인 시각을 우선순위 큐로 관리하는 적응형 스케줄러.
+
+    자주 게시되는 게시판은 짧은 간격으로, 드물게 게시되는 게시판은 긴 간격으로 확인하며,
+    전체 확인 횟수는 분당 예산(budget_per_minute)을 넘지 않습니다.
+    """
+
+    SMOOTHING = 0.3  # 새 간격을 평균에 반영하는 비율
+    POLLS_PER_GAP = 4  # 평균 게시 간격 동안 확인할 횟수
+    BACKOFF = 1.5  # 새 게시물이 없을 때마다 간격을 늘리는 배수
+
+    def __init__(
+        self, min_interval: float, max_interval: float, budget_per_minute: float
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.budget_per_minute = budget_per_minute
+        self.tokens = budget_per_minute
+        self.refilled_at = time.monotonic()
+        self.stats: dict[str, BoardStats] = {}
+        self._queue: list[tuple[float, str]] = []
+        self._due_at: dict[str, float] = {}
+
+    def sync(self, collection_names: list[str]) -> list[str]:
+        """현재 게시판 목록과 맞춥니다. 새로 추가된 게시판 이름을 반환하며, 바로 확인하도록 예약됩니다."""
+        names = set(collection_names)
+        for name in list(self.stats):
+            if name not in names:
+                del self.stats[name]
+                self._due_at.pop(name, None)
+
+        added = [name for name in collection_names if name not in self.stats]
+        now = time.monotonic()
+        for name in added:
+            self.stats[name] = BoardStats()
+            self._schedule(name, now)
+        return added
+
+    def seed(self, collection_name: str, notices: list[NoticeData]):
+        """최근 게시물 목록(최신순)으로 게시 간격 통계를 초기화합니다."""
+        stats = self.stats.setdefault(collection_name, BoardStats())
+        for notice in reversed(notices):
+            self._observe(stats, notice)
+
+    def next_due_in(self) -> float:
+        """가장 먼저 확인할 게시판까지 남은 시간(초)을 반환합니다."""
+        self._drop_stale()
+        if not self._queue:
+            return self.max_interval
+        return max(0.0, self._queue[0][0] - time.monotonic())
+
+    def pop_due(self) -> list[str]:
+        """확인할 때가 된 게시판들을 예산 안에서 꺼냅니다. 예산을 넘는 게시판은 다음 차례로 미룹니다."""
+        now = time.monotonic()
+        self._refill(now)
+
+        due = []
+        while self._queue and self.tokens >= 1:
+            due_at, name = self._queue[0]
+            if self._due_at.get(name) != due_at:
+                heapq.heappop(self._queue)  # 다시 예약되었거나 삭제된 항목
+                continue
+            if due_at > now:
+                break
+            heapq.heappop(self._queue)
+            del self._due_at[name]
+            self.tokens -= 1
+            due.append(name)
+        return due
+
+    def record(self, collection_name: str, new_notices: list[NoticeData]):
+        """확인 결과를 반영하고 다음 확인 시각을 예약합니다. (new_notices가 None이면 실패)"""
+        stats = self.stats.get(collection_name)
+        if stats is None:
+            return  # 확인하는 동안 게시판 목록에서 빠진 경우
+
+        if new_notices:
+            stats.empty_polls = 0
+            for notice in reversed(new_notices):
+                self._observe(stats, notice)
+        elif new_notices is not None:
+            stats.empty_polls += 1
+
+        self._schedule(collection_name, time.monotonic() + self.interval_for(collection_name))
+
+    def interval_for(self, collection_name: str) -> float:
+        """게시판의 다음 확인 간격(초)을 계산합니다."""
+        stats = self.stats.get(collection_name)
+        if stats is None or stats.mean_gap is None:
+            interval = self.min_interval
+        else:
+            interval = stats.mean_gap / self.POLLS_PER_GAP
+            interval *= self.BACKOFF**stats.empty_polls
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def _observe(self, stats: BoardStats, notice: NoticeData):
+        """게시물 하나의 작성일을 통계에 반영합니다.
+        작성일이 잘못되었거나 시간대 유무가 섞여 비교할 수 없으면 그 게시물만 건너뜁니다."""
+        try:
+            published = notice.published
+            if published is None or published.year <= 1970:
+                return
+            if stats.last_published is not None and published > stats.last_published:
+                gap = (published - stats.last_published).total_seconds()
+                if stats.mean_gap is None:
+                    stats.mean_gap = gap
+                else:
+                    stats.mean_gap += self.SMOOTHING * (gap - stats.mean_gap)
+            if stats.last_published is None or published > stats.last_published:
+                stats.last_published = published
+        except (ValueError, TypeError) as e:
+            logger.warning("게시 간격 통계에 반영할 수 없는 게시물입니다: %s (%s)", notice.link, e)
+
+    def _schedule(self, collection_name: str, due_at: float):
+        self._due_at[collection_name] = due_at
+        heapq.heappush(self._queue, (due_at, collection_name))
+
+    def _refill(self, now: float):
+        elapsed = now - self.refilled_at
+        self.refilled_at = now
+        self.tokens = min(
+            self.budget_per_minute,
+            self.tokens + elapsed * self.budget_per_minute / 60,
+        )
+
+    def _drop_stale(self):
+        while self._queue and self._due_at.get(self._queue[0][1]) != self._queue[0][0]:
+            heapq.heappop(self._queue)
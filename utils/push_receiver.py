@@ -0,0 +1,69 @@
+import asyncio
+import hmac
+from aiohttp import web
+from config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class PushReceiver:
+    """데이터 서버가 새 공지를 알려주는 웹훅을 받는 작은 HTTP 서버.
+
+    POST /notices/push 로 {"collection_names": [...]} 또는 {"collection_name": "..."}를
+    받으면 바로 202로 응답하고, 해당 게시판 확인(on_push)은 백그라운드에서 실행합니다.
+    """
+
+    def __init__(self, on_push, host: str, port: int, secret: str):
+        if not secret:
+            # 비어 있으면 "Bearer None" 같은 값으로 누구나 인증을 통과할 수 있음
+            raise ValueError(
+                "푸시 알림 수신에는 PUSH_SECRET 또는 DATA_SERVER_API_KEY가 필요합니다."
+            )
+        self.on_push = on_push
+        self.host = host
+        self.port = port
+        self.secret = secret
+        self.runner: web.AppRunner = None
+        self._tasks = set()
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/notices/push", self.handle_push)
+        return app
+
+    async def start(self):
+        self.runner = web.AppRunner(self.build_app(), access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, self.host, self.port).start()
+        logger.info("푸시 알림 수신 서버를 시작했습니다. (%s:%s)", self.host, self.port)
+
+    async def stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        if self.runner:
+            await self.runner.cleanup()
+        self.runner = None
+
+    async def handle_push(self, request: web.Request) -> web.Response:
+        authorization = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(authorization, f"Bearer {self.secret}"):
+            return web.json_response({"error": "unauthorized"}, status=401)
+
+        try:
+            body = await request.json()
+            collection_names = body.get("collection_names") or [body["collection_name"]]
+            if not all(isinstance(name, str) for name in collection_names):
+                raise ValueError
+        except Exception:
+            return web.json_response({"error": "invalid body"}, status=400)
+
+        task = asyncio.create_task(self._run(collection_names))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return web.json_response({"accepted": collection_names}, status=202)
+
+    async def _run(self, collection_names: list[str]):
+        try:
+            await self.on_push(collection_names)
+        except Exception as e:
+            logger.error("푸시 알림 처리 중 오류: %s - %s", collection_names, e)
@@ -1,31 +1,79 @@
-from utils.data_server_conect import request_to_server
+import asyncio
+from utils.data_server_conect import DataServerResponseError, request_to_server
 from template.notice_data import NoticeData
-from datetime import datetime
+from template.scraper_type_list import MetaData
+
+# 배치 엔드포인트를 지원하지 않는 서버의 응답 코드
+BATCH_UNSUPPORTED_STATUS = (404, 405, 501)
+
+
+class _BatchSupport:
+    """서버가 배치 엔드포인트를 지원하는지 기억합니다. (한 번 실패하면 다시 시도하지 않음)"""
+
+    supported = True
+
+
+def _to_notice_list(response: list, notice_type: str) -> list[NoticeData]:
+    # 작성일은 처음 읽을 때 파싱하고, 게시판 타입은 모든 공지가 같은 객체를 공유
+    scraper_type = MetaData.intern_scraper_type(notice_type)
+    return [
+        NoticeData(item["title"], item["link"], item["published"], scraper_type)
+        for item in response
+    ]
 
 async def get_all_notices(notice_type: str = None, list_size: int = 10):
     """모든 공지사항 리스트를 가져옵니다."""
     params = {"notice_type": notice_type, "list_size": list_size}
     response = await request_to_server("GET", "notices/all", params=params)
-    return [
-        NoticeData(
-            title=item["title"],
-            link=item["link"],
-            published=datetime.fromisoformat(item["published"]),
-            scraper_type=notice_type,
-        )
-        for item in response
-    ]
+    return _to_notice_list(response, notice_type)
 
 async def get_new_notices(notice_type: str = None, last_notice_link: str = None):
     """새로운 공지사항을 가져옵니다."""
     params = {"notice_type": notice_type, "last_notice_link": last_notice_link}
     response = await request_to_server("GET", "notices/new", params=params)
-    return [
-        NoticeData(
-            title=item["title"],
-            link=item["link"],
-            published=datetime.fromisoformat(item["published"]),
-            scraper_type=notice_type,
-        )
-        for item in response
-    ]
+    return _to_notice_list(response, notice_type)
+
+async def get_new_notices_batch(
+    last_notice_links: dict[str, str], concurrency: int = 5
+) -> dict[str, list[NoticeData]]:
+    """여러 게시판의 새로운 공지사항을 한 번의 요청으로 가져옵니다.
+
+    last_notice_links는 {collection_name: 마지막 공지 링크} 형태이며,
+    결과는 {collection_name: 새 공지 리스트} 형태입니다.
+    서버가 배치 엔드포인트를 지원하지 않으면 게시판별 요청을 동시에 보내며,
+    이때 실패한 게시판과 배치 응답에 없는 게시판은 결과에서 빠집니다.
+    """
+    if not last_notice_links:
+        return {}
+
+    if _BatchSupport.supported:
+        try:
+            data = {"last_notice_links": last_notice_links}
+            response = await request_to_server("POST", "notices/new/batch", data=data)
+            # 응답에 없는 게시판은 결과에서 빼서 check_notice가 개별로 다시 요청하게 함
+            return {
+                notice_type: _to_notice_list(response[notice_type], notice_type)
+                for notice_type in last_notice_links
+                if notice_type in response
+            }
+        except DataServerResponseError as e:
+            if e.status not in BATCH_UNSUPPORTED_STATUS:
+                raise
+            _BatchSupport.supported = False
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(notice_type: str, last_notice_link: str):
+        async with semaphore:
+            return await get_new_notices(notice_type, last_notice_link)
+
+    notice_types = list(last_notice_links)
+    results = await asyncio.gather(
+        *(fetch(notice_type, last_notice_links[notice_type]) for notice_type in notice_types),
+        return_exceptions=True,
+    )
+    return {
+        notice_type: result
+        for notice_type, result in zip(notice_types, results)
+        if not isinstance(result, BaseException)
+    }
@@ -0,0 +1,36 @@
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """시작 단계별 시작/종료 시각을 기록합니다. (프로세스 시작 기준, 초)
+    동시에 진행되는 단계(로그인과 메타데이터 로딩 등)도 구간이 겹친 그대로 보여줍니다."""
+
+    def __init__(self, started_at: float = None):
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.phases: list[tuple[str, float, float]] = []
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def mark(self, name: str, since: float = None):
+        """since(없으면 직전 단계가 끝난 시각)부터 지금까지를 한 단계로 기록합니다."""
+        if since is None:
+            since = self.phases[-1][2] if self.phases else 0.0
+        self.phases.append((name, since, self.elapsed()))
+
+    @contextmanager
+    def phase(self, name: str):
+        """with 블록의 실행 구간을 한 단계로 기록합니다."""
+        since = self.elapsed()
+        try:
+            yield
+        finally:
+            self.phases.append((name, since, self.elapsed()))
+
+    def report(self) -> str:
+        parts = [
+            f"{name} {start:.2f}→{end:.2f}s ({end - start:.2f}s)"
+            for name, start, end in sorted(self.phases, key=lambda phase: phase[1])
+        ]
+        return ", ".join(parts) + f" | 총 {self.elapsed():.2f}s"
@@ -0,0 +1,51 @@
+import time
+from collections import OrderedDict
+from utils.metrics import CACHE_REQUESTS
+
+
+class SubscriptionCache:
+    """채널/DM 구독 레코드를 채널 ID별로 보관하는 TTL + LRU 캐시.
+
+    레코드가 없다는 사실(None)도 캐싱합니다. invalidate_all()은 세대(generation)를
+    올려 이전 세대에 저장된 항목을 모두 무효화하며, 실제 삭제는 조회 시 이루어집니다.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, channel_type: str, channel_id: str) -> tuple[bool, dict]:
+        """(캐시 적중 여부, 레코드)를 반환합니다."""
+        key = (channel_type, str(channel_id))
+        entry = self._entries.get(key)
+        if entry is not None:
+            record, expires_at, generation = entry
+            if generation == self.generation and expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                CACHE_REQUESTS.inc(("subscription", "hit"))
+                return True, record
+            del self._entries[key]
+
+        self.misses += 1
+        CACHE_REQUESTS.inc(("subscription", "miss"))
+        return False, None
+
+    def put(self, channel_type: str, channel_id: str, record: dict):
+        """레코드를 저장합니다. (레코드가 없으면 None을 저장)"""
+        key = (channel_type, str(channel_id))
+        self._entries[key] = (record, time.monotonic() + self.ttl, self.generation)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, channel_type: str, channel_id: str):
+        self._entries.pop((channel_type, str(channel_id)), None)
+
+    def invalidate_all(self):
+        """세대를 올려 지금까지 저장된 모든 항목을 무효화합니다."""
+        self.generation += 1
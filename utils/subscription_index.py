@@ -0,0 +1,208 @@
+from array import array
+from bisect import bisect_left
+from itertools import compress, repeat
+from operator import and_
+
+DIRECT_MESSAGES = "direct-messages"
+SERVER_CHANNELS = "server-channels"
+
+# 채널 종류 코드 (0은 구독이 없는 빈 자리)
+_TYPE_CODES = {DIRECT_MESSAGES: 1, SERVER_CHANNELS: 2}
+_TYPE_NAMES = {code: name for name, code in _TYPE_CODES.items()}
+
+_PLANE_BITS = 64  # array('Q') 원소 하나에 담는 게시판 수
+
+
+class SubscriptionIndex:
+    """collection_name -> 구독 채널 ID 목록을 메모리에 유지하는 역색인 클래스.
+
+    데이터 서버의 DM/서버 채널 전체 목록으로 한 번에 만들고,
+    구독 추가/삭제나 변경분 동기화 시에는 서버 재조회 없이 부분적으로만 갱신합니다.
+
+    채널 문자열/집합 대신 압축된 형태로 저장합니다.
+    - 게시판 이름은 처음 볼 때 작은 정수(비트 번호)로 바꿔 한 번만 보관
+    - 채널 ID는 array('Q')의 자리(slot)에 정수로 보관하고, 정렬된 사본으로 이진 탐색
+    - 채널의 구독은 비트마스크로 보관 (게시판 64개마다 array('Q') 하나씩)
+    "게시판 X의 구독 채널"은 마스크 배열을 C 수준 반복(compress)으로 훑어 찾고
+    (결과는 그 게시판의 구독이 바뀔 때까지 array('Q')로 보관),
+    "채널 Y의 구독 게시판"은 마스크의 비트를 풀어 얻습니다.
+    """
+
+    def __init__(self):
+        self._reset()
+        self.is_built = False
+
+    def _reset(self):
+        self._bits: dict[str, int] = {}  # 게시판 이름 → 비트 번호
+        self._names: list[str] = []  # 비트 번호 → 게시판 이름
+        self._channel_ids = array("Q")  # slot → 채널 ID
+        self._types = bytearray()  # slot → 채널 종류 코드
+        self._planes: list[array] = []  # 게시판 64개마다 slot → 비트마스크
+        self._sorted_ids = array("Q")  # 채널 ID 오름차순
+        self._sorted_slots = array("L")  # _sorted_ids와 같은 순서의 slot
+        self._members: dict[int, array] = {}  # 비트 번호 → 구독 slot 목록 (조회 결과 보관)
+
+    def rebuild(self, dm_channels: list, server_channels: list):
+        """DM/서버 채널 목록 전체로 색인을 새로 만듭니다."""
+        merged = {}  # 같은 채널이 두 번 나오면 나중 레코드를 사용
+        for channel_type, records in (
+            (DIRECT_MESSAGES, dm_channels),
+            (SERVER_CHANNELS, server_channels),
+        ):
+            for record in records:
+                merged[int(record["_id"])] = (channel_type, record.get("scrapers", []))
+
+        self._reset()
+        channel_ids = sorted(merged)
+        self._channel_ids = array("Q", channel_ids)
+        self._sorted_ids = array("Q", channel_ids)
+        self._sorted_slots = array("L", range(len(channel_ids)))
+        self._types = bytearray(_TYPE_CODES[merged[channel_id][0]] for channel_id in channel_ids)
+
+        masks = []
+        bit_values = {}  # 게시판 이름 → 1 << 비트 번호
+        for channel_id in channel_ids:
+            mask = 0
+            for scraper_name in merged[channel_id][1]:
+                value = bit_values.get(scraper_name)
+                if value is None:
+                    value = bit_values[scraper_name] = 1 << self._bit(scraper_name)
+                mask |= value
+            masks.append(mask)
+        plane_mask = (1 << _PLANE_BITS) - 1
+        self._planes = [
+            array("Q", [(mask >> (plane * _PLANE_BITS)) & plane_mask for mask in masks])
+            for plane in range(self._plane_count())
+        ]
+        self.is_built = True
+
+    def _plane_count(self) -> int:
+        return (len(self._names) + _PLANE_BITS - 1) // _PLANE_BITS
+
+    def _bit(self, scraper_name: str) -> int:
+        """게시판 이름의 비트 번호를 반환합니다. 처음 보는 이름이면 새로 부여합니다."""
+        bit = self._bits.get(scraper_name)
+        if bit is None:
+            bit = len(self._names)
+            self._bits[scraper_name] = bit
+            self._names.append(scraper_name)
+        return bit
+
+    def _ensure_planes(self):
+        """새 게시판 비트를 담을 마스크 배열이 없으면 0으로 채워 추가합니다."""
+        while len(self._planes) < self._plane_count():
+            self._planes.append(array("Q", bytes(8 * len(self._channel_ids))))
+
+    def _slot(self, channel_id, create: bool = False) -> int:
+        """채널 ID의 slot을 찾습니다. 없으면 create일 때 새로 만들고, 아니면 None."""
+        channel_id = int(channel_id)
+        position = bisect_left(self._sorted_ids, channel_id)
+        if position < len(self._sorted_ids) and self._sorted_ids[position] == channel_id:
+            return self._sorted_slots[position]
+        if not create:
+            return None
+
+        slot = len(self._channel_ids)
+        self._channel_ids.append(channel_id)
+        self._types.append(0)
+        for plane in self._planes:
+            plane.append(0)
+        self._sorted_ids.insert(position, channel_id)
+        self._sorted_slots.insert(position, slot)
+        return slot
+
+    def _has_subscriptions(self, slot: int) -> bool:
+        return any(plane[slot] for plane in self._planes)
+
+    def _subscriber_slots(self, scraper_name: str) -> array:
+        """게시판을 구독 중인 slot 목록. 구독이 바뀌기 전까지는 다시 훑지 않습니다."""
+        bit = self._bits.get(scraper_name)
+        if bit is None:
+            return array("L")
+        slots = self._members.get(bit)
+        if slots is None:
+            plane = self._planes[bit // _PLANE_BITS]
+            flags = map(and_, plane, repeat(1 << (bit % _PLANE_BITS)))
+            slots = self._members[bit] = array("L", compress(range(len(plane)), flags))
+        return slots
+
+    def _invalidate_members(self, slot: int, bit: int = None):
+        """slot의 구독이 바뀌기 전에, 영향을 받는 게시판의 보관된 조회 결과를 지웁니다."""
+        if bit is not None:
+            self._members.pop(bit, None)
+            return
+        for bit in self._slot_bits(slot):
+            self._members.pop(bit, None)
+
+    def _slot_bits(self, slot: int) -> list[int]:
+        bits = []
+        for plane_index, plane in enumerate(self._planes):
+            mask = plane[slot]
+            while mask:
+                low = mask & -mask
+                bits.append(plane_index * _PLANE_BITS + low.bit_length() - 1)
+                mask ^= low
+        return bits
+
+    def get_channels(self, scraper_name: str) -> list[str]:
+        """특정 스크래퍼를 구독 중인 채널 ID 목록을 반환합니다."""
+        channel_ids = self._channel_ids
+        return [str(channel_ids[slot]) for slot in self._subscriber_slots(scraper_name)]
+
+    def get_channels_with_types(self, scraper_name: str) -> list[tuple[str, str]]:
+        """특정 스크래퍼를 구독 중인 (채널 ID, 채널 종류) 목록을 반환합니다."""
+        channel_ids, types = self._channel_ids, self._types
+        return [
+            (str(channel_ids[slot]), _TYPE_NAMES[types[slot]])
+            for slot in self._subscriber_slots(scraper_name)
+        ]
+
+    def get_scrapers(self, channel_id: str) -> list[str]:
+        """채널이 구독 중인 스크래퍼 이름 목록을 반환합니다."""
+        slot = self._slot(channel_id)
+        if slot is None:
+            return []
+        return [self._names[bit] for bit in self._slot_bits(slot)]
+
+    def get_channel_type(self, channel_id: str) -> str:
+        """채널 종류(direct-messages / server-channels)를 반환합니다. 모르는 채널이면 None."""
+        slot = self._slot(channel_id)
+        if slot is None:
+            return None
+        return _TYPE_NAMES.get(self._types[slot])
+
+    def add(self, scraper_name: str, channel_id: str, channel_type: str):
+        """채널의 스크래퍼 구독을 색인에 추가합니다."""
+        bit = self._bit(scraper_name)
+        slot = self._slot(channel_id, create=True)
+        self._ensure_planes()
+        self._types[slot] = _TYPE_CODES[channel_type]
+        self._invalidate_members(slot, bit)
+        self._planes[bit // _PLANE_BITS][slot] |= 1 << (bit % _PLANE_BITS)
+
+    def update(self, channel_id: str, channel_type: str, scrapers: list[str]):
+        """채널의 구독 목록 전체를 scrapers로 바꿉니다."""
+        self.remove(channel_id)
+        for scraper_name in scrapers:
+            self.add(scraper_name, channel_id, channel_type)
+
+    def remove(self, channel_id: str):
+        """채널의 모든 구독을 색인에서 제거합니다. (slot은 다시 추가될 때 재사용)"""
+        slot = self._slot(channel_id)
+        if slot is None:
+            return
+        self._invalidate_members(slot)
+        for plane in self._planes:
+            plane[slot] = 0
+        self._types[slot] = 0
+
+    def discard(self, scraper_name: str, channel_id: str):
+        """채널의 스크래퍼 구독을 색인에서 제거합니다."""
+        bit = self._bits.get(scraper_name)
+        slot = self._slot(channel_id)
+        if bit is None or slot is None:
+            return
+        self._invalidate_members(slot, bit)
+        self._planes[bit // _PLANE_BITS][slot] &= ~(1 << (bit % _PLANE_BITS))
+        if not self._has_subscriptions(slot):
+            self._types[slot] = 0
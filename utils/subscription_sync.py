@@ -0,0 +1,150 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from utils.data_server_conect import request_to_server
+from utils.metrics import CACHE_REQUESTS
+from config.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def subscription_checksum(records) -> str:
+    """구독 테이블 내용의 체크섬. 데이터 서버도 같은 방식으로 계산해야 합니다.
+    [[_id, 정렬된 scrapers], ...]를 _id 순으로 정렬해 공백 없는 JSON으로 만든 뒤 sha256."""
+    rows = sorted([str(record["_id"]), sorted(record.get("scrapers", []))] for record in records)
+    payload = json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class SyncResult:
+    """동기화 한 번으로 바뀐 내용"""
+
+    changed: list[dict] = field(default_factory=list)  # 새로 생기거나 바뀐 레코드
+    deleted: list[str] = field(default_factory=list)  # 사라진 레코드 ID
+    full: bool = False  # 전체 목록으로 맞춘 경우
+
+    def __bool__(self):
+        return bool(self.changed or self.deleted)
+
+
+class SubscriptionReplica:
+    """구독 테이블 하나(DM 또는 서버 채널)의 로컬 사본.
+
+    처음과 full_sync_interval마다 전체 목록을 받아 맞추고, 그 사이에는
+    updated_since(마지막으로 본 updated_at) 이후 바뀐 레코드만 받아 반영합니다.
+
+    변경분 응답 형식: {"changes": [레코드...], "deleted": [_id...],
+    "watermark": 다음 요청에 쓸 updated_at(선택), "checksum": 전체 테이블 체크섬(선택)}
+    체크섬이 로컬 사본과 다르면 바로 전체 목록으로 다시 맞춥니다.
+    서버가 updated_since를 무시하고 목록(list)을 주면 변경분 조회를 지원하지 않는 것으로 보고
+    이후에는 전체 목록만 받습니다.
+    """
+
+    def __init__(self, endpoint: str, full_sync_interval: float):
+        self.endpoint = endpoint
+        self.full_sync_interval = full_sync_interval
+        self.records: dict[str, dict] = {}
+        self.watermark: str = None
+        self.delta_supported = True
+        self._synced_at: float = None  # 마지막 전체 동기화 시각
+        self._checksum: str = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._synced_at is not None
+
+    def _full_sync_due(self) -> bool:
+        return (
+            not self.is_loaded
+            or not self.delta_supported
+            or self.watermark is None
+            or time.monotonic() - self._synced_at >= self.full_sync_interval
+        )
+
+    async def sync(self) -> SyncResult:
+        """서버와 맞추고 바뀐 내용을 반환합니다."""
+        if self._full_sync_due():
+            return await self.full_sync()
+
+        response = await request_to_server(
+            "GET", self.endpoint, params={"updated_since": self.watermark}
+        )
+        if isinstance(response, list):
+            logger.info(
+                "%s: 서버가 변경분 조회를 지원하지 않아 전체 목록을 사용합니다.",
+                self.endpoint,
+                extra={"endpoint": self.endpoint},
+            )
+            self.delta_supported = False
+            return self._replace(response)
+
+        result = SyncResult()
+        for record in response.get("changes", []):
+            record_id = str(record["_id"])
+            if self.records.get(record_id) != record:
+                self.records[record_id] = record
+                result.changed.append(record)
+        for record_id in map(str, response.get("deleted", [])):
+            if self.records.pop(record_id, None) is not None:
+                result.deleted.append(record_id)
+        if result:
+            self._checksum = None
+
+        self._advance_watermark(response.get("changes", []), response.get("watermark"))
+        CACHE_REQUESTS.inc(("subscription_replica", "miss" if result else "hit"))
+
+        checksum = response.get("checksum")
+        if checksum and checksum != self.checksum():
+            logger.warning(
+                "%s: 로컬 사본이 서버와 달라 전체 목록으로 다시 맞춥니다.",
+                self.endpoint,
+                extra={"endpoint": self.endpoint},
+            )
+            try:
+                full = await self.full_sync()
+            except Exception:
+                # 다음 동기화는 변경분이 아닌 전체 목록으로 다시 맞춤
+                self.watermark = None
+                raise
+            # 이번 변경분과 다시 맞춘 결과를 모두 반영하도록 전체 동기화로 표시
+            return SyncResult(result.changed + full.changed, result.deleted + full.deleted, True)
+        return result
+
+    async def full_sync(self) -> SyncResult:
+        """전체 목록을 받아 로컬 사본을 맞춥니다."""
+        response = await request_to_server("GET", self.endpoint)
+        return self._replace(response)
+
+    def _replace(self, records: list) -> SyncResult:
+        """전체 목록으로 사본을 교체하고, 이전 사본과 달라진 레코드를 반환합니다."""
+        replaced = {str(record["_id"]): record for record in records}
+        result = SyncResult(full=True)
+        result.changed = [
+            record
+            for record_id, record in replaced.items()
+            if self.records.get(record_id) != record
+        ]
+        result.deleted = [record_id for record_id in self.records if record_id not in replaced]
+
+        self.records = replaced
+        self._checksum = None
+        self._synced_at = time.monotonic()
+        self.watermark = None
+        self._advance_watermark(records, None)
+        return result
+
+    def _advance_watermark(self, records: list, watermark: str):
+        """받은 레코드의 updated_at(ISO 형식 문자열) 중 가장 늦은 값으로 기준을 옮깁니다."""
+        candidates = [record["updated_at"] for record in records if record.get("updated_at")]
+        if watermark:
+            candidates.append(watermark)
+        if self.watermark:
+            candidates.append(self.watermark)
+        self.watermark = max(candidates) if candidates else None
+
+    def checksum(self) -> str:
+        if self._checksum is None:
+            self._checksum = subscription_checksum(self.records.values())
+        return self._checksum